@@ -0,0 +1,47 @@
+"""add blast schedule
+
+Revision ID: a3b4c5d6e7f8
+Revises: e2f3a4b5c6d7
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "a3b4c5d6e7f8"
+down_revision: Union[str, Sequence[str], None] = "e2f3a4b5c6d7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "email_blasts",
+        "status",
+        existing_type=sa.Enum("queued", "sending", "paused", "completed", "failed"),
+        type_=sa.Enum("queued", "scheduled", "sending", "paused", "completed", "failed"),
+        nullable=False,
+    )
+    op.add_column("email_blasts", sa.Column("schedule", sa.JSON(), nullable=True))
+    op.add_column("email_blasts", sa.Column("next_release_at", sa.DateTime(), nullable=True))
+    op.add_column("email_blasts", sa.Column("projected_completion_at", sa.DateTime(), nullable=True))
+    op.create_index("ix_email_blasts_status_next_release_at", "email_blasts", ["status", "next_release_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_email_blasts_status_next_release_at", table_name="email_blasts")
+    op.drop_column("email_blasts", "projected_completion_at")
+    op.drop_column("email_blasts", "next_release_at")
+    op.drop_column("email_blasts", "schedule")
+    op.execute("UPDATE email_blasts SET status = 'paused' WHERE status = 'scheduled'")
+    op.alter_column(
+        "email_blasts",
+        "status",
+        existing_type=sa.Enum("queued", "scheduled", "sending", "paused", "completed", "failed"),
+        type_=sa.Enum("queued", "sending", "paused", "completed", "failed"),
+        nullable=False,
+    )
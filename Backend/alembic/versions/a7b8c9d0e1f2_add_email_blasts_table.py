@@ -0,0 +1,54 @@
+"""add email_blasts table
+
+Revision ID: a7b8c9d0e1f2
+Revises: f2a3b4c5d6e7
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+revision: str = "a7b8c9d0e1f2"
+down_revision: Union[str, Sequence[str], None] = "f2a3b4c5d6e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "email_blasts",
+        sa.Column("id", mysql.INTEGER(unsigned=True), autoincrement=True, nullable=False),
+        sa.Column("subject", sa.String(255, collation="utf8mb4_0900_ai_ci"), nullable=False),
+        sa.Column("html_content", mysql.LONGTEXT(charset="utf8mb4", collation="utf8mb4_0900_ai_ci"), nullable=False),
+        sa.Column("preview_text", sa.String(255, collation="utf8mb4_0900_ai_ci"), nullable=True),
+        sa.Column("attachments", sa.JSON(), nullable=True),
+        sa.Column("order_by", sa.String(20), nullable=False),
+        sa.Column("requested_count", mysql.INTEGER(unsigned=True), nullable=False),
+        sa.Column("recipients", sa.JSON(), nullable=False),
+        sa.Column("guaranteed_emails", sa.JSON(), nullable=True),
+        sa.Column("chunk_size", mysql.INTEGER(unsigned=True), nullable=False),
+        sa.Column("sent_count", mysql.INTEGER(unsigned=True), server_default=sa.text("'0'"), nullable=False),
+        sa.Column("status", sa.Enum("queued", "sending", "paused", "completed", "failed"), nullable=False),
+        sa.Column("last_error", sa.String(500), nullable=True),
+        sa.Column("sent_by", mysql.INTEGER(unsigned=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(
+            ["sent_by"], ["members.id"], ondelete="CASCADE", onupdate="CASCADE", name="fk_email_blasts_sent_by"
+        ),
+    )
+
+    op.create_index("fk_email_blasts_sent_by", "email_blasts", ["sent_by"])
+    op.create_index("ix_email_blasts_status", "email_blasts", ["status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_email_blasts_status", table_name="email_blasts")
+    op.drop_index("fk_email_blasts_sent_by", table_name="email_blasts")
+    op.drop_table("email_blasts")
@@ -0,0 +1,29 @@
+"""add composite submissions indexes for per-form lookups
+
+Revision ID: a9b0c1d2e3f4
+Revises: f8a9b0c1d2e3
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "a9b0c1d2e3f4"
+down_revision: Union[str, Sequence[str], None] = "f8a9b0c1d2e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_submissions_form_id_submission_type", "submissions", ["form_id", "submission_type"])
+    op.create_index(
+        "ix_submissions_form_id_is_accepted_is_invited", "submissions", ["form_id", "is_accepted", "is_invited"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_submissions_form_id_is_accepted_is_invited", table_name="submissions")
+    op.drop_index("ix_submissions_form_id_submission_type", table_name="submissions")
@@ -0,0 +1,53 @@
+"""add certificates table
+
+Revision ID: b4c5d6e7f8a9
+Revises: a3b4c5d6e7f8
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+revision: str = "b4c5d6e7f8a9"
+down_revision: Union[str, Sequence[str], None] = "a3b4c5d6e7f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "certificates",
+        sa.Column("id", mysql.INTEGER(unsigned=True), autoincrement=True, nullable=False),
+        sa.Column("event_id", mysql.INTEGER(unsigned=True), nullable=False),
+        sa.Column("member_id", mysql.INTEGER(unsigned=True), nullable=False),
+        sa.Column("language", sa.String(5), nullable=False),
+        sa.Column("format", sa.String(5), nullable=False),
+        sa.Column("cache_key", mysql.CHAR(64), nullable=False),
+        sa.Column("file_url", sa.String(1024), nullable=False),
+        sa.Column("rendered_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["event_id"], ["events.id"], name="fk_certificates_event", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["member_id"], ["members.id"], name="fk_certificates_member", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_certificates_event_member_variant",
+        "certificates",
+        ["event_id", "member_id", "language", "format"],
+        unique=True,
+    )
+    op.create_index("fk_certificates_member", "certificates", ["member_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("fk_certificates_member", table_name="certificates")
+    op.drop_index("uq_certificates_event_member_variant", table_name="certificates")
+    op.drop_table("certificates")
@@ -0,0 +1,34 @@
+"""add last_activity_at to members
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, Sequence[str], None] = "a7b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("members", sa.Column("last_activity_at", sa.DateTime(), nullable=True))
+    op.execute("""
+        UPDATE members m
+        JOIN (SELECT member_id, MAX(date) AS last_date FROM members_logs GROUP BY member_id) ml
+            ON ml.member_id = m.id
+        SET m.last_activity_at = ml.last_date
+    """)
+    op.create_index("ix_members_last_activity_at", "members", ["last_activity_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_members_last_activity_at", table_name="members")
+    op.drop_column("members", "last_activity_at")
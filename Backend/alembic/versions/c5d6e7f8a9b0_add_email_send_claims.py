@@ -0,0 +1,60 @@
+"""add email_send_claims table
+
+Revision ID: c5d6e7f8a9b0
+Revises: b4c5d6e7f8a9
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+revision: str = "c5d6e7f8a9b0"
+down_revision: Union[str, Sequence[str], None] = "b4c5d6e7f8a9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "email_send_claims",
+        sa.Column("event_id", mysql.INTEGER(unsigned=True), nullable=False),
+        sa.Column("member_id", mysql.INTEGER(unsigned=True), nullable=False),
+        sa.Column(
+            "email_type",
+            sa.Enum("event-certificate", "manual-certificate", "event_announcement", "acceptance", "blast"),
+            nullable=False,
+        ),
+        sa.Column("status", sa.Enum("claimed", "sent"), nullable=False),
+        sa.Column("claim_token", mysql.CHAR(32), nullable=False),
+        sa.Column("claimed_at", sa.DateTime(), nullable=False),
+        sa.Column("email_log_id", mysql.INTEGER(unsigned=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["event_id"], ["events.id"], name="fk_email_send_claims_event", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["member_id"], ["members.id"], name="fk_email_send_claims_member", ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("event_id", "member_id", "email_type"),
+    )
+    op.create_index("fk_email_send_claims_member", "email_send_claims", ["member_id"])
+
+    # certificates sent before claims existed count as sent, so they can't be claimed again
+    op.execute(
+        """
+        INSERT IGNORE INTO email_send_claims (event_id, member_id, email_type, status, claim_token, claimed_at, email_log_id)
+        SELECT event_id, member_id, email_type, 'sent', REPLACE(UUID(), '-', ''), MIN(sent_at), MIN(id)
+        FROM email_logs
+        WHERE email_type = 'event-certificate' AND event_id IS NOT NULL AND member_id IS NOT NULL
+        GROUP BY event_id, member_id, email_type
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("fk_email_send_claims_member", table_name="email_send_claims")
+    op.drop_table("email_send_claims")
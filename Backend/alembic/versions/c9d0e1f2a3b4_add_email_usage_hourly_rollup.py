@@ -0,0 +1,47 @@
+"""add email_usage_hourly rollup
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+revision: str = "c9d0e1f2a3b4"
+down_revision: Union[str, Sequence[str], None] = "b8c9d0e1f2a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "email_usage_hourly",
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("from_address", sa.Enum("info@kerneltics.com", "gdg.qu1@gmail.com"), nullable=False),
+        sa.Column(
+            "email_type",
+            sa.Enum("event-certificate", "manual-certificate", "event_announcement", "acceptance", "blast"),
+            nullable=False,
+        ),
+        sa.Column("recipient_total", mysql.INTEGER(unsigned=True), server_default=sa.text("'0'"), nullable=False),
+        sa.Column("email_count", mysql.INTEGER(unsigned=True), server_default=sa.text("'0'"), nullable=False),
+        sa.PrimaryKeyConstraint("bucket_start", "from_address", "email_type"),
+    )
+    op.execute("""
+        INSERT INTO email_usage_hourly (bucket_start, from_address, email_type, recipient_total, email_count)
+        SELECT DATE(sent_at) + INTERVAL HOUR(sent_at) HOUR, from_address, email_type, SUM(recipient_count), COUNT(*)
+        FROM email_logs
+        GROUP BY DATE(sent_at) + INTERVAL HOUR(sent_at) HOUR, from_address, email_type
+    """)
+    op.create_index("ix_email_logs_sent_at", "email_logs", ["sent_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_email_logs_sent_at", table_name="email_logs")
+    op.drop_table("email_usage_hourly")
@@ -0,0 +1,33 @@
+"""add email_logs keyset indexes
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "d0e1f2a3b4c5"
+down_revision: Union[str, Sequence[str], None] = "c9d0e1f2a3b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_email_logs_sent_at", table_name="email_logs")
+    op.create_index("ix_email_logs_sent_at", "email_logs", ["sent_at", "id"])
+    op.create_index("ix_email_logs_type_sent_at", "email_logs", ["email_type", "sent_at", "id"])
+    op.create_index("ix_email_logs_event_sent_at", "email_logs", ["event_id", "sent_at", "id"])
+    op.create_index("ix_email_logs_member_sent_at", "email_logs", ["member_id", "sent_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_email_logs_member_sent_at", table_name="email_logs")
+    op.drop_index("ix_email_logs_event_sent_at", table_name="email_logs")
+    op.drop_index("ix_email_logs_type_sent_at", table_name="email_logs")
+    op.drop_index("ix_email_logs_sent_at", table_name="email_logs")
+    op.create_index("ix_email_logs_sent_at", "email_logs", ["sent_at"])
@@ -0,0 +1,53 @@
+"""add email_logs_archive table
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+revision: str = "d6e7f8a9b0c1"
+down_revision: Union[str, Sequence[str], None] = "c5d6e7f8a9b0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "email_logs_archive",
+        sa.Column("id", mysql.INTEGER(unsigned=True), autoincrement=False, nullable=False),
+        sa.Column("member_id", mysql.INTEGER(unsigned=True), nullable=True),
+        sa.Column("event_id", mysql.INTEGER(unsigned=True), nullable=True),
+        sa.Column("from_address", sa.Enum("info@kerneltics.com", "gdg.qu1@gmail.com"), nullable=False),
+        sa.Column("sent_at", sa.DateTime(), nullable=False),
+        sa.Column("sent_by", mysql.INTEGER(unsigned=True), nullable=False),
+        sa.Column("recipient_count", mysql.INTEGER(unsigned=True), nullable=False),
+        sa.Column(
+            "email_type",
+            sa.Enum("event-certificate", "manual-certificate", "event_announcement", "acceptance", "blast"),
+            nullable=False,
+        ),
+        sa.Column("data", sa.JSON(), nullable=True),
+        sa.Column("archived_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        mysql_row_format="COMPRESSED",
+    )
+    op.create_index("ix_email_logs_archive_sent_at", "email_logs_archive", ["sent_at", "id"])
+    op.create_index("ix_email_logs_archive_type_sent_at", "email_logs_archive", ["email_type", "sent_at", "id"])
+    op.create_index("ix_email_logs_archive_event_sent_at", "email_logs_archive", ["event_id", "sent_at", "id"])
+    op.create_index("ix_email_logs_archive_member_sent_at", "email_logs_archive", ["member_id", "sent_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_email_logs_archive_member_sent_at", table_name="email_logs_archive")
+    op.drop_index("ix_email_logs_archive_event_sent_at", table_name="email_logs_archive")
+    op.drop_index("ix_email_logs_archive_type_sent_at", table_name="email_logs_archive")
+    op.drop_index("ix_email_logs_archive_sent_at", table_name="email_logs_archive")
+    op.drop_table("email_logs_archive")
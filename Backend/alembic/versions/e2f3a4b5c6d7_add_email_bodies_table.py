@@ -0,0 +1,34 @@
+"""add email_bodies table
+
+Revision ID: e2f3a4b5c6d7
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+revision: str = "e2f3a4b5c6d7"
+down_revision: Union[str, Sequence[str], None] = "d0e1f2a3b4c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "email_bodies",
+        sa.Column("hash", mysql.CHAR(64), nullable=False),
+        sa.Column("body", mysql.LONGBLOB(), nullable=False),
+        sa.Column("size", mysql.INTEGER(unsigned=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+        sa.PrimaryKeyConstraint("hash"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("email_bodies")
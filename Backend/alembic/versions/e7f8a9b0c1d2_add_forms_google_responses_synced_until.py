@@ -0,0 +1,27 @@
+"""add google_responses_synced_until to forms
+
+Revision ID: e7f8a9b0c1d2
+Revises: d6e7f8a9b0c1
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+revision: str = "e7f8a9b0c1d2"
+down_revision: Union[str, Sequence[str], None] = "d6e7f8a9b0c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("forms", sa.Column("google_responses_synced_until", mysql.DATETIME(fsp=6), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("forms", "google_responses_synced_until")
@@ -0,0 +1,56 @@
+"""add generated email_normalized column to members
+
+Revision ID: f8a9b0c1d2e3
+Revises: e7f8a9b0c1d2
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "f8a9b0c1d2e3"
+down_revision: Union[str, Sequence[str], None] = "e7f8a9b0c1d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # emails differing only in case or surrounding spaces would collide on the unique index, and MySQL can't roll
+    # back the column added before it, so refuse before any DDL runs
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT lower(trim(email)) AS email, count(*) AS members FROM members "
+                "WHERE nullif(lower(trim(email)), '') IS NOT NULL "
+                "GROUP BY lower(trim(email)) HAVING count(*) > 1 ORDER BY members DESC LIMIT 10"
+            )
+        )
+        .all()
+    )
+    if duplicates:
+        sample = ", ".join(f"{row.email} ({row.members})" for row in duplicates)
+        raise RuntimeError(
+            "members has emails that only differ in case or surrounding spaces, e.g. "
+            f"{sample}. Fold them with scripts/fold_duplicate_email_members.py, then run this migration again."
+        )
+
+    op.add_column(
+        "members",
+        sa.Column(
+            "email_normalized",
+            sa.String(100),
+            sa.Computed("nullif(lower(trim(`email`)), '')", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index("ix_members_email_normalized", "members", ["email_normalized"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_members_email_normalized", table_name="members")
+    op.drop_column("members", "email_normalized")
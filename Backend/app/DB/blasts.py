@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.config import config
+from app.DB.schema import EmailBlasts, EmailBlastsStatus
+from app.exceptions import BlastNotFound
+
+RESUMABLE_STATUSES = (
+    EmailBlastsStatus.QUEUED,
+    EmailBlastsStatus.SCHEDULED,
+    EmailBlastsStatus.PAUSED,
+    EmailBlastsStatus.FAILED,
+)
+
+
+def create_blast(
+    session: Session,
+    *,
+    subject: str,
+    html_content: str,
+    preview_text: Optional[str],
+    attachments: list[dict],
+    order_by: str,
+    requested_count: int,
+    recipients: list[dict],
+    guaranteed_emails: list[str],
+    chunk_size: int,
+    sent_by: int,
+) -> EmailBlasts:
+    blast = EmailBlasts(
+        subject=subject,
+        html_content=html_content,
+        preview_text=preview_text,
+        attachments=attachments,
+        order_by=order_by,
+        requested_count=requested_count,
+        recipients=recipients,
+        guaranteed_emails=guaranteed_emails,
+        chunk_size=chunk_size,
+        sent_count=0,
+        status=EmailBlastsStatus.QUEUED,
+        sent_by=sent_by,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+    session.add(blast)
+    session.flush()
+    return blast
+
+
+def get_blast_by_id(session: Session, blast_id: int) -> EmailBlasts:
+    blast = session.scalar(select(EmailBlasts).where(EmailBlasts.id == blast_id))
+    if blast is None:
+        raise BlastNotFound(blast_id)
+    return blast
+
+
+def stale_sending_before(now: datetime) -> datetime:
+    """A ``sending`` blast not updated since this instant belongs to a job that died (every chunk bumps
+    ``updated_at``); it may be resumed and claimed again."""
+    return now - timedelta(seconds=config.BLAST_SENDING_STALE_SECONDS)
+
+
+def is_blast_resumable(blast: EmailBlasts, now: datetime) -> bool:
+    if blast.status in RESUMABLE_STATUSES:
+        return True
+    return blast.status == EmailBlastsStatus.SENDING and blast.updated_at < stale_sending_before(now)
+
+
+def claim_blast(session: Session, blast_id: int) -> bool:
+    """Atomically move a blast into ``sending``. Returns False when another job already holds it (or it's done),
+    so two resume clicks can never run the same blast twice. A stale ``sending`` blast is taken over."""
+    now = datetime.now()
+    claimable = or_(
+        EmailBlasts.status.in_(RESUMABLE_STATUSES),
+        and_(EmailBlasts.status == EmailBlastsStatus.SENDING, EmailBlasts.updated_at < stale_sending_before(now)),
+    )
+    result = session.execute(
+        update(EmailBlasts)
+        .where(EmailBlasts.id == blast_id, claimable)
+        .values(status=EmailBlastsStatus.SENDING, last_error=None, updated_at=now)
+    )
+    session.flush()
+    return result.rowcount == 1
+
+
+def record_chunk_sent(session: Session, blast: EmailBlasts, count: int) -> EmailBlasts:
+    blast.sent_count = blast.sent_count + count
+    blast.updated_at = datetime.now()
+    session.flush()
+    return blast
+
+
+def set_blast_status(
+    session: Session, blast: EmailBlasts, status: EmailBlastsStatus, last_error: Optional[str] = None
+) -> EmailBlasts:
+    blast.status = status
+    blast.last_error = last_error[:500] if last_error else None
+    blast.next_release_at = None
+    blast.updated_at = datetime.now()
+    session.flush()
+    return blast
+
+
+def set_blast_plan(
+    session: Session, blast: EmailBlasts, schedule: list[dict], projected_completion_at: Optional[datetime]
+) -> EmailBlasts:
+    blast.schedule = schedule
+    blast.projected_completion_at = projected_completion_at
+    blast.updated_at = datetime.now()
+    session.flush()
+    return blast
+
+
+def schedule_blast(session: Session, blast: EmailBlasts, next_release_at: datetime) -> EmailBlasts:
+    """Park a blast until ``next_release_at``, when the scheduler hands it back to the delivery job."""
+    blast.status = EmailBlastsStatus.SCHEDULED
+    blast.next_release_at = next_release_at
+    blast.last_error = None
+    blast.updated_at = datetime.now()
+    session.flush()
+    return blast
+
+
+def get_due_blast_ids(session: Session, now: datetime) -> list[int]:
+    """Scheduled blasts whose next slice is due, then stale ``sending`` blasts whose job died (e.g. on shutdown)."""
+    stmt = (
+        select(EmailBlasts.id)
+        .where(
+            or_(
+                and_(EmailBlasts.status == EmailBlastsStatus.SCHEDULED, EmailBlasts.next_release_at <= now),
+                and_(
+                    EmailBlasts.status == EmailBlastsStatus.SENDING, EmailBlasts.updated_at < stale_sending_before(now)
+                ),
+            )
+        )
+        .order_by(EmailBlasts.next_release_at, EmailBlasts.updated_at)
+    )
+    return list(session.scalars(stmt).all())
@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.orm import Session
+
+from app.DB.schema import Certificates
+
+
+def upsert_certificate(
+    session: Session, *, event_id: int, member_id: int, language: str, format: str, cache_key: str, file_url: str
+) -> None:
+    stmt = insert(Certificates).values(
+        event_id=event_id,
+        member_id=member_id,
+        language=language,
+        format=format,
+        cache_key=cache_key,
+        file_url=file_url,
+        rendered_at=datetime.now(),
+    )
+    stmt = stmt.on_duplicate_key_update(
+        cache_key=stmt.inserted.cache_key, file_url=stmt.inserted.file_url, rendered_at=stmt.inserted.rendered_at
+    )
+    session.execute(stmt)
+
+
+def get_certificate(
+    session: Session, event_id: int, member_id: int, language: str, format: str
+) -> Optional[Certificates]:
+    stmt = select(Certificates).where(
+        Certificates.event_id == event_id,
+        Certificates.member_id == member_id,
+        Certificates.language == language,
+        Certificates.format == format,
+    )
+    return session.scalar(stmt)
+
+
+def get_certificate_keys_by_event(session: Session, event_id: int, language: str, format: str) -> dict[int, str]:
+    """``member_id -> cache_key`` of every certificate already rendered for the event in this variant."""
+    stmt = select(Certificates.member_id, Certificates.cache_key).where(
+        Certificates.event_id == event_id, Certificates.language == language, Certificates.format == format
+    )
+    return {member_id: cache_key for member_id, cache_key in session.execute(stmt).all()}
+
+
+def get_certificate_urls_by_event(session: Session, event_id: int, language: str, format: str) -> dict[str, str]:
+    """``cache_key -> file_url`` for the event, so a sender can match each recipient's payload to its file."""
+    stmt = select(Certificates.cache_key, Certificates.file_url).where(
+        Certificates.event_id == event_id, Certificates.language == language, Certificates.format == format
+    )
+    return {cache_key: file_url for cache_key, file_url in session.execute(stmt).all()}
+
+
+def count_certificates_by_event(session: Session, event_id: int) -> int:
+    return int(session.scalar(select(func.count(Certificates.id)).where(Certificates.event_id == event_id)) or 0)
@@ -0,0 +1,28 @@
+import hashlib
+import zlib
+
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.orm import Session
+
+from app.DB.schema import EmailBodies
+
+
+def email_body_hash(html_content: str) -> str:
+    return hashlib.sha256(html_content.encode("utf-8")).hexdigest()
+
+
+def store_email_body(session: Session, html_content: str) -> str:
+    """Store ``html_content`` once and return its hash. Storing a body that already exists is a no-op."""
+    body_hash = email_body_hash(html_content)
+    encoded = html_content.encode("utf-8")
+    stmt = insert(EmailBodies).values(hash=body_hash, body=zlib.compress(encoded, 6), size=len(encoded))
+    session.execute(stmt.on_duplicate_key_update(hash=stmt.inserted.hash))
+    return body_hash
+
+
+def get_email_bodies(session: Session, hashes: list[str]) -> dict[str, str]:
+    if not hashes:
+        return {}
+    rows = session.execute(select(EmailBodies.hash, EmailBodies.body).where(EmailBodies.hash.in_(set(hashes)))).all()
+    return {row.hash: zlib.decompress(row.body).decode("utf-8") for row in rows}
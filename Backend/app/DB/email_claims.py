@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, case, delete, select, update
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.orm import Session
+
+from app.config import config
+from app.DB.schema import EmailLogsEmailType, EmailSendClaims, EmailSendClaimsStatus
+
+
+def _claim_key(event_id: int, member_id: int, email_type: EmailLogsEmailType):
+    return (
+        EmailSendClaims.event_id == event_id,
+        EmailSendClaims.member_id == member_id,
+        EmailSendClaims.email_type == email_type,
+    )
+
+
+def claim_email_send(
+    session: Session, *, event_id: int, member_id: int, email_type: EmailLogsEmailType, token: str
+) -> bool:
+    """Claim the right to send ``email_type`` to a member for an event. Returns True when ``token`` now holds the
+    claim: either the row was new, or it was a ``claimed`` row older than the stale timeout (its job died before
+    finishing). Sent rows are never taken over."""
+    now = datetime.now()
+    stale = and_(
+        EmailSendClaims.status == EmailSendClaimsStatus.CLAIMED,
+        EmailSendClaims.claimed_at < now - timedelta(seconds=config.EMAIL_SEND_CLAIM_STALE_SECONDS),
+    )
+    stmt = insert(EmailSendClaims).values(
+        event_id=event_id,
+        member_id=member_id,
+        email_type=email_type,
+        status=EmailSendClaimsStatus.CLAIMED,
+        claim_token=token,
+        claimed_at=now,
+    )
+    # MySQL applies these left to right: the token must be swapped while claimed_at still holds the old value
+    stmt = stmt.on_duplicate_key_update(
+        [
+            ("claim_token", case((stale, stmt.inserted.claim_token), else_=EmailSendClaims.claim_token)),
+            ("claimed_at", case((stale, stmt.inserted.claimed_at), else_=EmailSendClaims.claimed_at)),
+        ]
+    )
+    session.execute(stmt)
+    holder = session.scalar(select(EmailSendClaims.claim_token).where(*_claim_key(event_id, member_id, email_type)))
+    return holder == token
+
+
+def mark_email_sent(
+    session: Session, *, event_id: int, member_id: int, email_type: EmailLogsEmailType, token: str, email_log_id: int
+) -> None:
+    session.execute(
+        update(EmailSendClaims)
+        .where(*_claim_key(event_id, member_id, email_type), EmailSendClaims.claim_token == token)
+        .values(status=EmailSendClaimsStatus.SENT, email_log_id=email_log_id)
+    )
+    session.flush()
+
+
+def release_email_send(
+    session: Session, *, event_id: int, member_id: int, email_type: EmailLogsEmailType, token: str
+) -> None:
+    """Drop an unsent claim held by ``token`` so a later run can retry the recipient."""
+    session.execute(
+        delete(EmailSendClaims).where(
+            *_claim_key(event_id, member_id, email_type),
+            EmailSendClaims.claim_token == token,
+            EmailSendClaims.status == EmailSendClaimsStatus.CLAIMED,
+        )
+    )
+    session.flush()
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from app.DB.schema import EmailTemplates
 from app.exceptions import EmailTemplateNotFound
+from app.template_engine import CompiledEmail, stored_templates
 
 
 def create_template(
@@ -31,6 +32,20 @@ def get_template_by_id(session: Session, template_id: int) -> EmailTemplates:
     return template
 
 
+def get_compiled_template(session: Session, template_id: int) -> CompiledEmail:
+    """Compiled subject and body of a stored template. Only ``updated_at`` is read when the cached compilation is
+    still current; the full row is loaded on a miss."""
+    updated_at = session.scalar(select(EmailTemplates.updated_at).where(EmailTemplates.id == template_id))
+    if updated_at is None:
+        raise EmailTemplateNotFound(template_id)
+
+    def load() -> tuple[str, str]:
+        template = get_template_by_id(session, template_id)
+        return template.subject, template.html_content
+
+    return stored_templates.get_or_compile(template_id, updated_at, load)
+
+
 def update_template(
     session: Session, template_id: int, *, name: str, subject: str, html_content: str, preview_text: Optional[str]
 ) -> EmailTemplates:
@@ -41,6 +56,8 @@ def update_template(
     template.preview_text = preview_text
     template.updated_at = datetime.now()
     session.flush()
+    # updated_at has second precision, so two edits within a second would otherwise share a cache key
+    stored_templates.invalidate(template_id)
     return template
 
 
@@ -48,3 +65,4 @@ def delete_template(session: Session, template_id: int) -> None:
     template = get_template_by_id(session, template_id)
     session.delete(template)
     session.flush()
+    stored_templates.invalidate(template_id)
@@ -1,48 +1,169 @@
 from datetime import datetime, timedelta
 from typing import Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, delete, func, or_, select, union_all
+from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.orm import Session, aliased
 
-from app.DB.schema import EmailLogs, EmailLogsEmailType, EmailLogsFromAddress, Events, Members
-from app.exceptions import EventNotFound, MemberNotFound
+from app.config import config
+from app.DB.schema import (
+    EmailLogs,
+    EmailLogsArchive,
+    EmailLogsEmailType,
+    EmailLogsFromAddress,
+    EmailUsageHourly,
+    Events,
+    Logs,
+    Members,
+    MembersLogs,
+)
+from app.DB.email_bodies import get_email_bodies
+from app.DB.logs import full_attendance_subquery
+from app.exceptions import EmailLogNotFound, EventNotFound, MemberNotFound
+
+# the log columns both tables share, in the order the archive copy is written
+_LOG_COLUMNS = (
+    "id",
+    "member_id",
+    "event_id",
+    "from_address",
+    "sent_at",
+    "sent_by",
+    "recipient_count",
+    "email_type",
+    "data",
+)
+
+
+def archive_horizon() -> datetime:
+    """Rows sent before this may already have moved to ``email_logs_archive``."""
+    return datetime.now() - timedelta(days=config.EMAIL_LOG_RETENTION_DAYS)
+
+
+def _log_tables(since: Optional[datetime]) -> tuple:
+    """The log tables a read reaching back to ``since`` (``None`` = all time) has to look at."""
+    if since is not None and since >= archive_horizon():
+        return (EmailLogs,)
+    return (EmailLogs, EmailLogsArchive)
+
+
+def _usage_since(session: Session, cutoff: datetime, group_by, *filters) -> dict:
+    """Recipient totals since ``cutoff`` grouped by ``group_by`` (a column name shared by ``email_logs`` and
+    ``email_usage_hourly``). Whole hours come from the rollup; only the partial hour at the start of the window is
+    read from ``email_logs``, which keeps the window exact without scanning the log table."""
+    first_full_hour = cutoff.replace(minute=0, second=0, microsecond=0)
+    if first_full_hour < cutoff:
+        first_full_hour += timedelta(hours=1)
+
+    rollup_column = getattr(EmailUsageHourly, group_by)
+    rollup_stmt = (
+        select(rollup_column, func.sum(EmailUsageHourly.recipient_total))
+        .where(EmailUsageHourly.bucket_start >= first_full_hour, *[f(EmailUsageHourly) for f in filters])
+        .group_by(rollup_column)
+    )
+    edge_stmts = [
+        select(getattr(table, group_by), func.sum(table.recipient_count))
+        .where(table.sent_at >= cutoff, table.sent_at < first_full_hour, *[f(table) for f in filters])
+        .group_by(getattr(table, group_by))
+        for table in _log_tables(cutoff)
+    ]
+
+    totals: dict = {}
+    for stmt in (rollup_stmt, *edge_stmts):
+        for key, total in session.execute(stmt).all():
+            totals[key] = totals.get(key, 0) + int(total or 0)
+    return totals
 
 
 def get_email_address_usage(session: Session, days: int, address: EmailLogsFromAddress) -> int:
     from_address = EmailLogsFromAddress(address.value)
     cutoff = datetime.now() - timedelta(days=days)
-    stmt = select(func.coalesce(func.sum(EmailLogs.recipient_count), 0)).where(
-        EmailLogs.from_address == from_address, EmailLogs.sent_at >= cutoff
+    totals = _usage_since(session, cutoff, "from_address", lambda table: table.from_address == from_address)
+    return totals.get(from_address, 0)
+
+
+def get_sends_since(session: Session, cutoff: datetime) -> list[tuple[EmailLogsFromAddress, datetime, int]]:
+    """Every send inside the usage window with its timestamp, so callers can tell when each one ages out of it."""
+    stmt = (
+        select(EmailLogs.from_address, EmailLogs.sent_at, EmailLogs.recipient_count)
+        .where(EmailLogs.sent_at >= cutoff)
+        .order_by(EmailLogs.sent_at)
     )
-    result = session.scalar(stmt)
-    return int(result or 0)
+    return [(row.from_address, row.sent_at, row.recipient_count) for row in session.execute(stmt)]
+
+
+def _certificate_recipient_ids(event_id: int):
+    """Member ids sent ``event_id``'s certificate, from the live and the archived logs -- archiving a send must not
+    make the member eligible for it again."""
+    return union_all(
+        *(
+            select(table.member_id).where(
+                table.event_id == event_id, table.email_type == EmailLogsEmailType.EVENT_CERTIFICATE
+            )
+            for table in (EmailLogs, EmailLogsArchive)
+        )
+    ).subquery()
 
 
 def get_members_who_received_certificate(session: Session, event_id: int):
+    recipients = _certificate_recipient_ids(event_id)
+    stmt = select(Members.id, Members.name, Members.email).join(recipients, recipients.c.member_id == Members.id)
+    return session.execute(stmt).mappings().all()
+
+
+def get_certificate_eligible_members(session: Session, event: Events):
+    """Members who attended every day of ``event`` and haven't been sent its certificate yet, most recently
+    attended first. The already-sent check is an anti-join on ``email_logs`` and its archive so nothing is filtered
+    in Python."""
+    already_sent = [
+        select(table.id)
+        .where(
+            table.event_id == event.id,
+            table.member_id == Members.id,
+            table.email_type == EmailLogsEmailType.EVENT_CERTIFICATE,
+        )
+        .exists()
+        for table in (EmailLogs, EmailLogsArchive)
+    ]
+    full_attendance = full_attendance_subquery(event)
     stmt = (
-        select(Members.id, Members.name, Members.email)
-        .join(EmailLogs, EmailLogs.member_id == Members.id)
-        .where(EmailLogs.event_id == event_id, EmailLogs.email_type == EmailLogsEmailType.EVENT_CERTIFICATE)
+        select(Members.id, Members.name, Members.email, Members.gender)
+        .join(full_attendance, full_attendance.c.member_id == Members.id)
+        .where(*[~sent for sent in already_sent])
+        .order_by(full_attendance.c.last_attended.desc())
     )
     return session.execute(stmt).mappings().all()
 
 
+def count_certificate_recipients(session: Session, event_id: int) -> int:
+    recipients = _certificate_recipient_ids(event_id)
+    stmt = select(func.count(func.distinct(recipients.c.member_id)))
+    return int(session.scalar(stmt) or 0)
+
+
 def get_event_certificate_email_log(session: Session, event_id: int, after_id: int = 0, limit: int = 100):
-    stmt = (
-        select(
-            EmailLogs.id,
-            Members.name.label("member_name"),
-            Members.email.label("member_email"),
-            EmailLogs.sent_at,
-            EmailLogs.from_address,
+    """Newest ``limit`` certificate logs of an event (past ``after_id``), archived ones included."""
+
+    def page(table):
+        stmt = (
+            select(
+                table.id,
+                Members.name.label("member_name"),
+                Members.email.label("member_email"),
+                table.sent_at,
+                table.from_address,
+            )
+            .join(Members, table.member_id == Members.id)
+            .where(table.event_id == event_id, table.email_type == EmailLogsEmailType.EVENT_CERTIFICATE)
+            .order_by(table.sent_at.desc(), table.id.desc())
+            .limit(limit)
         )
-        .join(Members, EmailLogs.member_id == Members.id)
-        .where(EmailLogs.event_id == event_id, EmailLogs.email_type == EmailLogsEmailType.EVENT_CERTIFICATE)
-        .order_by(EmailLogs.sent_at.desc())
-        .limit(limit)
-    )
-    if after_id > 0:
-        stmt = stmt.where(EmailLogs.id > after_id)
+        if after_id > 0:
+            stmt = stmt.where(table.id > after_id)
+        return stmt
+
+    combined = union_all(*(select(page(table).subquery()) for table in _log_tables(None))).subquery()
+    stmt = select(combined).order_by(combined.c.sent_at.desc(), combined.c.id.desc()).limit(limit)
     return session.execute(stmt).mappings().all()
 
 
@@ -69,31 +190,98 @@ def create_email_log(
     )
     session.add(log)
     session.flush()
+    record_email_usage(session, log)
     return log
 
 
+def record_email_usage(session: Session, log: EmailLogs) -> None:
+    """Add ``log`` to its hourly rollup bucket. Runs in the caller's transaction, so the rollup commits or rolls
+    back together with the log row."""
+    stmt = insert(EmailUsageHourly).values(
+        bucket_start=log.sent_at.replace(minute=0, second=0, microsecond=0),
+        from_address=log.from_address,
+        email_type=log.email_type,
+        recipient_total=log.recipient_count,
+        email_count=1,
+    )
+    stmt = stmt.on_duplicate_key_update(
+        recipient_total=EmailUsageHourly.recipient_total + stmt.inserted.recipient_total,
+        email_count=EmailUsageHourly.email_count + 1,
+    )
+    session.execute(stmt)
+
+
+def _log_rows(session: Session, *filters, limit: Optional[int] = None, offset: int = 0):
+    """Log rows matching ``filters`` (each called with the table) newest first, from ``email_logs`` and its archive
+    alike. With a ``limit`` each table contributes only its first ``offset + limit`` rows."""
+
+    def rows(table):
+        stmt = (
+            select(*(getattr(table, name) for name in _LOG_COLUMNS))
+            .where(*(f(table) for f in filters))
+            .order_by(table.sent_at.desc(), table.id.desc())
+        )
+        return stmt if limit is None else stmt.limit(offset + limit)
+
+    combined = union_all(*(select(rows(table).subquery()) for table in _log_tables(None))).subquery()
+    stmt = select(combined).order_by(combined.c.sent_at.desc(), combined.c.id.desc()).offset(offset)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return session.execute(stmt).mappings().all()
+
+
 def get_email_logs(session: Session, limit: int = 100, offset: int = 0):
-    stmt = select(EmailLogs).order_by(EmailLogs.sent_at.desc()).offset(offset).limit(limit)
-    return session.scalars(stmt).all()
+    return _log_rows(session, limit=limit, offset=offset)
+
+
+def get_email_log_sort_key(session: Session, log_id: int) -> Optional[tuple[datetime, int]]:
+    # archived rows keep their ids, so an old SSE event id still resolves after its row moved
+    for table in _log_tables(None):
+        row = session.execute(select(table.sent_at, table.id).where(table.id == log_id)).first()
+        if row is not None:
+            return row.sent_at, row.id
+    return None
 
 
 def get_email_logs_by_event_id(session: Session, event_id: int):
     if not session.scalar(select(Events).where(Events.id == event_id)):
         raise EventNotFound(event_id)
-    stmt = select(EmailLogs).where(EmailLogs.event_id == event_id).order_by(EmailLogs.sent_at.desc())
-    return session.scalars(stmt).all()
+    return _log_rows(session, lambda table: table.event_id == event_id)
 
 
 def get_email_logs_by_member_id(session: Session, member_id: int):
     if not session.scalar(select(Members).where(Members.id == member_id)):
         raise MemberNotFound(member_id)
-    stmt = select(EmailLogs).where(EmailLogs.member_id == member_id).order_by(EmailLogs.sent_at.desc())
-    return session.scalars(stmt).all()
+    return _log_rows(session, lambda table: table.member_id == member_id)
 
 
 Sender = aliased(Members)
 
 
+def _enriched_email_logs_select(table=EmailLogs):
+    return (
+        select(
+            table.id,
+            table.email_type,
+            table.from_address,
+            table.sent_at,
+            table.sent_by,
+            table.recipient_count,
+            table.data,
+            table.member_id,
+            table.event_id,
+            Members.name.label("member_name"),
+            Members.email.label("member_email"),
+            Events.name.label("event_name"),
+            Events.is_official.label("event_is_official"),
+            Sender.name.label("sender_name"),
+        )
+        .outerjoin(Members, table.member_id == Members.id)
+        .outerjoin(Events, table.event_id == Events.id)
+        .outerjoin(Sender, table.sent_by == Sender.id)
+    )
+
+
 def get_enriched_email_logs(
     session: Session,
     *,
@@ -102,57 +290,151 @@ def get_enriched_email_logs(
     member_id: Optional[int] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    after_id: int = 0,
+    after: Optional[tuple[datetime, int]] = None,
     limit: int = 100,
     offset: int = 0,
     order_asc: bool = False,
 ):
-    stmt = (
-        select(
-            EmailLogs.id,
-            EmailLogs.email_type,
-            EmailLogs.from_address,
-            EmailLogs.sent_at,
-            EmailLogs.sent_by,
-            EmailLogs.recipient_count,
-            EmailLogs.data,
-            EmailLogs.member_id,
-            EmailLogs.event_id,
-            Members.name.label("member_name"),
-            Members.email.label("member_email"),
-            Events.name.label("event_name"),
-            Events.is_official.label("event_is_official"),
-            Sender.name.label("sender_name"),
-        )
-        .outerjoin(Members, EmailLogs.member_id == Members.id)
-        .outerjoin(Events, EmailLogs.event_id == Events.id)
-        .outerjoin(Sender, EmailLogs.sent_by == Sender.id)
-        .order_by(EmailLogs.sent_at.asc() if order_asc else EmailLogs.sent_at.desc())
-    )
+    """Logs ordered by the (sent_at, id) keyset. ``after`` is the key of the last row already seen; the page
+    continues strictly past it in the requested direction, so deep pages cost the same as the first one.
+
+    Unless ``start_date`` stays inside the retention window, ``email_logs_archive`` is read too: each table
+    contributes its own first ``offset + limit`` rows through its keyset index and the page is cut from their union,
+    so callers can't tell where a row lives."""
+
+    def page(table):
+        stmt = _enriched_email_logs_select(table)
+        if order_asc:
+            stmt = stmt.order_by(table.sent_at.asc(), table.id.asc())
+        else:
+            stmt = stmt.order_by(table.sent_at.desc(), table.id.desc())
+
+        if email_type is not None:
+            stmt = stmt.where(table.email_type == email_type)
+        if event_id is not None:
+            stmt = stmt.where(table.event_id == event_id)
+        if member_id is not None:
+            stmt = stmt.where(table.member_id == member_id)
+        if start_date is not None:
+            stmt = stmt.where(table.sent_at >= start_date)
+        if end_date is not None:
+            stmt = stmt.where(table.sent_at <= end_date)
+        if after is not None:
+            after_sent_at, after_id = after
+            if order_asc:
+                past_key = or_(table.sent_at > after_sent_at, and_(table.sent_at == after_sent_at, table.id > after_id))
+            else:
+                past_key = or_(table.sent_at < after_sent_at, and_(table.sent_at == after_sent_at, table.id < after_id))
+            stmt = stmt.where(past_key)
+        return stmt
 
-    if email_type is not None:
-        stmt = stmt.where(EmailLogs.email_type == email_type)
-    if event_id is not None:
-        stmt = stmt.where(EmailLogs.event_id == event_id)
-    if member_id is not None:
-        stmt = stmt.where(EmailLogs.member_id == member_id)
-    if start_date is not None:
-        stmt = stmt.where(EmailLogs.sent_at >= start_date)
-    if end_date is not None:
-        stmt = stmt.where(EmailLogs.sent_at <= end_date)
-    if after_id > 0:
-        stmt = stmt.where(EmailLogs.id > after_id)
-
-    stmt = stmt.offset(offset).limit(limit)
+    tables = _log_tables(start_date)
+    if len(tables) == 1:
+        stmt = page(EmailLogs).offset(offset).limit(limit)
+        return session.execute(stmt).mappings().all()
+
+    combined = union_all(*(select(page(table).limit(offset + limit).subquery()) for table in tables)).subquery()
+    if order_asc:
+        order = (combined.c.sent_at.asc(), combined.c.id.asc())
+    else:
+        order = (combined.c.sent_at.desc(), combined.c.id.desc())
+    stmt = select(combined).order_by(*order).offset(offset).limit(limit)
     return session.execute(stmt).mappings().all()
 
 
+def get_enriched_email_log_by_id(session: Session, log_id: int):
+    for table in (EmailLogs, EmailLogsArchive):
+        row = session.execute(_enriched_email_logs_select(table).where(table.id == log_id)).mappings().first()
+        if row is not None:
+            return row
+    raise EmailLogNotFound(log_id)
+
+
+def archive_email_logs(session: Session, cutoff: datetime, batch_size: int) -> int:
+    """Move up to ``batch_size`` of the oldest logs sent before ``cutoff`` into ``email_logs_archive``, keeping their
+    ids. Copy and delete happen in the caller's transaction, so a row is never in both tables or in neither. The
+    hourly usage rollup is left alone. Returns how many rows moved."""
+    ids = session.scalars(
+        select(EmailLogs.id)
+        .where(EmailLogs.sent_at < cutoff)
+        .order_by(EmailLogs.sent_at, EmailLogs.id)
+        .limit(batch_size)
+    ).all()
+    if not ids:
+        return 0
+    columns = [getattr(EmailLogs, name) for name in _LOG_COLUMNS]
+    session.execute(
+        insert(EmailLogsArchive).from_select(list(_LOG_COLUMNS), select(*columns).where(EmailLogs.id.in_(ids)))
+    )
+    session.execute(delete(EmailLogs).where(EmailLogs.id.in_(ids)))
+    session.flush()
+    return len(ids)
+
+
+def count_archivable_email_logs(session: Session, cutoff: datetime) -> int:
+    return int(session.scalar(select(func.count(EmailLogs.id)).where(EmailLogs.sent_at < cutoff)) or 0)
+
+
+def compact_recipients(recipients: list[dict]) -> dict:
+    """Split recipients into ``[member_id, email]`` pairs and the few non-member addresses, for storing in
+    ``EmailLogs.data`` instead of a name/email object per recipient. The address the mail went to is kept, so the
+    log still reads right after a member changes their email or is deleted."""
+    return {
+        "recipient_members": [[r["member_id"], r["email"]] for r in recipients if r.get("member_id") is not None],
+        "external_recipients": [
+            {"name": r.get("name"), "email": r["email"]} for r in recipients if r.get("member_id") is None
+        ],
+    }
+
+
+def hydrate_email_log_data(session: Session, email_type: EmailLogsEmailType, data: Optional[dict]) -> Optional[dict]:
+    """Expand a compact ``EmailLogs.data`` back into the shape the log viewer renders: the HTML body from
+    ``email_bodies`` and recipient name/email pairs, names from ``members``. Logs written before compaction pass
+    through.
+
+    ``recipient_member_ids`` is the earlier compact form that kept no address; a member deleted since shows up as a
+    placeholder with no name or email rather than dropping out of the list."""
+    if not data:
+        return data
+    data = dict(data)
+
+    if "html_hash" in data:
+        data["html_content"] = get_email_bodies(session, [data["html_hash"]]).get(data["html_hash"])
+
+    if "recipient_members" in data or "recipient_member_ids" in data:
+        if "recipient_members" in data:
+            pairs = data["recipient_members"]
+        else:
+            pairs = [[member_id, None] for member_id in data["recipient_member_ids"]]
+        ids = [member_id for member_id, _ in pairs]
+        members = {}
+        if ids:
+            rows = session.execute(select(Members.id, Members.name, Members.email).where(Members.id.in_(ids))).all()
+            members = {row.id: row for row in rows}
+        recipients = []
+        for member_id, sent_email in pairs:
+            member = members.get(member_id)
+            recipients.append(
+                {
+                    "name": member.name if member else None,
+                    "email": sent_email if sent_email is not None else (member.email if member else None),
+                    "member_id": member_id,
+                }
+            )
+        recipients += data.get("external_recipients", [])
+
+        if email_type == EmailLogsEmailType.ACCEPTANCE:
+            data["member"] = recipients
+        else:
+            data["recipients"] = recipients
+        if "guaranteed_emails" in data:
+            guaranteed = {email.lower() for email in data["guaranteed_emails"]}
+            data["guaranteed_recipients"] = [r for r in recipients if (r["email"] or "").lower() in guaranteed]
+
+    return data
+
+
 def get_email_usage_by_type(session: Session, days: int = 1) -> dict[str, int]:
     cutoff = datetime.now() - timedelta(days=days)
-    stmt = (
-        select(EmailLogs.email_type, func.coalesce(func.sum(EmailLogs.recipient_count), 0))
-        .where(EmailLogs.sent_at >= cutoff)
-        .group_by(EmailLogs.email_type)
-    )
-    rows = session.execute(stmt).all()
-    return {row[0].value: row[1] for row in rows}
+    totals = _usage_since(session, cutoff, "email_type")
+    return {email_type.value: total for email_type, total in totals.items()}
@@ -17,6 +17,7 @@ from .schema import (
 from app.routers.models import Events_model
 from app.config import config
 from app.helpers import get_effective_date
+from app.DB.members import refresh_member_last_activity
 from datetime import datetime, timedelta
 
 
@@ -96,8 +97,18 @@ def delete_event(session: Session, event_id: int):
     event = session.scalar(select(Events).where(Events.id == event_id))
     if not event:
         return None
+    # the event's logs and their members_logs rows cascade away; recompute those members' last_activity_at
+    member_ids = list(
+        session.scalars(
+            select(MembersLogs.member_id)
+            .join(Logs, MembersLogs.log_id == Logs.id)
+            .where(Logs.event_id == event_id)
+            .distinct()
+        )
+    )
     session.delete(event)
     session.flush()
+    refresh_member_last_activity(session, member_ids)
     return event
 
 
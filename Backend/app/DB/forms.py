@@ -1,7 +1,9 @@
+from datetime import datetime
+
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import select
-from app.DB.schema import Events, Forms
+from sqlalchemy import func, select, update
+from app.DB.schema import Events, EventsStatus, Forms, FormType
 from app.routers.models import Form_model
 from app.exceptions import EventNotFound, FormNotFound, FormNotFoundById, DataIntegrityError
 
@@ -71,7 +73,37 @@ def get_form_by_event_id(session: Session, event_id: int):
     return form
 
 
+def get_open_google_forms(session: Session):
+    """Google forms of open events that can be synced (they have a form id and a refresh token)"""
+    statement = (
+        select(Forms)
+        .join(Events, Forms.event_id == Events.id)
+        .where(
+            Events.status == EventsStatus.OPEN,
+            Forms.form_type == FormType.GOOGLE,
+            Forms.google_form_id.is_not(None),
+            Forms.google_refresh_token.is_not(None),
+        )
+    )
+    return session.scalars(statement).all()
+
+
 def get_form_by_google_form_id(session: Session, google_form_id: str):
     statement = select(Forms).where(Forms.google_form_id == google_form_id)
     form = session.scalars(statement).first()
     return form
+
+
+def advance_form_sync_cursor(session: Session, form_id: int, synced_until: datetime) -> None:
+    """Move the form's Google responses cursor forward to ``synced_until``; never moves it back, so an older sync
+    finishing late can't undo a newer one."""
+    session.execute(
+        update(Forms)
+        .where(Forms.id == form_id)
+        .values(
+            google_responses_synced_until=func.greatest(
+                func.coalesce(Forms.google_responses_synced_until, synced_until), synced_until
+            )
+        )
+    )
+    session.flush()
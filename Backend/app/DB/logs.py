@@ -8,6 +8,7 @@ from app.routers.models import Member_model, AttendanceRecord_model
 from app.config import config
 from app.helpers import get_effective_date
 from app.exceptions import ActionNotFound
+from app.DB.members import bump_member_last_activity, refresh_member_last_activity
 
 
 def create_department_log(session: Session, department_id: int, log_id: int):
@@ -23,6 +24,7 @@ def create_member_log(session: Session, member_id: int, log_id: int, date: datet
     new_member_log = MembersLogs(member_id=member_id, log_id=log_id, date=date)
     session.add(new_member_log)
     session.flush()
+    bump_member_last_activity(session, member_id, date)
     return new_member_log
 
 
@@ -149,6 +151,37 @@ def get_event_attendance(
     return result
 
 
+def full_attendance_subquery(event: Events, member_id: int | None = None):
+    """``member_id`` and ``last_attended`` of every member (or just ``member_id``) who attended all days of
+    ``event``, as a subquery to join or test against. The one definition of "full attendance" for certificates."""
+    event_days = (event.end_datetime - event.start_datetime).days + 1
+    stmt = (
+        select(MembersLogs.member_id, func.max(MembersLogs.date).label("last_attended"))
+        .join(Logs, Logs.id == MembersLogs.log_id)
+        .where(Logs.event_id == event.id)
+        .group_by(MembersLogs.member_id)
+        .having(func.count(MembersLogs.id) == event_days)
+    )
+    if member_id is not None:
+        stmt = stmt.where(MembersLogs.member_id == member_id)
+    return stmt.subquery()
+
+
+def has_attended_all_days(session: Session, event: Events, member_id: int) -> bool:
+    """Single-member version of ``get_event_attendance(..., "exclusive_all")``."""
+    full_attendance = full_attendance_subquery(event, member_id)
+    return bool(session.scalar(select(select(full_attendance.c.member_id).exists())))
+
+
+def get_full_attendance_members(session: Session, event: Events):
+    """Id, name, email and gender of every member who attended all days of ``event``."""
+    full_attendance = full_attendance_subquery(event)
+    stmt = select(Members.id, Members.name, Members.email, Members.gender).join(
+        full_attendance, full_attendance.c.member_id == Members.id
+    )
+    return session.execute(stmt).mappings().all()
+
+
 def delete_n_department_logs(session: Session, log_id: int, count: int):
     stmt = select(DepartmentsLogs).where(DepartmentsLogs.log_id == log_id).limit(count)
     department_logs = session.scalars(stmt).all()
@@ -311,6 +344,7 @@ def delete_member_logs_by_log_id(session: Session, log_id: int):
     for ml in member_logs:
         session.delete(ml)
     session.flush()
+    refresh_member_last_activity(session, list({ml.member_id for ml in member_logs}))
     return len(member_logs)
 
 
@@ -324,6 +358,7 @@ def delete_member_log(session: Session, member_id: int, log_id: int, target_date
         if log_effective == target_effective:
             session.delete(ml)
             session.flush()
+            refresh_member_last_activity(session, [member_id])
             return True
     return False
 
@@ -333,6 +368,9 @@ def delete_log(session: Session, log_id: int):
     log = session.scalar(stmt)
     if not log:
         return False
+    # members_logs rows go with the log (ON DELETE CASCADE), so their members' last_activity_at must be recomputed
+    member_ids = list(session.scalars(select(MembersLogs.member_id).where(MembersLogs.log_id == log_id).distinct()))
     session.delete(log)
     session.flush()
+    refresh_member_last_activity(session, member_ids)
     return True
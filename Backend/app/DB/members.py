@@ -1,6 +1,6 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import select, func
+from sqlalchemy import select, func, or_, update
 from app.DB.schema import Actions, Members, MembersLogs, Logs, Events, Role, RoleType
 from app.exceptions import MemberNotFound
 from app.routers.models import Member_model
@@ -84,18 +84,32 @@ def get_member_by_uni_id_or_none(session: Session, uni_id: str) -> Members | Non
     return session.scalars(statement).first()
 
 
+def normalize_email(email: str) -> str:
+    """The form ``members.email_normalized`` stores, for lookups that can use its unique index."""
+    return email.strip().lower()
+
+
 def get_member_by_email_or_none(session: Session, email: str) -> Members | None:
-    statement = select(Members).where(func.lower(Members.email) == email.strip().lower())
+    statement = select(Members).where(Members.email_normalized == normalize_email(email))
     return session.scalars(statement).first()
 
 
+def get_member_ids_by_emails(session: Session, emails: list[str]) -> dict[str, int]:
+    """Map each of ``emails`` (normalized) that belongs to a member to that member's id, in one query."""
+    normalized = {normalize_email(email) for email in emails}
+    if not normalized:
+        return {}
+    statement = select(Members.email_normalized, Members.id).where(Members.email_normalized.in_(normalized))
+    return dict(session.execute(statement).all())
+
+
 def get_unclaimed_member_by_email_or_none(session: Session, email: str) -> Members | None:
     """Find an admin-created member (no Clerk identity attached yet) by email.
 
     Used by ``create_member_if_not_exists`` to automatically fold an admin-created
     shadow row into a new signup's Clerk identity when the email matches."""
     statement = select(Members).where(
-        func.lower(Members.email) == email.strip().lower(),
+        Members.email_normalized == normalize_email(email),
         Members.clerk_user_id.is_(None),
         Members.is_authenticated == 0,
     )
@@ -228,18 +242,42 @@ def _apply_member_updates(session: Session, member: Members, updates: dict) -> M
     return member
 
 
+def bump_member_last_activity(session: Session, member_id: int, activity_at: datetime):
+    """Move ``last_activity_at`` forward to ``activity_at`` (never backwards, so backfilled attendance for an old
+    day doesn't hide newer activity)."""
+    session.execute(
+        update(Members)
+        .where(Members.id == member_id, or_(Members.last_activity_at.is_(None), Members.last_activity_at < activity_at))
+        .values(last_activity_at=activity_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def refresh_member_last_activity(session: Session, member_ids: list[int]):
+    """Recompute ``last_activity_at`` from ``members_logs`` after logs were removed."""
+    if not member_ids:
+        return
+    latest = select(func.max(MembersLogs.date)).where(MembersLogs.member_id == Members.id).scalar_subquery()
+    session.execute(
+        update(Members)
+        .where(Members.id.in_(member_ids))
+        .values(last_activity_at=latest)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def get_blast_eligible_count(session: Session) -> int:
-    stmt = select(func.count()).select_from(Members).where(Members.email.isnot(None), Members.email != "")
+    # `email > ''` excludes both NULL and empty emails and is a range scan on ix_members_email
+    stmt = select(func.count()).select_from(Members).where(Members.email > "")
     return int(session.scalar(stmt) or 0)
 
 
 def get_blast_recipients_by_activity(session: Session, limit: int, exclude_ids: list[int]):
+    # walks ix_members_last_activity_at backwards; members with no activity (NULL) sort last, as MAX() did before
     stmt = (
         select(Members)
-        .outerjoin(MembersLogs, MembersLogs.member_id == Members.id)
-        .where(Members.email.isnot(None), Members.email != "")
-        .group_by(Members.id)
-        .order_by(func.max(MembersLogs.date).desc())
+        .where(Members.email > "")
+        .order_by(Members.last_activity_at.desc(), Members.id.desc())
         .limit(limit)
     )
     if exclude_ids:
@@ -1,14 +1,8 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 
-def get_members_points_semester(session: Session, start_date: str, end_date: str, member_id: int | None = None):
-    params: dict = {"start_date": start_date, "end_date": end_date}
-    if member_id:
-        params["member_id"] = member_id
-
-    query = (
-        """
+_MEMBER_POINTS_SQL = """
         SELECT
             m.id AS member_id,
             m.name AS member_name,
@@ -26,7 +20,16 @@ def get_members_points_semester(session: Session, start_date: str, end_date: str
             FROM modifications mo
             GROUP BY mo.log_id
         ) mods ON mods.log_id = l.id
-    """
+"""
+
+
+def get_members_points_semester(session: Session, start_date: str, end_date: str, member_id: int | None = None):
+    params: dict = {"start_date": start_date, "end_date": end_date}
+    if member_id:
+        params["member_id"] = member_id
+
+    query = (
+        _MEMBER_POINTS_SQL
         + ("WHERE m.id = :member_id\n    " if member_id else "")
         + """GROUP BY m.id, m.name
         ORDER BY total_points DESC
@@ -40,6 +43,42 @@ def get_members_points_semester(session: Session, start_date: str, end_date: str
     return [dict(row._mapping) for row in result]
 
 
+def get_members_email_stats(
+    session: Session, member_ids: list[int], event_id: int, start_date: str, end_date: str
+) -> dict[int, dict]:
+    """Semester points, leaderboard rank and days attended at ``event_id`` for every member in ``member_ids``, in one
+    round trip. Rank is computed over all members so it matches the leaderboard."""
+    if not member_ids:
+        return {}
+    statement = text(
+        "WITH member_points AS ("
+        + _MEMBER_POINTS_SQL
+        + """GROUP BY m.id, m.name
+        ),
+        ranked AS (
+            SELECT member_id, total_points, RANK() OVER (ORDER BY total_points DESC) AS member_rank
+            FROM member_points
+        ),
+        attendance AS (
+            SELECT ml.member_id AS member_id, COUNT(ml.id) AS attendance_days
+            FROM members_logs ml
+            JOIN logs l ON l.id = ml.log_id
+            WHERE l.event_id = :event_id AND ml.member_id IN :member_ids
+            GROUP BY ml.member_id
+        )
+        SELECT r.member_id, r.total_points, r.member_rank, COALESCE(att.attendance_days, 0) AS attendance_days
+        FROM ranked r
+        LEFT JOIN attendance att ON att.member_id = r.member_id
+        WHERE r.member_id IN :member_ids
+    """
+    ).bindparams(bindparam("member_ids", expanding=True))
+    result = session.execute(
+        statement,
+        {"start_date": start_date, "end_date": end_date, "event_id": event_id, "member_ids": list(member_ids)},
+    )
+    return {row.member_id: dict(row._mapping) for row in result}
+
+
 def get_member_points_history_semester(session: Session, member_id: int, start_date: str, end_date: str):
     statement = text("""
         WITH log_modifications AS (
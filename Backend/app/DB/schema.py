@@ -2,8 +2,21 @@ from typing import Optional
 import datetime
 import enum
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKeyConstraint, Index, Integer, JSON, String, Table, Text, text
-from sqlalchemy.dialects.mysql import INTEGER, LONGTEXT, TEXT, TINYINT, VARCHAR
+from sqlalchemy import (
+    Column,
+    Computed,
+    DateTime,
+    Enum,
+    ForeignKeyConstraint,
+    Index,
+    Integer,
+    JSON,
+    String,
+    Table,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.mysql import CHAR, DATETIME, INTEGER, LONGBLOB, LONGTEXT, TEXT, TINYINT, VARCHAR
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -144,6 +157,20 @@ class EmailLogsEmailType(str, enum.Enum):
     BLAST = "blast"
 
 
+class EmailSendClaimsStatus(str, enum.Enum):
+    CLAIMED = "claimed"
+    SENT = "sent"
+
+
+class EmailBlastsStatus(str, enum.Enum):
+    QUEUED = "queued"
+    SCHEDULED = "scheduled"
+    SENDING = "sending"
+    PAUSED = "paused"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class OpenEventsStatus(str, enum.Enum):
     DRAFT = "draft"
     OPEN = "open"
@@ -228,6 +255,8 @@ class Members(Base):
         Index("uni_id", "uni_id", unique=True),
         Index("ix_members_clerk_user_id", "clerk_user_id", unique=True),
         Index("ix_members_email", "email", unique=True),
+        Index("ix_members_email_normalized", "email_normalized", unique=True),
+        Index("ix_members_last_activity_at", "last_activity_at", "id"),
     )
 
     id: Mapped[int] = mapped_column(INTEGER(unsigned=True), primary_key=True)
@@ -249,7 +278,13 @@ class Members(Base):
     )
     is_authenticated: Mapped[int] = mapped_column(TINYINT(1), nullable=False, server_default=text("'0'"))
     email: Mapped[Optional[str]] = mapped_column(String(100))
+    # lookup key for email matching: trimmed and lowercased by MySQL, NULL for a missing or blank email
+    email_normalized: Mapped[Optional[str]] = mapped_column(
+        String(100), Computed("nullif(lower(trim(`email`)), '')", persisted=True)
+    )
     phone_number: Mapped[Optional[str]] = mapped_column(String(20))
+    # denormalized MAX(members_logs.date), maintained by the members_logs write paths in DB/logs.py
+    last_activity_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime)
 
     role: Mapped[list["Role"]] = relationship("Role", back_populates="member", passive_deletes=True)
     profile: Mapped[Optional["MemberProfiles"]] = relationship(
@@ -286,6 +321,8 @@ class Forms(Base):
     google_responders_url: Mapped[Optional[str]] = mapped_column(
         VARCHAR(150, charset="utf8mb4", collation="utf8mb4_0900_ai_ci")
     )
+    # newest lastSubmittedTime (UTC) among the Google responses already synced; NULL until the first sync
+    google_responses_synced_until: Mapped[Optional[datetime.datetime]] = mapped_column(DATETIME(fsp=6))
 
     event: Mapped["Events"] = relationship("Events", back_populates="forms")
     submissions: Mapped[list["Submissions"]] = relationship("Submissions", back_populates="form", passive_deletes=True)
@@ -455,6 +492,8 @@ class Submissions(Base):
         ),
         Index("from_id_member_id_idx", "form_id", "member_id"),
         Index("submissions_unique", "member_id", "form_id", unique=True),
+        Index("ix_submissions_form_id_submission_type", "form_id", "submission_type"),
+        Index("ix_submissions_form_id_is_accepted_is_invited", "form_id", "is_accepted", "is_invited"),
     )
 
     id: Mapped[int] = mapped_column(INTEGER(unsigned=True), primary_key=True)
@@ -490,6 +529,11 @@ class EmailLogs(Base):
         Index("fk_email_logs_member", "member_id"),
         Index("fk_email_logs_event", "event_id"),
         Index("fk_email_logs_sent_by", "sent_by"),
+        # keyset pagination orders by (sent_at, id); one index per filter the log viewer offers
+        Index("ix_email_logs_sent_at", "sent_at", "id"),
+        Index("ix_email_logs_type_sent_at", "email_type", "sent_at", "id"),
+        Index("ix_email_logs_event_sent_at", "event_id", "sent_at", "id"),
+        Index("ix_email_logs_member_sent_at", "member_id", "sent_at", "id"),
     )
 
     id: Mapped[int] = mapped_column(INTEGER(unsigned=True), primary_key=True)
@@ -513,6 +557,126 @@ class EmailLogs(Base):
     sender: Mapped["Members"] = relationship("Members", foreign_keys=[sent_by], passive_deletes=True)
 
 
+class EmailLogsArchive(Base):
+    """``email_logs`` rows older than the retention window, moved here with their original ids by
+    ``scripts/archive_email_logs.py``. No foreign keys, so deleting a member or event doesn't have to touch the
+    archive; the log viewer's outer joins already cope with a missing member or event."""
+
+    __tablename__ = "email_logs_archive"
+    __table_args__ = (
+        Index("ix_email_logs_archive_sent_at", "sent_at", "id"),
+        Index("ix_email_logs_archive_type_sent_at", "email_type", "sent_at", "id"),
+        Index("ix_email_logs_archive_event_sent_at", "event_id", "sent_at", "id"),
+        Index("ix_email_logs_archive_member_sent_at", "member_id", "sent_at", "id"),
+        {"mysql_row_format": "COMPRESSED"},
+    )
+
+    id: Mapped[int] = mapped_column(INTEGER(unsigned=True), primary_key=True, autoincrement=False)
+    member_id: Mapped[Optional[int]] = mapped_column(INTEGER(unsigned=True))
+    event_id: Mapped[Optional[int]] = mapped_column(INTEGER(unsigned=True))
+    from_address: Mapped[EmailLogsFromAddress] = mapped_column(
+        Enum(EmailLogsFromAddress, values_callable=lambda cls: [member.value for member in cls]), nullable=False
+    )
+    sent_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=False)
+    sent_by: Mapped[int] = mapped_column(INTEGER(unsigned=True), nullable=False)
+    recipient_count: Mapped[int] = mapped_column(INTEGER(unsigned=True), nullable=False)
+    email_type: Mapped[EmailLogsEmailType] = mapped_column(
+        Enum(EmailLogsEmailType, values_callable=lambda cls: [member.value for member in cls]), nullable=False
+    )
+    data: Mapped[Optional[dict]] = mapped_column(JSON)
+    archived_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP")
+    )
+
+
+class EmailSendClaims(Base):
+    """One row per (event, member, email type) that may only be sent once. A job inserts its claim before calling
+    the email API, so the primary key -- not a check done in Python -- decides which of two concurrent jobs sends.
+    ``claimed`` rows left behind by a crashed job can be taken over once they're older than the stale timeout."""
+
+    __tablename__ = "email_send_claims"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["event_id"], ["events.id"], ondelete="CASCADE", onupdate="CASCADE", name="fk_email_send_claims_event"
+        ),
+        ForeignKeyConstraint(
+            ["member_id"], ["members.id"], ondelete="CASCADE", onupdate="CASCADE", name="fk_email_send_claims_member"
+        ),
+        Index("fk_email_send_claims_member", "member_id"),
+    )
+
+    event_id: Mapped[int] = mapped_column(INTEGER(unsigned=True), primary_key=True)
+    member_id: Mapped[int] = mapped_column(INTEGER(unsigned=True), primary_key=True)
+    email_type: Mapped[EmailLogsEmailType] = mapped_column(
+        Enum(EmailLogsEmailType, values_callable=lambda cls: [member.value for member in cls]), primary_key=True
+    )
+    status: Mapped[EmailSendClaimsStatus] = mapped_column(
+        Enum(EmailSendClaimsStatus, values_callable=lambda cls: [member.value for member in cls]), nullable=False
+    )
+    claim_token: Mapped[str] = mapped_column(CHAR(32), nullable=False)
+    claimed_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=False)
+    email_log_id: Mapped[Optional[int]] = mapped_column(INTEGER(unsigned=True))
+
+
+class EmailBodies(Base):
+    """Deduplicated email HTML addressed by the sha256 of the uncompressed body. Logs keep only the hash, so a body
+    sent to hundreds of recipients (or across many blast chunks) is stored once."""
+
+    __tablename__ = "email_bodies"
+
+    hash: Mapped[str] = mapped_column(CHAR(64), primary_key=True)
+    body: Mapped[bytes] = mapped_column(LONGBLOB, nullable=False)  # zlib-compressed utf-8
+    size: Mapped[int] = mapped_column(INTEGER(unsigned=True), nullable=False)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP")
+    )
+
+
+class Certificates(Base):
+    """Pre-rendered certificate files. ``cache_key`` is the hash of the generation payload, so a row whose event or
+    member details changed since rendering no longer matches and is rendered again."""
+
+    __tablename__ = "certificates"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["event_id"], ["events.id"], ondelete="CASCADE", onupdate="CASCADE", name="fk_certificates_event"
+        ),
+        ForeignKeyConstraint(
+            ["member_id"], ["members.id"], ondelete="CASCADE", onupdate="CASCADE", name="fk_certificates_member"
+        ),
+        Index("uq_certificates_event_member_variant", "event_id", "member_id", "language", "format", unique=True),
+        Index("fk_certificates_member", "member_id"),
+    )
+
+    id: Mapped[int] = mapped_column(INTEGER(unsigned=True), primary_key=True)
+    event_id: Mapped[int] = mapped_column(INTEGER(unsigned=True), nullable=False)
+    member_id: Mapped[int] = mapped_column(INTEGER(unsigned=True), nullable=False)
+    language: Mapped[str] = mapped_column(String(5), nullable=False)
+    format: Mapped[str] = mapped_column(String(5), nullable=False)
+    cache_key: Mapped[str] = mapped_column(CHAR(64), nullable=False)
+    file_url: Mapped[str] = mapped_column(String(1024), nullable=False)
+    rendered_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP")
+    )
+
+
+class EmailUsageHourly(Base):
+    """Recipients sent per address, email type and hour. Kept in step with ``email_logs`` by ``create_email_log`` so
+    usage windows of any length are a handful of rows instead of a scan of the log table."""
+
+    __tablename__ = "email_usage_hourly"
+
+    bucket_start: Mapped[datetime.datetime] = mapped_column(DateTime, primary_key=True)
+    from_address: Mapped[EmailLogsFromAddress] = mapped_column(
+        Enum(EmailLogsFromAddress, values_callable=lambda cls: [member.value for member in cls]), primary_key=True
+    )
+    email_type: Mapped[EmailLogsEmailType] = mapped_column(
+        Enum(EmailLogsEmailType, values_callable=lambda cls: [member.value for member in cls]), primary_key=True
+    )
+    recipient_total: Mapped[int] = mapped_column(INTEGER(unsigned=True), nullable=False, server_default=text("'0'"))
+    email_count: Mapped[int] = mapped_column(INTEGER(unsigned=True), nullable=False, server_default=text("'0'"))
+
+
 class EmailTemplates(Base):
     __tablename__ = "email_templates"
     __table_args__ = (
@@ -543,6 +707,56 @@ class EmailTemplates(Base):
     creator: Mapped["Members"] = relationship("Members", foreign_keys=[created_by], passive_deletes=True)
 
 
+class EmailBlasts(Base):
+    """A blast campaign and its delivery cursor. Recipients are sent in chunks starting at ``sent_count``, so a
+    paused or failed blast can be resumed without re-sending to anyone already covered by a chunk log.
+
+    Blasts larger than the remaining send capacity are ``scheduled``: ``schedule`` holds the planned per-address
+    slices and ``next_release_at`` is when the scheduler picks the blast up again."""
+
+    __tablename__ = "email_blasts"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["sent_by"], ["members.id"], ondelete="CASCADE", onupdate="CASCADE", name="fk_email_blasts_sent_by"
+        ),
+        Index("fk_email_blasts_sent_by", "sent_by"),
+        Index("ix_email_blasts_status", "status"),
+        Index("ix_email_blasts_status_next_release_at", "status", "next_release_at"),
+    )
+
+    id: Mapped[int] = mapped_column(INTEGER(unsigned=True), primary_key=True)
+    subject: Mapped[str] = mapped_column(
+        VARCHAR(255, charset="utf8mb4", collation="utf8mb4_0900_ai_ci"), nullable=False
+    )
+    html_content: Mapped[str] = mapped_column(
+        LONGTEXT(charset="utf8mb4", collation="utf8mb4_0900_ai_ci"), nullable=False
+    )
+    preview_text: Mapped[Optional[str]] = mapped_column(VARCHAR(255, charset="utf8mb4", collation="utf8mb4_0900_ai_ci"))
+    attachments: Mapped[Optional[list]] = mapped_column(JSON)
+    order_by: Mapped[str] = mapped_column(String(20), nullable=False)
+    requested_count: Mapped[int] = mapped_column(INTEGER(unsigned=True), nullable=False)
+    recipients: Mapped[list] = mapped_column(JSON, nullable=False)
+    guaranteed_emails: Mapped[Optional[list]] = mapped_column(JSON)
+    chunk_size: Mapped[int] = mapped_column(INTEGER(unsigned=True), nullable=False)
+    sent_count: Mapped[int] = mapped_column(INTEGER(unsigned=True), nullable=False, server_default=text("'0'"))
+    status: Mapped[EmailBlastsStatus] = mapped_column(
+        Enum(EmailBlastsStatus, values_callable=lambda cls: [member.value for member in cls]), nullable=False
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(String(500))
+    schedule: Mapped[Optional[list]] = mapped_column(JSON)
+    next_release_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime)
+    projected_completion_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime)
+    sent_by: Mapped[int] = mapped_column(INTEGER(unsigned=True), nullable=False)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP")
+    )
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP")
+    )
+
+    sender: Mapped["Members"] = relationship("Members", foreign_keys=[sent_by], passive_deletes=True)
+
+
 # =============================================================================
 # Views (read-only, defined in DB migrations)
 # =============================================================================
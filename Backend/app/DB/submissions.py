@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import Sequence
+from contextlib import contextmanager
+from typing import Iterator, Sequence
 
 from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from sqlalchemy import select
-from .schema import Submissions, t_forms_submissions
+from sqlalchemy import JSON, bindparam, func, insert, select, text, update
+from .main import engine
+from .schema import Forms, Members, Submissions
 
 
 def create_submission(session: Session, form_id: int, submission_type: str, member_id: int):
@@ -29,91 +31,240 @@ def get_submission_by_form_and_member(session: Session, form_id: int, member_id:
 
 
 # ====================== Google Sync Functions ======================
-def create_google_submission(
-    session: Session,
-    *,
-    form_id: int,
-    member_id: int,
-    google_submission_id: str | None,
-    google_submission_value: dict | None,
-):
-    exists = session.execute(
-        select(Submissions).where(Submissions.form_id == form_id, Submissions.member_id == member_id)
-    ).first()
-    if exists:
-        return None
+def get_submitted_member_ids(session: Session, form_id: int, member_ids: list[int]) -> set[int]:
+    """The subset of ``member_ids`` that already have a submission for ``form_id``."""
+    if not member_ids:
+        return set()
+    statement = select(Submissions.member_id).where(
+        Submissions.form_id == form_id, Submissions.member_id.in_(member_ids)
+    )
+    return set(session.scalars(statement).all())
 
-    submission = Submissions(
-        form_id=form_id,
-        member_id=member_id,
-        is_accepted=0,
-        submission_type="google",
-        google_submission_id=google_submission_id,
-        google_submission_value=google_submission_value,
+
+def create_google_submissions(session: Session, form_id: int, responses: dict[int, tuple[str, dict]]) -> int:
+    """Insert a google submission per ``member_id -> (google_submission_id, answers)`` in one executemany.
+    ``INSERT IGNORE`` skips members that got a submission since the caller checked. Returns how many were inserted."""
+    if not responses:
+        return 0
+    result = session.execute(
+        insert(Submissions.__table__).prefix_with("IGNORE"),
+        [
+            {
+                "form_id": form_id,
+                "member_id": member_id,
+                "is_accepted": 0,
+                "submission_type": "google",
+                "google_submission_id": response_id,
+                "google_submission_value": answers,
+            }
+            for member_id, (response_id, answers) in responses.items()
+        ],
     )
-    session.add(submission)
     session.flush()
-    return submission
+    return result.rowcount
 
 
-def update_google_submission(
-    session: Session,
-    submission_id: int,
-    submission_type: str = None,
-    google_submission_id: str = None,
-    google_submission_value: str = None,
-):
-    submission = session.execute(select(Submissions).where(Submissions.id == submission_id)).scalar_one_or_none()
+def complete_partial_submissions(session: Session, responses: dict[int, tuple[str, dict]]) -> int:
+    """Turn partial submissions into google ones from ``submission_id -> (google_submission_id, answers)`` with a
+    single executemany UPDATE. Rows that stopped being partial since they were read are left alone. Returns how many
+    were updated."""
+    if not responses:
+        return 0
+    statement = (
+        update(Submissions.__table__)
+        .where(Submissions.id == bindparam("b_id"), Submissions.submission_type == "partial")
+        .values(
+            submission_type="google",
+            google_submission_id=bindparam("b_response_id"),
+            google_submission_value=bindparam("b_answers", type_=Submissions.google_submission_value.type),
+        )
+    )
+    result = session.execute(
+        statement,
+        [
+            {"b_id": submission_id, "b_response_id": response_id, "b_answers": answers}
+            for submission_id, (response_id, answers) in responses.items()
+        ],
+    )
+    session.flush()
+    return result.rowcount
 
-    if not submission:
-        return None
 
-    submission.submission_type = submission_type
-    submission.google_submission_id = google_submission_id
-    submission.google_submission_value = google_submission_value
+# ====================== submissions 'view' functions ======================
+# These read the base tables rather than the forms_submissions view: MySQL can't always merge the view, and then it
+# joins every submission before filtering on form/event. Forms are looked up by their unique event_id and submissions
+# through the (form_id, ...) indexes. Rows keep the view's column names. scripts/benchmark_submission_queries.py
+# compares both.
+def _forms_submissions_columns():
+    return (
+        Submissions.id.label("submission_id"),
+        Submissions.submitted_at,
+        Forms.form_type,
+        Submissions.submission_type,
+        Members.id,
+        Members.name,
+        Members.email,
+        Members.phone_number,
+        Members.uni_id,
+        Members.gender,
+        Members.uni_level,
+        Members.uni_college,
+        Submissions.is_accepted,
+        Submissions.is_invited,
+        Submissions.google_submission_value,
+        Forms.event_id,
+        Forms.id.label("form_id"),
+        Forms.google_form_id,
+    )
 
-    session.flush()
-    return submission
+
+def _forms_submissions_select(*columns):
+    return (
+        select(*(columns or _forms_submissions_columns()))
+        .select_from(Submissions)
+        .join(Forms, Submissions.form_id == Forms.id)
+        .join(Members, Submissions.member_id == Members.id)
+    )
 
 
-# ====================== submissions 'view' functions ======================
 def get_partial_submissions_by_form_id(session: Session, form_id: int):
     submissions = session.execute(
-        select(t_forms_submissions).where(
-            t_forms_submissions.c.form_id == form_id, t_forms_submissions.c.submission_type == "partial"
+        _forms_submissions_select(Submissions.id.label("submission_id"), Members.id, Members.email).where(
+            Submissions.form_id == form_id, Submissions.submission_type == "partial"
         )
     ).all()
     return submissions
 
 
 def get_submissions_by_event_id(session: Session, event_id: int):
-    submissions = session.execute(select(t_forms_submissions).where(t_forms_submissions.c.event_id == event_id)).all()
+    submissions = session.execute(_forms_submissions_select().where(Forms.event_id == event_id)).all()
     return submissions
 
 
-def update_is_accepted(session: Session, submission_id: int, is_accepted: bool):
-    submission = session.execute(select(Submissions).where(Submissions.id == submission_id)).scalar_one_or_none()
-    if not submission:
-        return None
-    submission.is_accepted = is_accepted
+def get_form_submissions_page(
+    session: Session,
+    form_id: int,
+    *,
+    is_accepted: bool | None = None,
+    is_invited: bool | None = None,
+    submission_type: str | None = None,
+    include_answers: bool = False,
+    after_id: int | None = None,
+    limit: int = 100,
+):
+    """One page of the form's submissions in id order, shaped like forms_submissions rows. ``after_id`` is the last
+    submission id already seen. The Google answers JSON is only read when ``include_answers`` is set."""
+    columns = [
+        column for column in _forms_submissions_columns() if include_answers or column.key != "google_submission_value"
+    ]
+    statement = _forms_submissions_select(*columns).where(Submissions.form_id == form_id)
+    if is_accepted is not None:
+        statement = statement.where(Submissions.is_accepted == is_accepted)
+    if is_invited is not None:
+        statement = statement.where(Submissions.is_invited == is_invited)
+    if submission_type is not None:
+        statement = statement.where(Submissions.submission_type == submission_type)
+    if after_id is not None:
+        statement = statement.where(Submissions.id > after_id)
+    return session.execute(statement.order_by(Submissions.id).limit(limit)).all()
+
+
+def get_form_answer_question_ids(session: Session, form_id: int) -> list[str]:
+    """Every question id that appears in the form's stored Google answers. Responses to one form share a handful of
+    key sets, so this reads few distinct rows."""
+    key_sets = session.scalars(
+        select(func.json_keys(Submissions.google_submission_value, type_=JSON))
+        .where(Submissions.form_id == form_id, Submissions.google_submission_value.is_not(None))
+        .distinct()
+    ).all()
+    return list(dict.fromkeys(key for keys in key_sets for key in keys or ()))
+
+
+def set_submissions_accepted(session: Session, decisions: dict[int, bool]) -> list[int]:
+    """Apply ``submission_id -> is_accepted`` with one UPDATE per decision value. Returns the ids that don't exist;
+    the rest are still applied."""
+    if not decisions:
+        return []
+    existing = set(session.scalars(select(Submissions.id).where(Submissions.id.in_(decisions))).all())
+    for is_accepted in (True, False):
+        ids = [submission_id for submission_id, accept in decisions.items() if accept is is_accepted]
+        if ids:
+            session.execute(
+                update(Submissions).where(Submissions.id.in_(ids)).values(is_accepted=is_accepted),
+                execution_options={"synchronize_session": False},
+            )
     session.flush()
-    return submission
+    return sorted(set(decisions) - existing)
+
+
+def accept_first_submissions(session: Session, event_id: int, count: int) -> int:
+    """Accept the event's first ``count`` non-partial submissions by submission time (ties by id). Submissions
+    already accepted keep their place in the count. Returns how many were newly accepted."""
+    first_ids = session.scalars(
+        select(Submissions.id)
+        .join(Forms, Submissions.form_id == Forms.id)
+        .where(Forms.event_id == event_id, Submissions.submission_type != "partial")
+        .order_by(Submissions.submitted_at, Submissions.id)
+        .limit(count)
+    ).all()
+    if not first_ids:
+        return 0
+    result = session.execute(
+        update(Submissions).where(Submissions.id.in_(first_ids), Submissions.is_accepted == 0).values(is_accepted=1),
+        execution_options={"synchronize_session": False},
+    )
+    session.flush()
+    return result.rowcount
 
 
 def get_accepted_not_invited_by_event(session: Session, event_id: int) -> Sequence[Row[tuple]]:
-    """Returns rows from the forms_submissions view for accepted-not-invited submissions.
+    """Accepted-not-invited submissions of the event, shaped like forms_submissions rows.
     Each row always includes: submission_id, email, event_id, is_accepted, is_invited, etc."""
     submissions = session.execute(
-        select(t_forms_submissions).where(
-            t_forms_submissions.c.event_id == event_id,
-            t_forms_submissions.c.is_accepted == 1,
-            t_forms_submissions.c.is_invited == 0,
-            t_forms_submissions.c.submission_type != "partial",
+        _forms_submissions_select().where(
+            Forms.event_id == event_id,
+            Submissions.is_accepted == 1,
+            Submissions.is_invited == 0,
+            Submissions.submission_type != "partial",
         )
     ).all()
     return submissions
 
 
+def get_acceptance_progress(session: Session, event_id: int) -> dict[str, int]:
+    stmt = (
+        select(func.count().label("accepted"), func.coalesce(func.sum(Submissions.is_invited), 0).label("invited"))
+        .join(Forms, Submissions.form_id == Forms.id)
+        .where(Forms.event_id == event_id, Submissions.is_accepted == 1, Submissions.submission_type != "partial")
+    )
+    row = session.execute(stmt).one()
+    return {"accepted": int(row.accepted), "invited": int(row.invited), "remaining": int(row.accepted - row.invited)}
+
+
+def _acceptance_lock_name(event_id: int) -> str:
+    return f"acceptance-send:{event_id}"
+
+
+@contextmanager
+def acceptance_send_lock(event_id: int) -> Iterator[bool]:
+    """Hold a MySQL named lock for the event while its acceptance emails are being sent, so two workers can't send
+    to the same accepted-not-invited rows at once. The lock lives on its own connection because session connections
+    go back to the pool on every commit. Yields whether the lock was acquired."""
+    name = _acceptance_lock_name(event_id)
+    with engine.connect() as connection:
+        acquired = connection.scalar(text("SELECT GET_LOCK(:name, 0)"), {"name": name}) == 1
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                connection.scalar(text("SELECT RELEASE_LOCK(:name)"), {"name": name})
+
+
+def is_acceptance_send_running(session: Session, event_id: int) -> bool:
+    holder = session.scalar(text("SELECT IS_USED_LOCK(:name)"), {"name": _acceptance_lock_name(event_id)})
+    return holder is not None
+
+
 def mark_submissions_as_invited(session: Session, submission_ids: list[int]):
     from sqlalchemy import update
 
@@ -5,6 +5,7 @@ from typing import Any, Dict, Optional, Tuple
 from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
 
+from app.DB.members import normalize_email
 from app.DB.schema import MemberProfiles, MemberProfilesNameLanguage, Members, Role, RoleType
 
 
@@ -23,7 +24,7 @@ def get_member_by_email_or_none(session: Session, email: str) -> Optional[Member
     stmt = (
         select(Members)
         .options(joinedload(Members.role), joinedload(Members.profile))
-        .where(Members.email == email)
+        .where(Members.email_normalized == normalize_email(email))
     )
     return session.scalars(stmt).first()
 
@@ -0,0 +1,88 @@
+"""
+Multi-day send planning for blasts larger than today's send capacity.
+
+Each address may send ``EMAIL_THRESHOLDS[address]`` recipients per rolling ``window``. Given the sends already inside
+the window, the planner walks forward in time: at every instant it fills whatever capacity each address has (club
+address first), then jumps to the next moment an earlier send ages out of the window. The result is a list of
+slices -- how many recipients each address can take and when -- whose last release is the projected completion.
+
+The plan is a projection. Delivery still checks real capacity before every chunk, so sends made outside the blast
+only push the schedule back; they never push an address over its threshold.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from math import ceil
+from typing import Iterable, Sequence
+
+from app.DB.schema import EmailLogsFromAddress
+
+
+@dataclass(frozen=True)
+class ScheduleSlice:
+    release_at: datetime
+    from_address: EmailLogsFromAddress
+    count: int
+
+    def to_json(self) -> dict:
+        return {"release_at": self.release_at.isoformat(), "from_address": self.from_address.value, "count": self.count}
+
+
+def plan_blast_schedule(
+    count: int,
+    now: datetime,
+    thresholds: dict[EmailLogsFromAddress, int],
+    recent_sends: Iterable[tuple[EmailLogsFromAddress, datetime, int]],
+    addresses: Sequence[EmailLogsFromAddress],
+    window: timedelta = timedelta(days=1),
+    min_slice: int = 1,
+) -> list[ScheduleSlice]:
+    """An address only takes a slice once it has ``min_slice`` free (or all that's left, or its whole threshold), so
+    a window full of single-recipient sends becomes a few chunk-sized slices instead of one per send. That keeps the
+    plan at most about ``count / min_slice`` slices plus one per address."""
+    if count > 0 and not any(thresholds.get(addr, 0) > 0 for addr in addresses):
+        raise ValueError("No address has a positive send threshold")
+
+    # per address, sends still inside the window in time order, and their running total
+    sends: dict[EmailLogsFromAddress, deque[tuple[datetime, int]]] = {addr: deque() for addr in addresses}
+    used = dict.fromkeys(addresses, 0)
+    for addr, sent_at, recipients in sorted(recent_sends, key=lambda send: send[1]):
+        if addr in sends and sent_at > now - window:
+            sends[addr].append((sent_at, recipients))
+            used[addr] += recipients
+
+    slices: list[ScheduleSlice] = []
+    remaining = count
+    at = now
+    while remaining > 0:
+        for addr in addresses:
+            entries = sends[addr]
+            while entries and entries[0][0] <= at - window:
+                used[addr] -= entries.popleft()[1]
+            threshold = thresholds.get(addr, 0)
+            capacity = threshold - used[addr]
+            if capacity <= 0 or capacity < min(min_slice, threshold, remaining):
+                continue
+            take = min(capacity, remaining)
+            slices.append(ScheduleSlice(at, addr, take))
+            entries.append((at, take))
+            used[addr] += take
+            remaining -= take
+            if remaining == 0:
+                break
+        if remaining > 0:
+            # nothing frees up between sends, so the next useful instant is the next expiry
+            at = min(entries[0][0] + window for entries in sends.values() if entries)
+    return slices
+
+
+def projected_completion(
+    slices: list[ScheduleSlice], chunk_size: int, chunk_interval_seconds: float
+) -> datetime | None:
+    """Release time of the last slice plus the pacing delay between its chunks."""
+    if not slices:
+        return None
+    last_release = max(s.release_at for s in slices)
+    last_count = sum(s.count for s in slices if s.release_at == last_release)
+    return last_release + timedelta(seconds=(ceil(last_count / chunk_size) - 1) * chunk_interval_seconds)
@@ -0,0 +1,114 @@
+"""
+Content-addressed disk cache for generated certificate files.
+
+A certificate is identified by the hash of the exact payload sent to the generation API (event, member, language and
+format), so a renamed event or member naturally misses the cache instead of serving a stale file.
+
+The cache is bounded: hits refresh a file's mtime, and every ``CERTIFICATE_CACHE_SWEEP_INTERVAL_SECONDS`` a commit
+sweeps out files unused for ``CERTIFICATE_CACHE_MAX_AGE_SECONDS``, then the least recently used ones until the whole
+cache fits in ``CERTIFICATE_CACHE_MAX_BYTES``.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from app.config import config
+
+
+def certificate_cache_key(payload: dict) -> str:
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def certificate_cache_path(key: str, extension: str, root: str | None = None) -> Path:
+    # fan out by the first two hex chars so no single directory grows unbounded
+    return Path(root or config.CERTIFICATE_CACHE_DIR) / key[:2] / f"{key}.{extension}"
+
+
+def touch_certificate(path: Path) -> None:
+    """Record a cache hit, so the sweep evicts the least recently used certificates first."""
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        pass
+
+
+def sweep_certificate_cache(root: str | Path, max_bytes: int, max_age_seconds: float, now: float | None = None) -> int:
+    """Evict certificates not used for ``max_age_seconds``, then the least recently used ones until the rest fit in
+    ``max_bytes``. In-flight ``.part`` files are only removed once they're that old (a writer that died). Returns how
+    many files were removed."""
+    now = time.time() if now is None else now
+    entries = []
+    for path in Path(root).glob("*/*"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue  # another worker evicted it
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    removed = 0
+    total = 0
+    kept = []
+    for mtime, size, path in entries:
+        if now - mtime > max_age_seconds:
+            path.unlink(missing_ok=True)
+            removed += 1
+        elif path.suffix != ".part":
+            kept.append((mtime, size, path))
+            total += size
+
+    for mtime, size, path in sorted(kept):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    return removed
+
+
+_last_sweep_at = 0.0
+
+
+def maybe_sweep_certificate_cache() -> int:
+    """Sweep the cache if ``CERTIFICATE_CACHE_SWEEP_INTERVAL_SECONDS`` passed since this process last did."""
+    global _last_sweep_at
+    if time.monotonic() - _last_sweep_at < config.CERTIFICATE_CACHE_SWEEP_INTERVAL_SECONDS:
+        return 0
+    _last_sweep_at = time.monotonic()
+    return sweep_certificate_cache(
+        config.CERTIFICATE_CACHE_DIR, config.CERTIFICATE_CACHE_MAX_BYTES, config.CERTIFICATE_CACHE_MAX_AGE_SECONDS
+    )
+
+
+class CertificateCacheWriter:
+    """Writes into a temp file beside ``path`` and renames it into place on ``commit``, so concurrent readers never
+    see a partially downloaded certificate."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".part")
+        self._file = os.fdopen(fd, "wb")
+        self._tmp_path = tmp_path
+        self._path = path
+        self._done = False
+        self.bytes_written = 0
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+        self.bytes_written += len(chunk)
+
+    def commit(self) -> None:
+        self._file.close()
+        os.replace(self._tmp_path, self._path)
+        self._done = True
+
+    def discard(self) -> None:
+        if self._done:
+            return
+        self._file.close()
+        Path(self._tmp_path).unlink(missing_ok=True)
+        self._done = True
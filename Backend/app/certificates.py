@@ -0,0 +1,152 @@
+"""
+Certificate rendering shared by the routers.
+
+Pre-rendering turns every full-attendance member's certificate into a stored file ahead of time, so sending or
+downloading it later only attaches the recorded URL instead of waiting on the generation API. It is queued both from
+the certificates endpoint and when an event closes, which is why it lives here rather than in either router.
+"""
+
+import asyncio
+from enum import Enum
+
+import httpx
+from pydantic import BaseModel, EmailStr
+
+from app.DB import certificates as certificate_queries
+from app.DB import events as events_queries
+from app.DB import logs as log_queries
+from app.DB.main import SessionLocal
+from app.DB.schema import Events, MembersGender
+from app.certificate_cache import certificate_cache_key
+from app.config import config
+from app.exceptions import BadGateway, GatewayTimeout, KnownHttpException, ServiceUnavailable
+from app.helpers import get_effective_date
+from app.http_clients import Upstream, call_with_retries, http_clients
+from app.routers.logging import LogFile, write_log, write_log_exception, write_log_title, write_log_traceback
+
+
+class CertificateLanguage(str, Enum):
+    ARABIC = "ar"
+    ENGLISH = "en"
+
+
+class CertificateFormat(str, Enum):
+    PNG = "png"
+    PDF = "pdf"
+
+
+class SimpleMember(BaseModel):
+    name: str
+    email: EmailStr
+    gender: MembersGender
+
+
+class SimpleEvent(BaseModel):
+    name: str
+    date: str
+    official: bool
+
+
+class CertificateGenerationRequest(BaseModel):
+    language: CertificateLanguage
+    format: CertificateFormat
+    event: SimpleEvent
+    member: SimpleMember
+
+
+def format_event_date(event: Events) -> str:
+    start_effective = get_effective_date(event.start_datetime, config.ATTENDANCE_EARLY_HOURS_THRESHOLD)
+    end_effective = get_effective_date(event.end_datetime, config.ATTENDANCE_EARLY_HOURS_THRESHOLD)
+    days = (end_effective - start_effective).days
+    if days == 0:
+        return start_effective.strftime("%Y-%m-%d")
+    return f"{start_effective.strftime('%Y-%m-%d')} - {end_effective.strftime('%Y-%m-%d')}"
+
+
+async def request_certificate_file_url(cert_request: CertificateGenerationRequest) -> str:
+    client = http_clients.async_client(Upstream.CERTIFICATE_API)
+    try:
+        response = await client.post(
+            f"{config.CERTIFICATE_API_URL}/generations/certificate",
+            json=cert_request.model_dump(mode="json"),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        data = response.json()
+    except httpx.TimeoutException:
+        raise GatewayTimeout(detail="Certificate generation API request timed out")
+    except httpx.HTTPStatusError as e:
+        raise BadGateway(detail=f"Certificate generation API returned error: {e.response.status_code}")
+    except httpx.RequestError:
+        raise ServiceUnavailable(detail="Failed to connect to certificate generation API")
+
+    return data if isinstance(data, str) else data.get("url", data.get("key", str(data)))
+
+
+async def prerender_event_certificates(
+    event_id: int,
+    language: CertificateLanguage = CertificateLanguage.ARABIC,
+    format: CertificateFormat = CertificateFormat.PDF,
+):
+    """Renders the certificate of every full-attendance member of an event ahead of time, at most
+    `CERTIFICATE_PRERENDER_CONCURRENCY` at once, and records the file URLs in `certificates`. Members whose
+    certificate is already rendered with the same payload are skipped, so re-running only fills the gaps."""
+    with LogFile("prerender certificates [JOB]"), SessionLocal() as session:
+        try:
+            event = events_queries.get_event_by_id(session, event_id)
+            simple_event = SimpleEvent(name=event.name, date=format_event_date(event), official=bool(event.is_official))
+            existing = certificate_queries.get_certificate_keys_by_event(
+                session, event_id, language.value, format.value
+            )
+
+            pending: list[tuple[int, str, CertificateGenerationRequest]] = []
+            for member in log_queries.get_full_attendance_members(session, event):
+                cert_request = CertificateGenerationRequest(
+                    language=language,
+                    format=format,
+                    event=simple_event,
+                    member=SimpleMember(name=member["name"], email=member["email"], gender=member["gender"]),
+                )
+                cache_key = certificate_cache_key(cert_request.model_dump(mode="json"))
+                if existing.get(member["id"]) != cache_key:
+                    pending.append((member["id"], cache_key, cert_request))
+            write_log_title(
+                f"Pre-rendering [{len(pending)}] certificates for event [{event.name}] "
+                f"([{len(existing)}] already rendered), [{config.CERTIFICATE_PRERENDER_CONCURRENCY}] at a time"
+            )
+
+            semaphore = asyncio.Semaphore(config.CERTIFICATE_PRERENDER_CONCURRENCY)
+
+            async def render(member_id: int, cache_key: str, cert_request: CertificateGenerationRequest):
+                async with semaphore:
+                    try:
+                        file_url = await call_with_retries(lambda: request_certificate_file_url(cert_request))
+                    except KnownHttpException as e:
+                        write_log(f"Rendering certificate for member [{member_id}] failed: {e.detail}")
+                        return member_id, cache_key, None
+                return member_id, cache_key, file_url
+
+            rendered = failed = 0
+            for result in asyncio.as_completed([render(*item) for item in pending]):
+                member_id, cache_key, file_url = await result
+                if file_url is None:
+                    failed += 1
+                    continue
+                certificate_queries.upsert_certificate(
+                    session,
+                    event_id=event_id,
+                    member_id=member_id,
+                    language=language.value,
+                    format=format.value,
+                    cache_key=cache_key,
+                    file_url=file_url,
+                )
+                session.commit()
+                rendered += 1
+
+            write_log(f"Pre-rendered [{rendered}] certificates for event [{event.name}], [{failed}] failed")
+
+        except Exception as e:
+            session.rollback()
+            write_log_exception(e)
+            write_log_traceback()
@@ -15,6 +15,25 @@ if os.getenv("ENV") != "testing":
 LOG_DIR_DEV = "logs"
 LOG_DIR_PROD = str(Path.home() / "GDG-Logs")
 
+CERTIFICATE_CACHE_DIR_DEV = "certificate_cache"
+CERTIFICATE_CACHE_DIR_PROD = str(Path.home() / "GDG-Certificate-Cache")
+CERTIFICATE_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# The certificate cache is swept (at most once per interval, on write) down to this size and age
+CERTIFICATE_CACHE_MAX_BYTES = 2 * 1024**3
+CERTIFICATE_CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+CERTIFICATE_CACHE_SWEEP_INTERVAL_SECONDS = 10 * 60
+# How many certificate renders a pre-render job keeps in flight against the certificate service
+CERTIFICATE_PRERENDER_CONCURRENCY = 4
+
+# Outbound HTTP pools, one per upstream: (max_connections, max_keepalive_connections, default_timeout_seconds)
+HTTP_CLIENT_LIMITS: dict[str, tuple[int, int, float]] = {
+    "certificate_api": (20, 10, 120.0),
+    "file_storage": (20, 10, 60.0),
+    "member_app": (5, 2, 30.0),
+}
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0
+HTTP_CONNECT_TIMEOUT_SECONDS = 10.0
+
 # Added the new summer semester
 CURRENT_SEMESTER = 475
 PUBLIC_SEMESTERS = [475, 472, 471]
@@ -26,6 +45,51 @@ CLUB_EMAIL_THRESHOLD = 350
 
 EMAIL_THRESHOLDS: dict[str, int] = {"info@kerneltics.com": 1500, "gdg.qu1@gmail.com": 400}
 
+# Blasts are delivered in chunks so a single upstream request never carries more than this many recipients
+BLAST_CHUNK_SIZE = 50
+BLAST_CHUNK_MAX_ATTEMPTS = 3
+BLAST_CHUNK_RETRY_BACKOFF_SECONDS = 5
+BLAST_CHUNK_INTERVAL_SECONDS = 2
+# A blast still "sending" with no chunk recorded for this long belongs to a job that died; it may be resumed
+BLAST_SENDING_STALE_SECONDS = 10 * 60
+# Blasts over the remaining capacity are split across days; scheduled slices are released on this interval
+BLAST_SCHEDULER_INTERVAL_SECONDS = 60
+
+# A certificate-send claim still "claimed" after this long belongs to a job that died; another job may take it over
+EMAIL_SEND_CLAIM_STALE_SECONDS = 15 * 60
+
+# email_logs rows older than this are moved to email_logs_archive; usage totals come from the hourly rollup, which
+# is never archived
+EMAIL_LOG_RETENTION_DAYS = 90
+EMAIL_LOG_ARCHIVE_BATCH_SIZE = 1000
+
+# Acceptance emails go out in chunks too, reusing the blast retry/backoff/interval settings
+ACCEPTANCE_CHUNK_SIZE = 50
+
+CERTIFICATE_ELIGIBILITY_CACHE_TTL_SECONDS = 30
+
+# Webhook syncs only fetch Google Forms responses submitted after the form's stored cursor, minus this overlap so a
+# response Google lists a little late is still picked up on the next sync
+GOOGLE_FORMS_SYNC_OVERLAP_SECONDS = 5 * 60
+# An unmatched response holds the sync cursor back this long, so a partial submission created after its Google
+# response still matches on an incremental sync; older ones are only seen again by a full sync
+GOOGLE_FORMS_UNMATCHED_HOLD_SECONDS = 24 * 60 * 60
+# Responses per responses.list page; syncs hold one page in memory at a time (the API allows up to 5000)
+GOOGLE_FORMS_RESPONSES_PAGE_SIZE = 1000
+# Webhook notifications for a form are folded into one pending sync that starts this long after the last one ends
+GOOGLE_FORMS_WEBHOOK_DEBOUNCE_SECONDS = 5
+# Pub/Sub messageIds remembered for dropping redeliveries
+GOOGLE_FORMS_WEBHOOK_MESSAGE_TTL_SECONDS = 60 * 60
+# Google Forms syncs (webhook and reconciliation) running at once per worker process, across all forms
+GOOGLE_FORMS_SYNC_MAX_CONCURRENT = 4
+# Every open event's Google form is re-synced this often, catching responses whose webhook never arrived; 0 disables
+GOOGLE_FORMS_RECONCILE_INTERVAL_SECONDS = 15 * 60
+# Each reconciliation round starts up to this many seconds early or late so worker processes drift apart
+GOOGLE_FORMS_RECONCILE_JITTER_SECONDS = 60
+# Every this many reconciliation rounds (and on the first) each form's next sync reads all its responses instead of
+# those after its cursor, picking up responses that went unmatched after the cursor passed them
+GOOGLE_FORMS_RECONCILE_FULL_EVERY = 4
+
 
 class Config:
     @property
@@ -58,6 +122,44 @@ class Config:
             os.makedirs(LOG_DIR_PROD, exist_ok=True)
             return LOG_DIR_PROD
 
+    @property
+    def CERTIFICATE_CACHE_DIR(self) -> str:
+        path = CERTIFICATE_CACHE_DIR_DEV if self.is_dev else CERTIFICATE_CACHE_DIR_PROD
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    @property
+    def CERTIFICATE_DOWNLOAD_CHUNK_SIZE(self) -> int:
+        return CERTIFICATE_DOWNLOAD_CHUNK_SIZE
+
+    @property
+    def CERTIFICATE_CACHE_MAX_BYTES(self) -> int:
+        return CERTIFICATE_CACHE_MAX_BYTES
+
+    @property
+    def CERTIFICATE_CACHE_MAX_AGE_SECONDS(self) -> int:
+        return CERTIFICATE_CACHE_MAX_AGE_SECONDS
+
+    @property
+    def CERTIFICATE_CACHE_SWEEP_INTERVAL_SECONDS(self) -> int:
+        return CERTIFICATE_CACHE_SWEEP_INTERVAL_SECONDS
+
+    @property
+    def CERTIFICATE_PRERENDER_CONCURRENCY(self) -> int:
+        return CERTIFICATE_PRERENDER_CONCURRENCY
+
+    @property
+    def HTTP_CLIENT_LIMITS(self) -> dict[str, tuple[int, int, float]]:
+        return HTTP_CLIENT_LIMITS
+
+    @property
+    def HTTP_KEEPALIVE_EXPIRY_SECONDS(self) -> float:
+        return HTTP_KEEPALIVE_EXPIRY_SECONDS
+
+    @property
+    def HTTP_CONNECT_TIMEOUT_SECONDS(self) -> float:
+        return HTTP_CONNECT_TIMEOUT_SECONDS
+
     @property
     def CLUB_EMAIL_THRESHOLD(self) -> int:
         return CLUB_EMAIL_THRESHOLD
@@ -66,6 +168,86 @@ class Config:
     def EMAIL_THRESHOLDS(self) -> dict[str, int]:
         return EMAIL_THRESHOLDS
 
+    @property
+    def BLAST_CHUNK_SIZE(self) -> int:
+        return BLAST_CHUNK_SIZE
+
+    @property
+    def BLAST_CHUNK_MAX_ATTEMPTS(self) -> int:
+        return BLAST_CHUNK_MAX_ATTEMPTS
+
+    @property
+    def BLAST_CHUNK_RETRY_BACKOFF_SECONDS(self) -> int:
+        return BLAST_CHUNK_RETRY_BACKOFF_SECONDS
+
+    @property
+    def BLAST_CHUNK_INTERVAL_SECONDS(self) -> int:
+        return BLAST_CHUNK_INTERVAL_SECONDS
+
+    @property
+    def BLAST_SENDING_STALE_SECONDS(self) -> int:
+        return BLAST_SENDING_STALE_SECONDS
+
+    @property
+    def BLAST_SCHEDULER_INTERVAL_SECONDS(self) -> int:
+        return BLAST_SCHEDULER_INTERVAL_SECONDS
+
+    @property
+    def EMAIL_SEND_CLAIM_STALE_SECONDS(self) -> int:
+        return EMAIL_SEND_CLAIM_STALE_SECONDS
+
+    @property
+    def EMAIL_LOG_RETENTION_DAYS(self) -> int:
+        return EMAIL_LOG_RETENTION_DAYS
+
+    @property
+    def EMAIL_LOG_ARCHIVE_BATCH_SIZE(self) -> int:
+        return EMAIL_LOG_ARCHIVE_BATCH_SIZE
+
+    @property
+    def ACCEPTANCE_CHUNK_SIZE(self) -> int:
+        return ACCEPTANCE_CHUNK_SIZE
+
+    @property
+    def CERTIFICATE_ELIGIBILITY_CACHE_TTL_SECONDS(self) -> int:
+        return CERTIFICATE_ELIGIBILITY_CACHE_TTL_SECONDS
+
+    @property
+    def GOOGLE_FORMS_SYNC_OVERLAP_SECONDS(self) -> int:
+        return GOOGLE_FORMS_SYNC_OVERLAP_SECONDS
+
+    @property
+    def GOOGLE_FORMS_UNMATCHED_HOLD_SECONDS(self) -> int:
+        return GOOGLE_FORMS_UNMATCHED_HOLD_SECONDS
+
+    @property
+    def GOOGLE_FORMS_RESPONSES_PAGE_SIZE(self) -> int:
+        return GOOGLE_FORMS_RESPONSES_PAGE_SIZE
+
+    @property
+    def GOOGLE_FORMS_WEBHOOK_DEBOUNCE_SECONDS(self) -> int:
+        return GOOGLE_FORMS_WEBHOOK_DEBOUNCE_SECONDS
+
+    @property
+    def GOOGLE_FORMS_WEBHOOK_MESSAGE_TTL_SECONDS(self) -> int:
+        return GOOGLE_FORMS_WEBHOOK_MESSAGE_TTL_SECONDS
+
+    @property
+    def GOOGLE_FORMS_SYNC_MAX_CONCURRENT(self) -> int:
+        return GOOGLE_FORMS_SYNC_MAX_CONCURRENT
+
+    @property
+    def GOOGLE_FORMS_RECONCILE_INTERVAL_SECONDS(self) -> int:
+        return GOOGLE_FORMS_RECONCILE_INTERVAL_SECONDS
+
+    @property
+    def GOOGLE_FORMS_RECONCILE_JITTER_SECONDS(self) -> int:
+        return GOOGLE_FORMS_RECONCILE_JITTER_SECONDS
+
+    @property
+    def GOOGLE_FORMS_RECONCILE_FULL_EVERY(self) -> int:
+        return GOOGLE_FORMS_RECONCILE_FULL_EVERY
+
     @property
     def ATTENDANCE_EARLY_HOURS_THRESHOLD(self) -> int:
         return ATTENDANCE_EARLY_HOURS_THRESHOLD
@@ -135,6 +317,11 @@ class Config:
     def SENTRY_DSN(self) -> Optional[str]:
         return os.getenv("SENTRY_DSN")
 
+    @property
+    def BLAST_API_JSON_BODY(self) -> bool:
+        # off until the certificate service accepts POST /blasts as one JSON body
+        return env_or_except("BLAST_API_JSON_BODY", "false").lower() == "true"
+
 
 def env_or_except(key: str, default: Optional[str] = None) -> str:
     value = os.getenv(key)
@@ -29,6 +29,11 @@ class EmptyBody(KnownHttpException):
         super().__init__(status_code=400, detail="Request body must contain HTML content")
 
 
+class InvalidCursor(KnownHttpException):
+    def __init__(self):
+        super().__init__(status_code=400, detail="Pagination cursor is malformed or expired")
+
+
 class GatewayTimeout(KnownHttpException):
     def __init__(self, detail: str = "Upstream request timed out"):
         super().__init__(status_code=504, detail=detail)
@@ -72,3 +77,13 @@ class MemberNotFound(NotFound):
 class EmailTemplateNotFound(NotFound):
     def __init__(self, id: str | int):
         super().__init__("Email template", id)
+
+
+class BlastNotFound(NotFound):
+    def __init__(self, id: str | int):
+        super().__init__("Email blast", id)
+
+
+class EmailLogNotFound(NotFound):
+    def __init__(self, id: str | int):
+        super().__init__("Email log", id)
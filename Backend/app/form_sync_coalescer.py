@@ -0,0 +1,118 @@
+"""
+Coalescing scheduler for Google Forms webhook syncs.
+
+Google publishes one Pub/Sub message per response, so a burst of submissions used to start one overlapping sync per
+message. Here each form has at most one sync running and one pending: a notification for a form with a pending sync
+is folded into it, and the pending sync starts ``debounce_seconds`` after the previous one finishes (or after the
+first notification), so a burst collapses into one or two syncs. Pub/Sub redelivers messages it thinks weren't
+acknowledged; a ``messageId`` seen recently is dropped. At most ``max_concurrent`` syncs run at once across forms;
+a form waiting for a slot stays pending, so notifications keep folding into it.
+
+State lives on the event loop of the worker process, so each worker coalesces its own notifications.
+"""
+
+import asyncio
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Callable, Literal
+
+from app.config import config
+from app.ttl_cache import TTLCache
+
+SubmitResult = Literal["scheduled", "queued", "coalesced", "duplicate"]
+
+
+@dataclass
+class FormSyncCounters:
+    received: int = 0
+    scheduled: int = 0
+    queued: int = 0
+    coalesced: int = 0
+    dropped_duplicates: int = 0
+    syncs_started: int = 0
+    syncs_failed: int = 0
+
+
+@dataclass
+class _FormState:
+    task: asyncio.Task | None = None
+    running: bool = False
+    pending: bool = True
+
+
+class FormSyncCoalescer:
+    def __init__(
+        self, debounce_seconds: float, message_ttl_seconds: float, max_messages: int = 4096, max_concurrent: int = 0
+    ):
+        self._debounce = debounce_seconds
+        self._seen_messages = TTLCache(message_ttl_seconds, max_entries=max_messages)
+        self._slots = asyncio.Semaphore(max_concurrent) if max_concurrent else None
+        self._forms: dict[str, _FormState] = {}
+        self.counters = FormSyncCounters()
+        # wall-clock time of each form's last sync that finished without raising
+        self.last_synced_at: dict[str, float] = {}
+
+    def submit(self, form_id: str, message_id: str | None, sync: Callable[[str], None]) -> SubmitResult:
+        """Request a sync of ``form_id``. ``sync`` runs in a worker thread, never twice at once for the same form.
+        Must be called from the event loop."""
+        self.counters.received += 1
+        if message_id:
+            if self._seen_messages.get(message_id) is not None:
+                self.counters.dropped_duplicates += 1
+                return "duplicate"
+            self._seen_messages.set(message_id, True)
+
+        state = self._forms.get(form_id)
+        if state is None:
+            state = _FormState()
+            self._forms[form_id] = state
+            state.task = asyncio.create_task(self._drain(form_id, state, sync))
+            self.counters.scheduled += 1
+            return "scheduled"
+        if state.pending:
+            self.counters.coalesced += 1
+            return "coalesced"
+        # a sync is running and may have fetched before this response existed: run once more after it
+        state.pending = True
+        self.counters.queued += 1
+        return "queued"
+
+    async def _drain(self, form_id: str, state: _FormState, sync: Callable[[str], None]) -> None:
+        try:
+            while state.pending:
+                await asyncio.sleep(self._debounce)
+                async with self._slots or nullcontext():
+                    state.pending = False
+                    state.running = True
+                    self.counters.syncs_started += 1
+                    try:
+                        await asyncio.to_thread(sync, form_id)
+                        self.last_synced_at[form_id] = time.time()
+                    except Exception:
+                        # sync_form_submissions logs its own failures; keep draining so a queued sync still runs
+                        self.counters.syncs_failed += 1
+                    finally:
+                        state.running = False
+        finally:
+            self._forms.pop(form_id, None)
+
+    def stats(self) -> dict:
+        return {
+            **vars(self.counters),
+            "syncs_in_flight": sum(1 for state in self._forms.values() if state.running),
+            "syncs_pending": sum(1 for state in self._forms.values() if state.pending),
+        }
+
+    async def shutdown(self) -> None:
+        tasks = [state.task for state in self._forms.values() if state.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+form_syncs = FormSyncCoalescer(
+    config.GOOGLE_FORMS_WEBHOOK_DEBOUNCE_SECONDS,
+    config.GOOGLE_FORMS_WEBHOOK_MESSAGE_TTL_SECONDS,
+    max_concurrent=config.GOOGLE_FORMS_SYNC_MAX_CONCURRENT,
+)
@@ -0,0 +1,114 @@
+"""
+Periodic reconciliation of Google Forms syncs.
+
+Syncs normally run when Google's Pub/Sub notification arrives; a message that never arrives left its submissions
+partial until someone ran the manual sync. Every ``interval_seconds`` (give or take ``jitter_seconds``, so worker
+processes started together drift apart) the reconciler lists the open events' Google forms and submits each one to
+the webhook coalescer. That keeps a reconcile from overlapping a webhook sync of the same form, and the coalescer's
+concurrency limit bounds how many forms sync at once.
+
+Syncs are incremental, reading from each form's cursor, except on the first round and every ``full_every``-th one
+after it: those mark every listed form so its next sync, whether the reconciler's or a webhook's that it was folded
+into, reads all responses (``take_full_sync``). That picks up a response the cursor passed while it had no partial
+submission to match.
+
+``stats()`` reports, per form listed in the last round:
+
+- ``lag_seconds``: how long ago this process last finished a sync of the form (webhook or reconciliation), ``None``
+  until it has. A healthy form stays under about one interval however quiet it is, so this is what to alert on.
+- ``synced_until`` / ``cursor_age_seconds``: the form's cursor as read when the round started, and how far it trails
+  now. The cursor is the newest response seen, so on a quiet form its age only says nobody has submitted lately.
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+from app.config import config
+from app.form_sync_coalescer import FormSyncCoalescer, form_syncs
+from app.routers.logging import LogFile, write_log_exception, write_log_traceback
+
+
+class FormSyncReconciler:
+    def __init__(
+        self, coalescer: FormSyncCoalescer, interval_seconds: float, jitter_seconds: float, full_every: int = 1
+    ):
+        self._coalescer = coalescer
+        self._interval = interval_seconds
+        self._jitter = min(jitter_seconds, interval_seconds)
+        self._full_every = max(full_every, 1)
+        self._forms: dict[str, datetime | None] = {}
+        self._full_due: set[str] = set()
+        self.rounds = 0
+        self.last_round_at: float | None = None
+
+    def next_delay(self) -> float:
+        return self._interval + random.uniform(-self._jitter, self._jitter)
+
+    async def reconcile_once(
+        self, list_forms: Callable[[], list[tuple[str, datetime | None]]], sync: Callable[[str], None]
+    ) -> int:
+        """Submit a sync for every form ``list_forms`` returns (``(google_form_id, synced_until)`` pairs). Returns
+        how many forms were submitted."""
+        forms = await asyncio.to_thread(list_forms)
+        self._forms = dict(forms)
+        if self.rounds % self._full_every == 0:
+            self._full_due.update(self._forms)
+        for google_form_id, _ in forms:
+            self._coalescer.submit(google_form_id, None, sync)
+        self.rounds += 1
+        self.last_round_at = time.time()
+        return len(forms)
+
+    def take_full_sync(self, google_form_id: str) -> bool:
+        """Whether the form's next sync should read every response; called by the sync as it starts, which clears
+        the mark (a failed full sync waits for the next full round)."""
+        if google_form_id not in self._full_due:
+            return False
+        self._full_due.discard(google_form_id)
+        return True
+
+    async def run(
+        self, list_forms: Callable[[], list[tuple[str, datetime | None]]], sync: Callable[[str], None]
+    ) -> None:
+        if self._interval <= 0:
+            return
+        while True:
+            await asyncio.sleep(self.next_delay())
+            try:
+                await self.reconcile_once(list_forms, sync)
+            except Exception as e:
+                # a failed listing (e.g. the DB is briefly down) only skips this round
+                with LogFile("google forms reconciliation"):
+                    write_log_exception(e)
+                    write_log_traceback()
+
+    def stats(self) -> dict:
+        now = time.time()
+        # cursors are naive UTC, like the Forms API timestamps they come from
+        utc_now = datetime.now(timezone.utc).replace(tzinfo=None)
+        forms = {}
+        for google_form_id, synced_until in self._forms.items():
+            last_synced_at = self._coalescer.last_synced_at.get(google_form_id)
+            forms[google_form_id] = {
+                "lag_seconds": round(now - last_synced_at, 1) if last_synced_at is not None else None,
+                "synced_until": synced_until.isoformat() if synced_until else None,
+                "cursor_age_seconds": round((utc_now - synced_until).total_seconds(), 1) if synced_until else None,
+            }
+        return {
+            "interval_seconds": self._interval,
+            "full_every": self._full_every,
+            "rounds": self.rounds,
+            "last_round_at": datetime.fromtimestamp(self.last_round_at).isoformat() if self.last_round_at else None,
+            "forms": forms,
+        }
+
+
+form_reconciler = FormSyncReconciler(
+    form_syncs,
+    config.GOOGLE_FORMS_RECONCILE_INTERVAL_SECONDS,
+    config.GOOGLE_FORMS_RECONCILE_JITTER_SECONDS,
+    full_every=config.GOOGLE_FORMS_RECONCILE_FULL_EVERY,
+)
@@ -0,0 +1,82 @@
+"""
+Google Forms API clients, reused across syncs.
+
+``Credentials(None, refresh_token=...)`` starts without an access token, so building one per sync meant an OAuth
+refresh on every webhook, and ``build()`` re-read and re-parsed the Forms discovery document each time. Here the
+credentials are cached per refresh token and only refreshed once the access token is about to expire, and the
+bundled (static) discovery document is parsed once per process.
+
+Services are still created per call: each one owns an ``httplib2.Http``, which isn't thread-safe, and creating one
+from the parsed document is cheap.
+"""
+
+import json
+from collections import OrderedDict
+from threading import Lock
+
+from google.auth.transport.requests import Request as GoogleRequest
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+
+from app.config import config
+
+GOOGLE_TOKEN_URI = "https://oauth2.googleapis.com/token"
+
+
+class GoogleFormsClients:
+    def __init__(self, token_uri: str = GOOGLE_TOKEN_URI, max_entries: int = 256):
+        self._token_uri = token_uri
+        self._max_entries = max_entries
+        self._lock = Lock()
+        self._credentials: OrderedDict[str, tuple[Lock, Credentials]] = OrderedDict()
+        self._discovery_doc: dict | None = None
+
+    def credentials(self, refresh_token: str) -> Credentials:
+        """Credentials for ``refresh_token`` with a valid access token, refreshing only when the cached one is
+        missing or about to expire. A failed refresh (e.g. a revoked token) raises and isn't cached."""
+        with self._lock:
+            entry = self._credentials.get(refresh_token)
+            if entry is None:
+                entry = (Lock(), self._new_credentials(refresh_token))
+                self._credentials[refresh_token] = entry
+                if len(self._credentials) > self._max_entries:
+                    self._credentials.popitem(last=False)
+            else:
+                self._credentials.move_to_end(refresh_token)
+
+        refresh_lock, credentials = entry
+        with refresh_lock:
+            if not credentials.valid:
+                try:
+                    credentials.refresh(GoogleRequest())
+                except Exception:
+                    with self._lock:
+                        if self._credentials.get(refresh_token) is entry:
+                            del self._credentials[refresh_token]
+                    raise
+        return credentials
+
+    def forms_service(self, refresh_token: str):
+        return build_from_document(self._forms_discovery_doc(), credentials=self.credentials(refresh_token))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._credentials.clear()
+
+    def _new_credentials(self, refresh_token: str) -> Credentials:
+        return Credentials(
+            None,
+            refresh_token=refresh_token,
+            token_uri=self._token_uri,
+            client_id=config.GOOGLE_CLIENT_ID,
+            client_secret=config.GOOGLE_CLIENT_SECRET,
+        )
+
+    def _forms_discovery_doc(self) -> dict:
+        if self._discovery_doc is None:
+            self._discovery_doc = json.loads(get_static_doc("forms", "v1"))
+        return self._discovery_doc
+
+
+google_forms = GoogleFormsClients()
@@ -4,8 +4,10 @@ from app.config import config
 from app.routers.models import Member_model
 from app.DB.schema import Members
 from app.DB import members as member_queries
-from app.exceptions import MemberNotFound
-from json import dumps
+from app.exceptions import InvalidCursor, MemberNotFound
+from json import dumps, loads
+import base64
+import binascii
 import jwt
 from datetime import datetime, date, timedelta
 
@@ -216,3 +218,21 @@ def validate_attendance_token(token: str, expected_event_id: int) -> dict:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid attendance token ({type(e).__name__})"
         )
+
+
+def encode_cursor(*values) -> str:
+    """Opaque keyset cursor: the sort-key values of the last row of a page, JSON encoded and base64url'd so clients
+    treat it as a token instead of something to build by hand."""
+    raw = dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = loads(raw)
+    except (binascii.Error, ValueError):
+        raise InvalidCursor()
+    if not isinstance(values, list):
+        raise InvalidCursor()
+    return values
@@ -0,0 +1,196 @@
+"""
+Application-scoped outbound HTTP clients.
+
+Every upstream service gets one pooled ``httpx.AsyncClient`` (and a ``httpx.Client`` for the few sync call sites) so
+TCP/TLS connections are reused across requests instead of being rebuilt per call. Clients are opened in the FastAPI
+lifespan and closed on shutdown; code running outside the app (scripts, tests without a lifespan) gets them lazily.
+
+Each client's transport is wrapped to record per-upstream latency histograms and error counts, exposed through
+``GET /health/http``.
+"""
+
+import asyncio
+import importlib.util
+from enum import Enum
+from threading import Lock
+from time import perf_counter
+from typing import Awaitable, Callable, TypeVar
+
+import httpx
+
+from app.config import config
+from app.exceptions import BadGateway, GatewayTimeout, ServiceUnavailable
+from app.routers.logging import write_log
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class Upstream(str, Enum):
+    CERTIFICATE_API = "certificate_api"
+    FILE_STORAGE = "file_storage"
+    MEMBER_APP = "member_app"
+
+
+class UpstreamMetrics:
+    def __init__(self):
+        self._lock = Lock()
+        self.requests = 0
+        self.errors = 0
+        self.status_classes: dict[str, int] = {}
+        self.latency_sum_ms = 0.0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def observe(self, elapsed_ms: float, status_code: int | None) -> None:
+        bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if elapsed_ms <= bound), len(LATENCY_BUCKETS_MS))
+        with self._lock:
+            self.requests += 1
+            self.latency_sum_ms += elapsed_ms
+            self.latency_buckets[bucket] += 1
+            if status_code is None:
+                self.errors += 1
+            else:
+                status_class = f"{status_code // 100}xx"
+                self.status_classes[status_class] = self.status_classes.get(status_class, 0) + 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            labels = [f"le_{bound}ms" for bound in LATENCY_BUCKETS_MS] + ["le_inf"]
+            cumulative, histogram = 0, {}
+            for label, count in zip(labels, self.latency_buckets):
+                cumulative += count
+                histogram[label] = cumulative
+            return {
+                "requests": self.requests,
+                "transport_errors": self.errors,
+                "status_classes": dict(self.status_classes),
+                "latency_avg_ms": round(self.latency_sum_ms / self.requests, 1) if self.requests else None,
+                "latency_histogram_ms": histogram,
+            }
+
+
+class InstrumentedAsyncTransport(httpx.AsyncBaseTransport):
+    def __init__(self, inner: httpx.AsyncBaseTransport, metrics: UpstreamMetrics):
+        self._inner = inner
+        self._metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = perf_counter()
+        try:
+            response = await self._inner.handle_async_request(request)
+        except Exception:
+            self._metrics.observe((perf_counter() - started) * 1000, None)
+            raise
+        self._metrics.observe((perf_counter() - started) * 1000, response.status_code)
+        return response
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class InstrumentedTransport(httpx.BaseTransport):
+    def __init__(self, inner: httpx.BaseTransport, metrics: UpstreamMetrics):
+        self._inner = inner
+        self._metrics = metrics
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started = perf_counter()
+        try:
+            response = self._inner.handle_request(request)
+        except Exception:
+            self._metrics.observe((perf_counter() - started) * 1000, None)
+            raise
+        self._metrics.observe((perf_counter() - started) * 1000, response.status_code)
+        return response
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+class HttpClientRegistry:
+    def __init__(self):
+        self._lock = Lock()
+        self._async_clients: dict[Upstream, httpx.AsyncClient] = {}
+        self._sync_clients: dict[Upstream, httpx.Client] = {}
+        self._metrics = {upstream: UpstreamMetrics() for upstream in Upstream}
+
+    def _client_options(self, upstream: Upstream) -> tuple[httpx.Limits, httpx.Timeout]:
+        max_connections, max_keepalive, timeout_seconds = config.HTTP_CLIENT_LIMITS[upstream.value]
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        return limits, httpx.Timeout(timeout_seconds, connect=config.HTTP_CONNECT_TIMEOUT_SECONDS)
+
+    def async_client(self, upstream: Upstream) -> httpx.AsyncClient:
+        with self._lock:
+            client = self._async_clients.get(upstream)
+            if client is None or client.is_closed:
+                limits, timeout = self._client_options(upstream)
+                transport = httpx.AsyncHTTPTransport(limits=limits, http2=HTTP2_AVAILABLE)
+                client = httpx.AsyncClient(
+                    transport=InstrumentedAsyncTransport(transport, self._metrics[upstream]),
+                    timeout=timeout,
+                    follow_redirects=True,
+                )
+                self._async_clients[upstream] = client
+            return client
+
+    def sync_client(self, upstream: Upstream) -> httpx.Client:
+        with self._lock:
+            client = self._sync_clients.get(upstream)
+            if client is None or client.is_closed:
+                limits, timeout = self._client_options(upstream)
+                transport = httpx.HTTPTransport(limits=limits, http2=HTTP2_AVAILABLE)
+                client = httpx.Client(
+                    transport=InstrumentedTransport(transport, self._metrics[upstream]),
+                    timeout=timeout,
+                    follow_redirects=True,
+                )
+                self._sync_clients[upstream] = client
+            return client
+
+    def open(self) -> None:
+        for upstream in Upstream:
+            self.async_client(upstream)
+
+    async def aclose(self) -> None:
+        with self._lock:
+            async_clients = list(self._async_clients.values())
+            sync_clients = list(self._sync_clients.values())
+            self._async_clients.clear()
+            self._sync_clients.clear()
+        for client in async_clients:
+            await client.aclose()
+        for client in sync_clients:
+            client.close()
+
+    def stats(self) -> dict:
+        return {
+            "http2": HTTP2_AVAILABLE,
+            "upstreams": {
+                upstream.value: {"limits": config.HTTP_CLIENT_LIMITS[upstream.value], **metrics.snapshot()}
+                for upstream, metrics in self._metrics.items()
+            },
+        }
+
+
+http_clients = HttpClientRegistry()
+
+
+T = TypeVar("T")
+
+
+async def call_with_retries(send: Callable[[], Awaitable[T]]) -> T:
+    """Retry an upstream call on timeouts and 5xx-style failures with linear backoff; re-raises the last error."""
+    for attempt in range(1, config.BLAST_CHUNK_MAX_ATTEMPTS + 1):
+        try:
+            return await send()
+        except (GatewayTimeout, BadGateway, ServiceUnavailable) as e:
+            write_log(f"Chunk attempt [{attempt}/{config.BLAST_CHUNK_MAX_ATTEMPTS}] failed: {e.detail}")
+            if attempt == config.BLAST_CHUNK_MAX_ATTEMPTS:
+                raise
+            await asyncio.sleep(config.BLAST_CHUNK_RETRY_BACKOFF_SECONDS * attempt)
+    raise AssertionError("unreachable")
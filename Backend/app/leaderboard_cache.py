@@ -6,9 +6,8 @@ shared bearer secret. This module centralizes the call so it can be reused by
 the cache router (user-triggered) and by event mutations (auto-trigger).
 """
 
-import httpx
-
 from app.config import config
+from app.http_clients import Upstream, http_clients
 
 
 def reset_leaderboard_cache() -> dict:
@@ -22,13 +21,10 @@ def reset_leaderboard_cache() -> dict:
         httpx.RequestError: on network/connection failures.
     """
     url = f"{config.MEMBER_APP_URL}/api/revalidate"
-    with httpx.Client(timeout=30.0) as client:
-        response = client.post(
-            url,
-            headers={
-                "Authorization": f"Bearer {config.MEMBER_APP_REVALIDATE_SECRET}",
-                "Content-Type": "application/json",
-            },
-        )
-        response.raise_for_status()
-        return response.json()
+    client = http_clients.sync_client(Upstream.MEMBER_APP)
+    response = client.post(
+        url,
+        headers={"Authorization": f"Bearer {config.MEMBER_APP_REVALIDATE_SECRET}", "Content-Type": "application/json"},
+    )
+    response.raise_for_status()
+    return response.json()
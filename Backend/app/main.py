@@ -1,10 +1,15 @@
+import asyncio
 import sentry_sdk
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, RedirectResponse
 from sqlalchemy.exc import OperationalError, TimeoutError as SQLAlchemyTimeoutError
 from starlette.requests import Request
 from app.config import config
+from app.http_clients import http_clients
+from app.form_sync_coalescer import form_syncs
+from app.form_sync_reconciler import form_reconciler
 from app.routers import (
     attendance,
     emails,
@@ -29,10 +34,31 @@ sentry_sdk.init(
     traces_sample_rate=0.2,
 )
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    http_clients.open()
+    blast_scheduler = asyncio.create_task(emails.blast_scheduler_loop())
+    reconciler = asyncio.create_task(
+        form_reconciler.run(submissions.list_reconcilable_forms, submissions.run_reconcile_sync)
+    )
+    yield
+    blast_scheduler.cancel()
+    reconciler.cancel()
+    await emails.cancel_released_blast_jobs()
+    await form_syncs.shutdown()
+    await http_clients.aclose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
-    CORSMiddleware, allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"]
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 
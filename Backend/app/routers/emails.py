@@ -1,19 +1,24 @@
 # region imports
-from fastapi import APIRouter, Depends, HTTPException, Header, Request, status, BackgroundTasks, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Header, Request, Response, status, BackgroundTasks, Query
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.sse import EventSourceResponse, ServerSentEvent
 import time
+from pathlib import Path
 from fastapi_clerk_auth import HTTPAuthorizationCredentials
 from app.DB import events as events_queries, logs as log_queries
 from app.DB import emails as email_queries
 from app.DB import email_templates as email_template_queries
+from app.DB import blasts as blast_queries
+from app.DB import certificates as certificate_queries
+from app.DB import email_bodies as email_body_queries
+from app.DB import email_claims as email_claim_queries
+from app.DB import points as points_queries
 from app.DB.main import SessionLocal
-from enum import Enum
 from urllib.parse import quote
 from app.DB import members as members_queries
 import app.DB.submissions as submissions_queries
-from app.DB.schema import EmailLogsEmailType, Events, EmailLogsFromAddress, MembersGender
-from pydantic import BaseModel, EmailStr, field_validator, model_validator
+from app.DB.schema import EmailBlasts, EmailBlastsStatus, EmailLogsEmailType, EmailLogsFromAddress
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
 from app.config import config
 from app.routers.logging import (
     LogFile,
@@ -23,11 +28,34 @@ from app.routers.logging import (
     write_log_traceback,
     write_log_title,
 )
-from app.helpers import admin_guard, authenticated_guard, get_effective_date, resolve_member
-from app.exceptions import EmptyBody, GatewayTimeout, BadGateway, ServiceUnavailable
+from app.helpers import admin_guard, authenticated_guard, decode_cursor, encode_cursor, resolve_member
+from app.ttl_cache import TTLCache
+from app.blast_scheduler import ScheduleSlice, plan_blast_schedule, projected_completion
+from app.template_engine import ATTENDANCE_DAYS, EVENT_NAME, NAME, POINTS, RANK, CompiledEmail, compile_email
+from app.http_clients import Upstream, call_with_retries, http_clients
+from app.certificates import (
+    CertificateFormat,
+    CertificateGenerationRequest,
+    CertificateLanguage,
+    SimpleEvent,
+    SimpleMember,
+    format_event_date,
+    prerender_event_certificates,
+    request_certificate_file_url,
+)
+from app.certificate_cache import (
+    CertificateCacheWriter,
+    certificate_cache_key,
+    certificate_cache_path,
+    maybe_sweep_certificate_cache,
+    touch_certificate,
+)
+from app.exceptions import EmptyBody, InvalidCursor, GatewayTimeout, BadGateway, KnownHttpException, ServiceUnavailable
+import asyncio
 import httpx
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
+from uuid import uuid4
 from typing import Annotated, Literal, Optional
 # endregion
 
@@ -38,35 +66,6 @@ router = APIRouter()
 # region ============== Data Models ==============
 
 
-class CertificateLanguage(str, Enum):
-    ARABIC = "ar"
-    ENGLISH = "en"
-
-
-class CertificateFormat(str, Enum):
-    PNG = "png"
-    PDF = "pdf"
-
-
-class SimpleMember(BaseModel):
-    name: str
-    email: EmailStr
-    gender: MembersGender
-
-
-class SimpleEvent(BaseModel):
-    name: str
-    date: str
-    official: bool
-
-
-class CertificateGenerationRequest(BaseModel):
-    language: CertificateLanguage
-    format: CertificateFormat
-    event: SimpleEvent
-    member: SimpleMember
-
-
 class EmailLogs(BaseModel):
     id: int
     member_id: int | None
@@ -82,6 +81,8 @@ class CertificateRequest(BaseModel):
     member: SimpleMember
     from_address: EmailLogsFromAddress
     language: CertificateLanguage
+    # pre-rendered file to attach instead of rendering again, when one exists
+    certificate_url: str | None = None
 
 
 class CertificateEventEmailLog(BaseModel):
@@ -150,17 +151,25 @@ class CustomEmailAttachment(BaseModel):
     content_type: str | None = None
 
 
-class CustomEmailRequest(BaseModel):
-    subject: str
-    html_content: str
+class CustomEmailContent(BaseModel):
+    subject: str | None = None
+    html_content: str | None = None
+    template_id: int | None = None
+
+    @model_validator(mode="after")
+    def validate_content(self) -> "CustomEmailContent":
+        if self.template_id is None and (self.subject is None or self.html_content is None):
+            raise ValueError("Provide 'template_id' or both 'subject' and 'html_content'")
+        return self
+
+
+class CustomEmailRequest(CustomEmailContent):
     members: list[ManualCertificateMember]
     attachments: list[CustomEmailAttachment] = []
     language: CertificateLanguage = CertificateLanguage.ARABIC
 
 
-class CustomEmailTestRequest(BaseModel):
-    subject: str
-    html_content: str
+class CustomEmailTestRequest(CustomEmailContent):
     test_recipients: list[ManualCertificateMember]
     attachments: list[CustomEmailAttachment] = []
     language: CertificateLanguage = CertificateLanguage.ARABIC
@@ -192,6 +201,22 @@ class BlastSendRequest(BaseModel):
     order_by: Literal["activity", "alphabetical"]
     guaranteed_recipients: list[BlastGuaranteedRecipient] = []
     attachments: list[BlastAttachment] = []
+    chunk_size: Annotated[int, Field(ge=1, le=500)] | None = None
+
+
+class BlastStatusOut(BaseModel):
+    id: int
+    status: EmailBlastsStatus
+    subject: str
+    total_recipients: int
+    sent_count: int
+    chunk_size: int
+    last_error: str | None
+    schedule: list[dict]
+    next_release_at: datetime | None
+    projected_completion_at: datetime | None
+    created_at: datetime
+    updated_at: datetime
 
 
 class BlastTestRequest(BaseModel):
@@ -232,26 +257,48 @@ async def read_html_body(request: Request) -> str:
     return html_content
 
 
+def blast_api_request(
+    emails: list[str], subject: str, html_content: str, from_address: EmailLogsFromAddress, **fields
+) -> dict:
+    """Request arguments for the upstream ``POST /blasts``. By default it keeps the contract the certificate service
+    has always accepted: recipients and fields as query parameters, the HTML as a ``text/html`` body. With
+    ``BLAST_API_JSON_BODY`` set (once upstream accepts it) everything goes in one JSON body instead, which keeps
+    recipient lists out of the URL."""
+    if config.BLAST_API_JSON_BODY:
+        return {
+            "json": {
+                "emails": emails,
+                "subject": subject,
+                "from_address": from_address.value,
+                **fields,
+                "html_content": html_content,
+            },
+            "headers": {"Content-Type": "application/json"},
+        }
+    params = {"emails": emails, "subject": subject, "from_address": from_address.value}
+    params.update({key: json.dumps(value) if isinstance(value, list) else value for key, value in fields.items()})
+    return {"params": params, "content": html_content, "headers": {"Content-Type": "text/html; charset=utf-8"}}
+
+
 async def call_acceptance_api(
     emails: list[str], subject: str, html_content: str, from_address: EmailLogsFromAddress
 ) -> BlaseResponse:
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                f"{config.CERTIFICATE_API_URL}/blasts",
-                params={"emails": emails, "subject": subject, "from_address": from_address.value},
-                content=html_content,
-                headers={"Content-Type": "text/html; charset=utf-8"},
-            )
-            response.raise_for_status()
-            response_data = BlaseResponse.model_validate(response.json())
-            return response_data
-        except httpx.TimeoutException:
-            raise GatewayTimeout(detail="Acceptance API request timed out")
-        except httpx.HTTPStatusError as e:
-            raise BadGateway(detail=f"Acceptance API returned error: {e.response.status_code}")
-        except httpx.RequestError:
-            raise ServiceUnavailable(detail="Failed to connect to acceptance API")
+    client = http_clients.async_client(Upstream.CERTIFICATE_API)
+    try:
+        response = await client.post(
+            f"{config.CERTIFICATE_API_URL}/blasts",
+            timeout=60.0,
+            **blast_api_request(emails, subject, html_content, from_address),
+        )
+        response.raise_for_status()
+        response_data = BlaseResponse.model_validate(response.json())
+        return response_data
+    except httpx.TimeoutException:
+        raise GatewayTimeout(detail="Acceptance API request timed out")
+    except httpx.HTTPStatusError as e:
+        raise BadGateway(detail=f"Acceptance API returned error: {e.response.status_code}")
+    except httpx.RequestError:
+        raise ServiceUnavailable(detail="Failed to connect to acceptance API")
 
 
 async def call_blast_api(
@@ -262,47 +309,51 @@ async def call_blast_api(
     preview_text: str | None,
     attachments: list[BlastAttachment],
 ) -> BlaseResponse:
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                f"{config.CERTIFICATE_API_URL}/blasts",
-                params={
-                    "emails": emails,
-                    "subject": subject,
-                    "from_address": from_address.value,
-                    "preview_text": preview_text,
-                    "attachments": json.dumps([a.model_dump(mode="json") for a in attachments]),
-                },
-                content=html_content,
-                headers={"Content-Type": "text/html; charset=utf-8"},
-            )
-            response.raise_for_status()
-            response_data = BlaseResponse.model_validate(response.json())
-            return response_data
-        except httpx.TimeoutException:
-            raise GatewayTimeout(detail="Blast API request timed out")
-        except httpx.HTTPStatusError as e:
-            raise BadGateway(detail=f"Blast API returned error: {e.response.status_code}")
-        except httpx.RequestError:
-            raise ServiceUnavailable(detail="Failed to connect to blast API")
+    client = http_clients.async_client(Upstream.CERTIFICATE_API)
+    try:
+        response = await client.post(
+            f"{config.CERTIFICATE_API_URL}/blasts",
+            timeout=60.0,
+            **blast_api_request(
+                emails,
+                subject,
+                html_content,
+                from_address,
+                preview_text=preview_text,
+                attachments=[a.model_dump(mode="json") for a in attachments],
+            ),
+        )
+        response.raise_for_status()
+        response_data = BlaseResponse.model_validate(response.json())
+        return response_data
+    except httpx.TimeoutException:
+        raise GatewayTimeout(detail="Blast API request timed out")
+    except httpx.HTTPStatusError as e:
+        raise BadGateway(detail=f"Blast API returned error: {e.response.status_code}")
+    except httpx.RequestError:
+        raise ServiceUnavailable(detail="Failed to connect to blast API")
 
 
 def call_certificate_api(cert_request: CertificateRequest) -> dict:
-    with httpx.Client(timeout=120.0) as client:
-        try:
-            response = client.post(
-                f"{config.CERTIFICATE_API_URL}/emails/certificate",
-                json=cert_request.model_dump(mode="json"),
-                headers={"Content-Type": "application/json"},
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.TimeoutException:
-            raise GatewayTimeout(detail="Certificate API request timed out")
-        except httpx.HTTPStatusError as e:
-            raise BadGateway(detail=f"Certificate API returned error: {e.response.status_code}")
-        except httpx.RequestError:
-            raise ServiceUnavailable(detail="Failed to connect to certificate API")
+    client = http_clients.sync_client(Upstream.CERTIFICATE_API)
+    try:
+        response = client.post(
+            f"{config.CERTIFICATE_API_URL}/emails/certificate",
+            json=cert_request.model_dump(mode="json", exclude_none=True),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        return response.json()
+    except (httpx.ConnectError, httpx.ConnectTimeout):
+        # the request never reached the API, so nothing can have been sent
+        raise ServiceUnavailable(detail="Failed to connect to certificate API")
+    except httpx.TimeoutException:
+        raise GatewayTimeout(detail="Certificate API request timed out")
+    except httpx.HTTPStatusError as e:
+        raise BadGateway(detail=f"Certificate API returned error: {e.response.status_code}")
+    except httpx.RequestError:
+        # the connection dropped after the request went out; the API may have sent the email anyway
+        raise GatewayTimeout(detail="Certificate API connection dropped before it responded")
 
 
 async def call_custom_email_api(
@@ -315,43 +366,65 @@ async def call_custom_email_api(
     language: CertificateLanguage,
     from_address: EmailLogsFromAddress,
 ) -> dict:
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        try:
-            response = await client.post(
-                f"{config.CERTIFICATE_API_URL}/emails/custom",
-                json={
-                    "from_address": from_address.value,
-                    "recipient_email": recipient_email,
-                    "subject": subject,
-                    "html_content": html_content,
-                    "event": event.model_dump(mode="json"),
-                    "member": member.model_dump(mode="json"),
-                    "language": language.value,
-                    "attachments": [a.model_dump(mode="json") for a in attachments],
-                },
-                headers={"Content-Type": "application/json"},
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.TimeoutException:
-            raise GatewayTimeout(detail="Custom email API request timed out")
-        except httpx.HTTPStatusError as e:
-            raise BadGateway(detail=f"Custom email API returned error: {e.response.status_code}")
-        except httpx.RequestError:
-            raise ServiceUnavailable(detail="Failed to connect to custom email API")
+    client = http_clients.async_client(Upstream.CERTIFICATE_API)
+    try:
+        response = await client.post(
+            f"{config.CERTIFICATE_API_URL}/emails/custom",
+            json={
+                "from_address": from_address.value,
+                "recipient_email": recipient_email,
+                "subject": subject,
+                "html_content": html_content,
+                "event": event.model_dump(mode="json"),
+                "member": member.model_dump(mode="json"),
+                "language": language.value,
+                "attachments": [a.model_dump(mode="json") for a in attachments],
+            },
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        return response.json()
+    except httpx.TimeoutException:
+        raise GatewayTimeout(detail="Custom email API request timed out")
+    except httpx.HTTPStatusError as e:
+        raise BadGateway(detail=f"Custom email API returned error: {e.response.status_code}")
+    except httpx.RequestError:
+        raise ServiceUnavailable(detail="Failed to connect to custom email API")
+
+
+def compile_custom_email(session, request: CustomEmailContent) -> CompiledEmail:
+    if request.template_id is not None:
+        return email_template_queries.get_compiled_template(session, request.template_id)
+    assert request.subject is not None and request.html_content is not None
+    return compile_email(request.subject, request.html_content)
+
+
+def get_template_member_stats(
+    session, compiled: CompiledEmail, member_ids: list[int], event_id: int
+) -> dict[int, dict]:
+    """Points, rank and attendance for every recipient in one query, skipped when the template doesn't use them."""
+    if not compiled.needs_member_stats:
+        return {}
+    start_date, end_date = config.SEMESTERS[config.CURRENT_SEMESTER]
+    return points_queries.get_members_email_stats(session, member_ids, event_id, start_date, end_date)
+
+
+def template_values(member: SimpleMember, event: SimpleEvent, stats: dict | None) -> dict[str, str]:
+    stats = stats or {}
+    return {
+        NAME: member.name,
+        EVENT_NAME: event.name,
+        POINTS: str(int(stats.get("total_points", 0))),
+        RANK: str(stats["member_rank"]) if "member_rank" in stats else "-",
+        ATTENDANCE_DAYS: str(stats.get("attendance_days", 0)),
+    }
 
 
-def _personalize(text: str, name: str, event_name: str) -> str:
-    return text.replace("[Name]", name).replace("[Event Name]", event_name)
+certificate_eligibility_cache = TTLCache(ttl_seconds=config.CERTIFICATE_ELIGIBILITY_CACHE_TTL_SECONDS)
 
 
-def format_event_date(event: Events) -> str:
-    start_effective = get_effective_date(event.start_datetime, config.ATTENDANCE_EARLY_HOURS_THRESHOLD)
-    end_effective = get_effective_date(event.end_datetime, config.ATTENDANCE_EARLY_HOURS_THRESHOLD)
-    days = (end_effective - start_effective).days
-    if days == 0:
-        return start_effective.strftime("%Y-%m-%d")
-    return f"{start_effective.strftime('%Y-%m-%d')} - {end_effective.strftime('%Y-%m-%d')}"
+def invalidate_certificate_eligibility(event_id: int) -> None:
+    certificate_eligibility_cache.invalidate(lambda key: key[1] == event_id)
 
 
 def get_from_address() -> EmailLogsFromAddress:
@@ -380,6 +453,170 @@ def get_total_remaining_send_capacity() -> int:
     return sum(get_send_capacity(addr) for addr in EmailLogsFromAddress)
 
 
+BLAST_ADDRESS_ORDER = (EmailLogsFromAddress.GDG_QASSIM, EmailLogsFromAddress.INFO_KERNELTICS)
+
+
+def pick_blast_address() -> tuple[EmailLogsFromAddress, int] | None:
+    """returns the first address (club address first) that still has send capacity today, with how much is left.
+    `None` means every address has hit its `EMAIL_THRESHOLDS` limit."""
+    for from_addr in BLAST_ADDRESS_ORDER:
+        capacity = get_send_capacity(from_addr)
+        if capacity > 0:
+            return from_addr, capacity
+    return None
+
+
+def plan_blast(session, count: int, chunk_size: int) -> tuple[list[ScheduleSlice], datetime | None]:
+    """Split `count` recipients across addresses and days by `EMAIL_THRESHOLDS`, against the sends already in the
+    rolling 24h usage window. Returns the slices and the projected completion time."""
+    now = datetime.now()
+    thresholds = {
+        addr: config.EMAIL_THRESHOLDS.get(addr.value, config.CLUB_EMAIL_THRESHOLD) for addr in BLAST_ADDRESS_ORDER
+    }
+    recent_sends = email_queries.get_sends_since(session, now - timedelta(days=1))
+    slices = plan_blast_schedule(count, now, thresholds, recent_sends, BLAST_ADDRESS_ORDER, min_slice=chunk_size)
+    return slices, projected_completion(slices, chunk_size, config.BLAST_CHUNK_INTERVAL_SECONDS)
+
+
+async def send_blast_chunk_with_retries(
+    emails: list[str], blast: EmailBlasts, from_addr: EmailLogsFromAddress, attachments: list[BlastAttachment]
+) -> None:
+    await call_with_retries(
+        lambda: call_blast_api(emails, blast.subject, blast.html_content, from_addr, blast.preview_text, attachments)
+    )
+
+
+async def run_blast_job(blast_id: int):
+    """Delivers a blast chunk by chunk starting from its `sent_count` cursor. Each chunk is picked against the
+    remaining daily capacity of one address, retried on upstream errors, and recorded as its own email log (which
+    is what shows up in the email log stream as progress). Running out of capacity re-plans the rest across days
+    and schedules the blast for its next slice; running out of retries pauses it. Either way it continues later
+    from the same cursor."""
+    with LogFile("send blast [JOB]"), SessionLocal() as session:
+        try:
+            if not blast_queries.claim_blast(session, blast_id):
+                write_log(f"Blast [{blast_id}] is already sending or finished, skipping")
+                return
+            session.commit()
+
+            blast = blast_queries.get_blast_by_id(session, blast_id)
+            recipients: list[dict] = blast.recipients
+            guaranteed_emails = set(blast.guaranteed_emails or [])
+            attachments = [BlastAttachment.model_validate(a) for a in blast.attachments or []]
+            html_hash = email_body_queries.store_email_body(session, blast.html_content)
+            write_log_title(
+                f"Sending blast [{blast.id}] to [{len(recipients) - blast.sent_count}] remaining recipients "
+                f"in chunks of [{blast.chunk_size}]"
+            )
+
+            while blast.sent_count < len(recipients):
+                picked = pick_blast_address()
+                if picked is None:
+                    # re-plan from real usage: sends made outside this blast may have moved the schedule
+                    slices, completion = plan_blast(session, len(recipients) - blast.sent_count, blast.chunk_size)
+                    next_release_at = max(
+                        slices[0].release_at,
+                        datetime.now() + timedelta(seconds=config.BLAST_SCHEDULER_INTERVAL_SECONDS),
+                    )
+                    write_log(
+                        f"Daily send capacity exhausted at [{blast.sent_count}/{len(recipients)}], "
+                        f"next slice at [{next_release_at:%Y-%m-%d %H:%M}], projected completion [{completion}]"
+                    )
+                    blast_queries.set_blast_plan(session, blast, [s.to_json() for s in slices], completion)
+                    blast_queries.schedule_blast(session, blast, next_release_at)
+                    session.commit()
+                    return
+
+                from_addr, capacity = picked
+                chunk = recipients[blast.sent_count : blast.sent_count + min(blast.chunk_size, capacity)]
+                offset = blast.sent_count
+                emails = [r["email"] for r in chunk]
+                write_log(f"Sending chunk at [{offset}/{len(recipients)}] of [{len(emails)}] via [{from_addr.value}]")
+
+                try:
+                    await send_blast_chunk_with_retries(emails, blast, from_addr, attachments)
+                except KnownHttpException as e:
+                    write_log(f"Giving up on chunk at [{offset}], pausing")
+                    blast_queries.set_blast_status(session, blast, EmailBlastsStatus.PAUSED, str(e.detail))
+                    session.commit()
+                    return
+
+                email_queries.create_email_log(
+                    session,
+                    sent_by=blast.sent_by,
+                    from_address=from_addr,
+                    email_type=EmailLogsEmailType.BLAST,
+                    recipient_count=len(emails),
+                    data={
+                        "blast_id": blast.id,
+                        "offset": offset,
+                        "sent_count": offset + len(emails),
+                        "total_recipients": len(recipients),
+                        "subject": blast.subject,
+                        "html_hash": html_hash,
+                        "preview_text": blast.preview_text,
+                        "order_by": blast.order_by,
+                        "requested_count": blast.requested_count,
+                        "guaranteed_emails": [e for e in emails if e in guaranteed_emails],
+                        **email_queries.compact_recipients(chunk),
+                        "attachments": [{"filename": a.filename, "url": a.url} for a in attachments],
+                    },
+                )
+                blast_queries.record_chunk_sent(session, blast, len(emails))
+                session.commit()
+
+                if blast.sent_count < len(recipients):
+                    await asyncio.sleep(config.BLAST_CHUNK_INTERVAL_SECONDS)
+
+            blast_queries.set_blast_status(session, blast, EmailBlastsStatus.COMPLETED)
+            session.commit()
+            write_log(f"Blast [{blast.id}] completed, [{blast.sent_count}] recipients sent")
+
+        except Exception as e:
+            session.rollback()
+            write_log_exception(e)
+            write_log_traceback()
+            blast = blast_queries.get_blast_by_id(session, blast_id)
+            blast_queries.set_blast_status(session, blast, EmailBlastsStatus.FAILED, str(e))
+            session.commit()
+
+
+# blast jobs started by the scheduler; kept so they aren't garbage collected mid-send and can be cancelled on shutdown
+released_blast_jobs: set[asyncio.Task] = set()
+
+
+async def release_scheduled_blasts() -> None:
+    """Start a `run_blast_job` task for every scheduled blast whose next slice is due, so one long blast doesn't hold
+    back the others or the next poll. `claim_blast` keeps this safe when several workers (or a still-running job of
+    the same blast) poll at once."""
+    with SessionLocal() as session:
+        due = blast_queries.get_due_blast_ids(session, datetime.now())
+    for blast_id in due:
+        task = asyncio.create_task(run_blast_job(blast_id))
+        released_blast_jobs.add(task)
+        task.add_done_callback(released_blast_jobs.discard)
+
+
+async def cancel_released_blast_jobs() -> None:
+    """Cancel the scheduler's in-flight blast jobs on shutdown. An interrupted blast stays SENDING from its last
+    committed chunk, and once that goes stale the next worker's scheduler claim resumes it."""
+    tasks = list(released_blast_jobs)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def blast_scheduler_loop() -> None:
+    while True:
+        try:
+            await release_scheduled_blasts()
+        except Exception as e:
+            with LogFile("blast scheduler"):
+                write_log_exception(e)
+                write_log_traceback()
+        await asyncio.sleep(config.BLAST_SCHEDULER_INTERVAL_SECONDS)
+
+
 # endregion
 
 # region ============== API Endpoints ==============
@@ -392,38 +629,72 @@ def send_certificates(
     background_tasks: BackgroundTasks,
 ):
     # Background task definition
-    def send_certificates_by_event_id(event: Events, attendance: list, date_str: str, sent_by_id: int):
+    def send_certificates_by_event_id(date_str: str, sent_by_id: int):
         with LogFile("send certificates"), SessionLocal() as session:
             try:
                 event = events_queries.get_event_by_id(session, event_id)
                 simple_event = SimpleEvent(name=event.name, date=date_str, official=bool(event.is_official))
-                write_log(f"Processing certificate sending for event [{event.name}] with [{len(attendance)}] attendees")
 
-                already_sent = email_queries.get_members_who_received_certificate(session, event_id)
-                attendance = [
-                    record for record in attendance if record.Member.id not in {member["id"] for member in already_sent}
-                ]
+                # re-query at run time: anyone sent a certificate since the request was queued is already excluded
+                eligible = email_queries.get_certificate_eligible_members(session, event)
+                prerendered = certificate_queries.get_certificate_urls_by_event(
+                    session, event_id, CertificateLanguage.ARABIC.value, CertificateFormat.PDF.value
+                )
                 write_log(
-                    f"Filtered out [{len(already_sent)}] attendees who already received certificates, remaining attendees to process: [{len(attendance)}]"
+                    f"Processing certificate sending for event [{event.name}], [{len(eligible)}] attendees have not received one yet"
                 )
-                for attendanceRecord in attendance:
-                    member = attendanceRecord.Member
-                    simple_member = SimpleMember(name=member.name, email=member.email, gender=member.gender)
-                    write_log(f"Sending certificate for member [{member.name}] with email [{member.email}]")
+                claim_token = uuid4().hex
+                claim = {"event_id": event_id, "email_type": EmailLogsEmailType.EVENT_CERTIFICATE, "token": claim_token}
+                failed = 0
+                for member in eligible:
+                    # the claim is committed before the API call, so a concurrent or retried job skips this member
+                    if not email_claim_queries.claim_email_send(session, member_id=member["id"], **claim):
+                        session.commit()
+                        write_log(f"Certificate for member [{member['name']}] is claimed by another job, skipping")
+                        continue
+                    session.commit()
+
+                    simple_member = SimpleMember(name=member["name"], email=member["email"], gender=member["gender"])
+                    write_log(f"Sending certificate for member [{member['name']}] with email [{member['email']}]")
+                    generation_request = CertificateGenerationRequest(
+                        language=CertificateLanguage.ARABIC,
+                        format=CertificateFormat.PDF,
+                        event=simple_event,
+                        member=simple_member,
+                    )
                     cert_request = CertificateRequest(
                         event=simple_event,
                         member=simple_member,
                         from_address=get_from_address(),
                         language=CertificateLanguage.ARABIC,
+                        certificate_url=prerendered.get(
+                            certificate_cache_key(generation_request.model_dump(mode="json"))
+                        ),
                     )
-                    response_data = call_certificate_api(cert_request)
+                    try:
+                        call_certificate_api(cert_request)
+                    except (BadGateway, ServiceUnavailable) as e:
+                        # the API answered with an error or was never reached, so nothing was sent: free the member
+                        # for the next run
+                        email_claim_queries.release_email_send(session, member_id=member["id"], **claim)
+                        session.commit()
+                        write_log(f"Certificate for member [{member['name']}] was not sent: {e.detail}")
+                        failed += 1
+                        continue
+                    except Exception as e:
+                        # a read timeout (or a dropped response) may still have sent the email; keep the claim so only
+                        # a run after it goes stale retries this member, instead of possibly sending it twice
+                        write_log(f"Certificate for member [{member['name']}] may have been sent, keeping its claim")
+                        write_log_exception(e)
+                        failed += 1
+                        continue
                     write_log(f"Certificate API responded with 200 OK")
-                    email_queries.create_email_log(
+                    email_log = email_queries.create_email_log(
                         session,
                         sent_by=sent_by_id,
                         from_address=cert_request.from_address,
                         email_type=EmailLogsEmailType.EVENT_CERTIFICATE,
-                        member_id=member.id,
+                        member_id=member["id"],
                         event_id=event_id,
                         recipient_count=1,
                         data={
@@ -431,7 +702,13 @@ def send_certificates(
                             "event": simple_event.model_dump(mode="json"),
                         },
                     )
+                    email_claim_queries.mark_email_sent(
+                        session, member_id=member["id"], email_log_id=email_log.id, **claim
+                    )
                     session.commit()
+                    invalidate_certificate_eligibility(event_id)
+                if failed:
+                    write_log(f"[{failed}] of [{len(eligible)}] certificates failed to send")
 
             # TODO - These exception don't make sense this is a background task
             # we generally need better job management (job start message, job failed message, job finished message) in the email
@@ -454,17 +731,17 @@ def send_certificates(
         event = events_queries.get_event_by_id(session, event_id)
         write_log(f"Found event: [{event.name}]")
 
-        attendance = log_queries.get_event_attendance(session, event_id, "exclusive_all")
-        write_log(f"Found [{len(attendance)}] attendees who attended all days for event [{event.name}]")
+        eligible = email_queries.get_certificate_eligible_members(session, event)
+        write_log(f"Found [{len(eligible)}] attendees who attended all days and have no certificate yet")
 
         date_str = format_event_date(event)
         write_log(f"Event date formatted as: [{date_str}]")
 
         requesting_member = resolve_member(session, credentials)
-        background_tasks.add_task(send_certificates_by_event_id, event, attendance, date_str, requesting_member.id)
+        background_tasks.add_task(send_certificates_by_event_id, date_str, requesting_member.id)
 
         return {
-            "message": f"Certificate generation initiated for event [{event.name}] with [{len(attendance)}] attendees."
+            "message": f"Certificate generation initiated for event [{event.name}] with [{len(eligible)}] attendees."
         }
 
 
@@ -568,12 +845,19 @@ def send_custom_email(
                 write_log(
                     f"Processing custom email for event [{simple_event.name}] with [{len(request_data.members)}] recipients"
                 )
+                compiled = compile_custom_email(session, request_data)
+                # the template is logged once, not per recipient
+                html_hash = email_body_queries.store_email_body(session, compiled.html_content.text)
+                member_stats = get_template_member_stats(
+                    session, compiled, [m.member_id for m in request_data.members if m.member_id], event_id
+                )
 
                 for member_item in request_data.members:
                     simple_member, member_id = _resolve_member(member_item, session)
                     write_log(f"Sending custom email to [{simple_member.name}] at [{simple_member.email}]")
-                    subject = _personalize(request_data.subject, simple_member.name, simple_event.name)
-                    html_content = _personalize(request_data.html_content, simple_member.name, simple_event.name)
+                    subject, html_content = compiled.render(
+                        template_values(simple_member, simple_event, member_stats.get(member_id))
+                    )
                     await call_custom_email_api(
                         simple_member.email,
                         subject,
@@ -594,8 +878,8 @@ def send_custom_email(
                         event_id=event_id,
                         recipient_count=1,
                         data={
-                            "subject": request_data.subject,
-                            "html_content": request_data.html_content,
+                            "subject": compiled.subject.text,
+                            "html_hash": html_hash,
                             "member": simple_member.model_dump(mode="json"),
                             "certificate_attached": True,
                             "attachments": [
@@ -621,7 +905,7 @@ def send_custom_email(
     with LogFile("custom email [JOB]"), SessionLocal() as session:
         event = events_queries.get_event_by_id(session, event_id)
         simple_event = SimpleEvent(name=event.name, date=format_event_date(event), official=bool(event.is_official))
-        requesting_member = members_queries.get_member_by_uni_id(session, get_uni_id_from_credentials(credentials))
+        requesting_member = resolve_member(session, credentials)
         background_tasks.add_task(
             send_custom_email_job, request.model_copy(deep=True), simple_event, event_id, requesting_member.id
         )
@@ -645,11 +929,17 @@ async def send_custom_email_test(
             simple_event = SimpleEvent(name=event.name, date=format_event_date(event), official=bool(event.is_official))
             from_address = get_from_address()
 
+            compiled = compile_custom_email(session, request)
+            member_stats = get_template_member_stats(
+                session, compiled, [m.member_id for m in request.test_recipients if m.member_id], event_id
+            )
+
             emails: list[str] = []
             for member_item in request.test_recipients:
-                simple_member, _ = _resolve_member(member_item, session)
-                subject = _personalize(request.subject, simple_member.name, simple_event.name)
-                html_content = _personalize(request.html_content, simple_member.name, simple_event.name)
+                simple_member, member_id = _resolve_member(member_item, session)
+                subject, html_content = compiled.render(
+                    template_values(simple_member, simple_event, member_stats.get(member_id))
+                )
                 write_log(f"Sending test custom email to [{simple_member.name}] at [{simple_member.email}]")
                 await call_custom_email_api(
                     simple_member.email,
@@ -681,20 +971,19 @@ async def send_custom_email_test(
 def get_certificate_eligible_count(
     event_id: int, credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)]
 ):
-    with SessionLocal() as session:
-        event = events_queries.get_event_by_id(session, event_id)
-        attendance = log_queries.get_event_attendance(session, event_id, "exclusive_all")
-        already_sent = email_queries.get_members_who_received_certificate(session, event_id)
-        already_sent_ids = {m["id"] for m in already_sent}
-        eligible = [r for r in attendance if r.Member.id not in already_sent_ids]
-        return {
-            "eligible_count": len(eligible),
-            "eligible_members": [
-                {"id": r.Member.id, "name": r.Member.name, "email": r.Member.email, "gender": r.Member.gender}
-                for r in eligible
-            ],
-            "sent_count": len(already_sent),
-        }
+    def compute():
+        with SessionLocal() as session:
+            event = events_queries.get_event_by_id(session, event_id)
+            eligible = email_queries.get_certificate_eligible_members(session, event)
+            return {
+                "eligible_count": len(eligible),
+                "eligible_members": [
+                    {"id": m["id"], "name": m["name"], "email": m["email"], "gender": m["gender"]} for m in eligible
+                ],
+                "sent_count": email_queries.count_certificate_recipients(session, event_id),
+            }
+
+    return certificate_eligibility_cache.get_or_set(("eligible", event_id), compute)
 
 
 @router.get(
@@ -781,15 +1070,32 @@ def get_email_logs_by_member_id(
         return logs
 
 
+def email_log_cursor(row) -> str:
+    return encode_cursor(row["sent_at"].isoformat(), row["id"])
+
+
+def parse_email_log_cursor(cursor: str) -> tuple[datetime, int]:
+    values = decode_cursor(cursor)
+    try:
+        sent_at, log_id = values
+        return datetime.fromisoformat(sent_at), int(log_id)
+    except (TypeError, ValueError):
+        raise InvalidCursor()
+
+
 @router.get("/logs/enriched", status_code=status.HTTP_200_OK, response_model=list[EnrichedEmailLog])
 def get_enriched_email_logs(
+    response: Response,
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)],
     email_type: Annotated[Optional[EmailLogsEmailType], Query(description="Filter by email type")] = None,
     event_id: Annotated[Optional[int], Query(description="Filter by event ID")] = None,
     member_id: Annotated[Optional[int], Query(description="Filter by member ID")] = None,
     start_date: Annotated[Optional[datetime], Query(description="Filter from date")] = None,
     end_date: Annotated[Optional[datetime], Query(description="Filter to date")] = None,
-    offset: Annotated[int, Query(description="Number of logs to skip")] = 0,
+    cursor: Annotated[
+        Optional[str], Query(description="Opaque cursor from the previous page's X-Next-Cursor header")
+    ] = None,
+    offset: Annotated[int, Query(description="Number of logs to skip (prefer `cursor` for deep pages)")] = 0,
     limit: Annotated[int, Query(description="Maximum number of logs to return")] = 100,
 ):
     with SessionLocal() as session:
@@ -800,25 +1106,45 @@ def get_enriched_email_logs(
             member_id=member_id,
             start_date=start_date,
             end_date=end_date,
+            after=parse_email_log_cursor(cursor) if cursor else None,
             offset=offset,
             limit=limit,
         )
+        if rows and len(rows) == limit:
+            response.headers["X-Next-Cursor"] = email_log_cursor(rows[-1])
         return [EnrichedEmailLog.model_validate(dict(r)) for r in rows]
 
 
+@router.get("/logs/{log_id:int}/details", status_code=status.HTTP_200_OK, response_model=EnrichedEmailLog)
+def get_email_log_details(log_id: int, credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)]):
+    with SessionLocal() as session:
+        row = dict(email_queries.get_enriched_email_log_by_id(session, log_id))
+        row["data"] = email_queries.hydrate_email_log_data(session, row["email_type"], row["data"])
+        return EnrichedEmailLog.model_validate(row)
+
+
 @router.get("/logs/enriched/stream", status_code=status.HTTP_200_OK, response_class=EventSourceResponse)
 def stream_enriched_email_logs(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)],
-    last_event_id: Annotated[int | None, Header()] = None,
+    last_event_id: Annotated[str | None, Header()] = None,
     email_type: Annotated[Optional[EmailLogsEmailType], Query(description="Filter by email type")] = None,
     event_id: Annotated[Optional[int], Query(description="Filter by event ID")] = None,
     member_id: Annotated[Optional[int], Query(description="Filter by member ID")] = None,
     start_date: Annotated[Optional[datetime], Query(description="Filter from date")] = None,
     end_date: Annotated[Optional[datetime], Query(description="Filter to date")] = None,
 ):
-    last_id = int(last_event_id) if last_event_id else 0
+    # event ids are (sent_at, id) cursors, the same keyset the query orders by, so a reconnect resumes exactly
+    # where the stream left off; a bare numeric id is from a client connected before cursors were introduced
+    last_key: tuple[datetime, int] | None = None
+    last_cursor = ""
+    if last_event_id and last_event_id.isdigit():
+        with SessionLocal() as session:
+            last_key = email_queries.get_email_log_sort_key(session, int(last_event_id))
+    elif last_event_id:
+        last_key = parse_email_log_cursor(last_event_id)
+        last_cursor = last_event_id
 
-    def get_batch(after_id: int, batch_size: int = 50, order_asc: bool = False):
+    def get_batch(after: tuple[datetime, int] | None, batch_size: int):
         with SessionLocal() as session:
             return email_queries.get_enriched_email_logs(
                 session,
@@ -827,31 +1153,29 @@ def stream_enriched_email_logs(
                 member_id=member_id,
                 start_date=start_date,
                 end_date=end_date,
-                after_id=after_id,
+                after=after,
                 limit=batch_size,
-                order_asc=order_asc,
+                order_asc=True,
             )
 
-    if last_id == 0:
-        initial = get_batch(0, 200, order_asc=True)
+    if last_key is None:
+        initial = get_batch(None, 200)
         if not initial:
-            yield ServerSentEvent(data=json.dumps({"message": "No logs found"}), event="no_logs", id=str(last_id))
+            yield ServerSentEvent(data=json.dumps({"message": "No logs found"}), event="no_logs", id=last_cursor)
         for row in initial:
             log = EnrichedEmailLog.model_validate(dict(row))
-            yield ServerSentEvent(data=log.model_dump(mode="json"), event="log", id=str(log.id))
-            if log.id > last_id:
-                last_id = log.id
+            last_key, last_cursor = (row["sent_at"], row["id"]), email_log_cursor(row)
+            yield ServerSentEvent(data=log.model_dump(mode="json"), event="log", id=last_cursor)
 
     while True:
-        batch = get_batch(last_id, 50, order_asc=True)
+        batch = get_batch(last_key, 50)
         if not batch:
-            yield ServerSentEvent(data=json.dumps({"message": "No new logs"}), event="no_logs", id=str(last_id))
+            yield ServerSentEvent(data=json.dumps({"message": "No new logs"}), event="no_logs", id=last_cursor)
         else:
             for row in batch:
                 log = EnrichedEmailLog.model_validate(dict(row))
-                yield ServerSentEvent(data=log.model_dump(mode="json"), event="log", id=str(log.id))
-                if log.id > last_id:
-                    last_id = log.id
+                last_key, last_cursor = (row["sent_at"], row["id"]), email_log_cursor(row)
+                yield ServerSentEvent(data=log.model_dump(mode="json"), event="log", id=last_cursor)
         time.sleep(1.5)
 
 
@@ -875,67 +1199,148 @@ def get_dashboard_stats(
         return DashboardStats(addresses=addresses, by_type=by_type, total_24h=total_24h)
 
 
-@router.post("/download-certificate/{event_id:int}", status_code=status.HTTP_200_OK)
-def download_certificate(
+async def open_certificate_file(file_url: str) -> httpx.Response:
+    client = http_clients.async_client(Upstream.FILE_STORAGE)
+    try:
+        response = await client.send(client.build_request("GET", file_url), stream=True)
+        response.raise_for_status()
+        return response
+    except httpx.TimeoutException:
+        raise GatewayTimeout(detail="Certificate file download timed out")
+    except httpx.HTTPStatusError as e:
+        await e.response.aclose()
+        raise BadGateway(detail=f"Certificate file download returned error: {e.response.status_code}")
+    except httpx.RequestError:
+        raise ServiceUnavailable(detail="Failed to connect to certificate file storage")
+
+
+async def stream_certificate_into_cache(upstream: httpx.Response, path: Path):
+    """Yield the upstream file in chunks while teeing it into the disk cache. The cache entry is only committed once
+    the whole body arrived (and matches the upstream ``Content-Length`` when one was sent). A content-encoded body
+    is decoded here, so its wire ``Content-Length`` can't be compared and only a clean end of stream counts."""
+    expected_length = None if "content-encoding" in upstream.headers else upstream.headers.get("content-length")
+    writer = CertificateCacheWriter(path)
+    try:
+        async for chunk in upstream.aiter_bytes(config.CERTIFICATE_DOWNLOAD_CHUNK_SIZE):
+            writer.write(chunk)
+            yield chunk
+        if expected_length is None or writer.bytes_written == int(expected_length):
+            writer.commit()
+            await asyncio.to_thread(maybe_sweep_certificate_cache)
+    finally:
+        writer.discard()
+        await upstream.aclose()
+
+
+@router.post("/certificates/{event_id:int}/prerender", status_code=status.HTTP_200_OK)
+def prerender_certificates(
     event_id: int,
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(authenticated_guard)],
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)],
+    background_tasks: BackgroundTasks,
     lang: Annotated[CertificateLanguage, Query(description="Certificate language")] = CertificateLanguage.ARABIC,
     format: Annotated[CertificateFormat, Query(description="Certificate format")] = CertificateFormat.PDF,
 ):
     with SessionLocal() as session:
         event = events_queries.get_event_by_id(session, event_id)
+    background_tasks.add_task(prerender_event_certificates, event_id, lang, format)
+    return {"message": f"Certificate pre-rendering queued for event [{event.name}]."}
 
-        member = resolve_member(session, credentials)
 
-        attendance = log_queries.get_event_attendance(session, event_id, "exclusive_all")
-        attended_member_ids = {r.Member.id for r in attendance}
+@router.get("/certificates/{event_id:int}/prerender", status_code=status.HTTP_200_OK)
+def get_prerender_progress(event_id: int, credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)]):
+    with SessionLocal() as session:
+        event = events_queries.get_event_by_id(session, event_id)
+        attendees = len(log_queries.get_full_attendance_members(session, event))
+        rendered = certificate_queries.count_certificates_by_event(session, event_id)
+    return {"attendees": attendees, "rendered": rendered}
 
-        if member.id not in attended_member_ids:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN, detail="You did not attend all days of this event"
-            )
 
-        simple_event = SimpleEvent(name=event.name, date=format_event_date(event), official=bool(event.is_official))
-        simple_member = SimpleMember(name=member.name, email=member.email, gender=member.gender)  # type: ignore
+@router.post("/download-certificate/{event_id:int}", status_code=status.HTTP_200_OK)
+async def download_certificate(
+    event_id: int,
+    request: Request,
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(authenticated_guard)],
+    lang: Annotated[CertificateLanguage, Query(description="Certificate language")] = CertificateLanguage.ARABIC,
+    format: Annotated[CertificateFormat, Query(description="Certificate format")] = CertificateFormat.PDF,
+):
+    # the endpoint is async for the streaming below; its blocking DB work runs in worker threads so a download
+    # never stalls the event loop
+    def load_download():
+        with SessionLocal() as session:
+            event = events_queries.get_event_by_id(session, event_id)
 
-        cert_request = CertificateGenerationRequest(
-            language=lang, format=format, event=simple_event, member=simple_member
-        )
+            member = resolve_member(session, credentials)
 
-        with httpx.Client(timeout=120.0) as client:
-            try:
-                response = client.post(
-                    f"{config.CERTIFICATE_API_URL}/generations/certificate",
-                    json=cert_request.model_dump(mode="json"),
-                    headers={"Content-Type": "application/json"},
+            attended_all_days = certificate_eligibility_cache.get_or_set(
+                ("attended", event_id, member.id), lambda: log_queries.has_attended_all_days(session, event, member.id)
+            )
+            if not attended_all_days:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN, detail="You did not attend all days of this event"
                 )
-                response.raise_for_status()
-                data = response.json()
-            except httpx.TimeoutException:
-                raise GatewayTimeout(detail="Certificate generation API request timed out")
-            except httpx.HTTPStatusError as e:
-                raise BadGateway(detail=f"Certificate generation API returned error: {e.response.status_code}")
-            except httpx.RequestError:
-                raise ServiceUnavailable(detail="Failed to connect to certificate generation API")
-
-        file_url = data if isinstance(data, str) else data.get("url", data.get("key", str(data)))
-        filename = f"certificate-{event.name}-{member.name}.{format.value}"
-
-        file_response = httpx.get(file_url, timeout=60.0, follow_redirects=True)
-        file_response.raise_for_status()
-
-        content_type = file_response.headers.get(
-            "content-type", f"image/{format.value}" if format == CertificateFormat.PNG else "application/pdf"
-        )
 
-        encoded_filename = quote(filename)
-        return StreamingResponse(
-            iter([file_response.content]),
-            media_type=content_type,
-            headers={
-                "Content-Disposition": f"attachment; filename=\"{encoded_filename}\"; filename*=UTF-8''{encoded_filename}"
-            },
-        )
+            simple_event = SimpleEvent(name=event.name, date=format_event_date(event), official=bool(event.is_official))
+            simple_member = SimpleMember(name=member.name, email=member.email, gender=member.gender)  # type: ignore
+            filename = f"certificate-{event.name}-{member.name}.{format.value}"
+            prerendered = certificate_queries.get_certificate(session, event_id, member.id, lang.value, format.value)
+            return simple_event, simple_member, filename, member.id, prerendered
+
+    def save_file_url(file_url: str):
+        with SessionLocal() as session:
+            certificate_queries.upsert_certificate(
+                session,
+                event_id=event_id,
+                member_id=member_id,
+                language=lang.value,
+                format=format.value,
+                cache_key=cache_key,
+                file_url=file_url,
+            )
+            session.commit()
+
+    simple_event, simple_member, filename, member_id, prerendered = await asyncio.to_thread(load_download)
+
+    cert_request = CertificateGenerationRequest(language=lang, format=format, event=simple_event, member=simple_member)
+    cache_key = certificate_cache_key(cert_request.model_dump(mode="json"))
+    cache_path = certificate_cache_path(cache_key, format.value)
+
+    media_type = f"image/{format.value}" if format == CertificateFormat.PNG else "application/pdf"
+    encoded_filename = quote(filename)
+    headers = {
+        "Content-Disposition": f"attachment; filename=\"{encoded_filename}\"; filename*=UTF-8''{encoded_filename}"
+    }
+
+    if not cache_path.exists():
+        upstream = None
+        if prerendered is not None and prerendered.cache_key == cache_key:
+            try:
+                upstream = await open_certificate_file(prerendered.file_url)
+            except KnownHttpException:
+                # the stored file is gone or expired; render it again below
+                upstream = None
+        if upstream is None:
+            file_url = await request_certificate_file_url(cert_request)
+            await asyncio.to_thread(save_file_url, file_url)
+            upstream = await open_certificate_file(file_url)
+        body = stream_certificate_into_cache(upstream, cache_path)
+
+        if "range" not in request.headers:
+            # first download: pass bytes straight through while they're written to the cache
+            if "content-length" in upstream.headers and "content-encoding" not in upstream.headers:
+                headers["Content-Length"] = upstream.headers["content-length"]
+            headers["Accept-Ranges"] = "bytes"
+            return StreamingResponse(body, media_type=media_type, headers=headers)
+
+        # a range can only be served from a complete file, so fill the cache before answering
+        async for _ in body:
+            pass
+        if not cache_path.exists():
+            raise BadGateway(detail="Certificate file download was incomplete")
+    else:
+        touch_certificate(cache_path)
+
+    # FileResponse handles Content-Length and Range / If-Range for us
+    return FileResponse(cache_path, media_type=media_type, headers=headers)
 
 
 # endregion
@@ -943,68 +1348,126 @@ def download_certificate(
 # region ============== Acceptance API Endpoints ==============
 
 
+async def run_acceptance_job(event_id: int, subject: str, html_content: str, sent_by_id: int):
+    """Sends acceptance emails to the event's accepted-not-invited submissions in chunks. A chunk's submissions are
+    marked invited only after the upstream accepted it, so a failed or skipped chunk stays pending and is picked up
+    by the next run. Each sent chunk is its own email log, which is what the log stream shows as progress."""
+    with LogFile("send acceptance blasts [JOB]"), submissions_queries.acceptance_send_lock(event_id) as acquired:
+        if not acquired:
+            write_log(f"Acceptance emails for event [{event_id}] are already being sent, skipping")
+            return
+
+        with SessionLocal() as session:
+            try:
+                event = events_queries.get_event_by_id(session, event_id)
+                submissions = submissions_queries.get_accepted_not_invited_by_event(session, event_id)
+                pending = [sub for sub in submissions if sub.email]
+                write_log_title(
+                    f"Sending acceptance emails for event [{event.name}] to [{len(pending)}] recipients "
+                    f"in chunks of [{config.ACCEPTANCE_CHUNK_SIZE}]"
+                )
+                if len(pending) < len(submissions):
+                    write_log(f"Skipping [{len(submissions) - len(pending)}] submissions without an email")
+
+                html_hash = email_body_queries.store_email_body(session, html_content)
+                event_snapshot = {
+                    "name": event.name,
+                    "date": format_event_date(event),
+                    "official": bool(event.is_official),
+                }
+                sent = failed = 0
+                offset = 0
+                while offset < len(pending):
+                    picked = pick_blast_address()
+                    if picked is None:
+                        write_log(f"Daily send capacity exhausted, stopping at [{offset}/{len(pending)}]")
+                        break
+
+                    from_addr, capacity = picked
+                    chunk = pending[offset : offset + min(config.ACCEPTANCE_CHUNK_SIZE, capacity)]
+                    emails = [sub.email for sub in chunk]
+                    write_log(f"Sending chunk at [{offset}/{len(pending)}] of [{len(chunk)}] via [{from_addr.value}]")
+                    offset += len(chunk)
+
+                    try:
+                        await call_with_retries(lambda: call_acceptance_api(emails, subject, html_content, from_addr))
+                    except KnownHttpException as e:
+                        write_log(f"Giving up on chunk, leaving [{len(chunk)}] submissions not invited: {e.detail}")
+                        failed += len(chunk)
+                        continue
+
+                    email_queries.create_email_log(
+                        session,
+                        sent_by=sent_by_id,
+                        from_address=from_addr,
+                        email_type=EmailLogsEmailType.ACCEPTANCE,
+                        event_id=event_id,
+                        recipient_count=len(chunk),
+                        data={
+                            "subject": subject,
+                            "html_hash": html_hash,
+                            "event": event_snapshot,
+                            **email_queries.compact_recipients(
+                                [{"member_id": sub.id, "name": sub.name, "email": sub.email} for sub in chunk]
+                            ),
+                        },
+                    )
+                    submissions_queries.mark_submissions_as_invited(session, [sub.submission_id for sub in chunk])
+                    session.commit()
+                    sent += len(chunk)
+
+                    if offset < len(pending):
+                        await asyncio.sleep(config.BLAST_CHUNK_INTERVAL_SECONDS)
+
+                write_log(
+                    f"Acceptance job finished: [{sent}] sent, [{failed}] failed, [{len(pending) - sent}] still pending"
+                )
+            except Exception as e:
+                session.rollback()
+                write_log_exception(e)
+                write_log_traceback()
+
+
 @router.post("/acceptance/blasts/{event_id:int}", status_code=status.HTTP_200_OK)
 async def send_acceptance_blasts(
     event_id: int,
     request: Request,
     subject: Annotated[str, Query(description="Email subject line")],
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)],
+    background_tasks: BackgroundTasks,
 ):
     with LogFile("send acceptance blasts"), SessionLocal() as session:
-        try:
-            write_log_title(f"Sending acceptance blasts for event [{event_id}]")
-            requesting_member = resolve_member(session, credentials)
-
-            event = events_queries.get_event_by_id(session, event_id)
-
-            html_content = await read_html_body(request)
-            write_log(f"Received HTML body with {len(html_content)} characters")
+        write_log_title(f"Queueing acceptance emails for event [{event_id}]")
+        requesting_member = resolve_member(session, credentials)
 
-            submissions = submissions_queries.get_accepted_not_invited_by_event(session, event.id)
-            emails = [sub.email for sub in submissions if sub.email]
-            write_log(f"Found [{len(submissions)}] submissions, [{len(emails)}] emails")
+        event = events_queries.get_event_by_id(session, event_id)
 
-            write_log(f"Sending request to acceptance API: [{config.CERTIFICATE_API_URL}/blasts]")
-            write_log_json({"subject": subject, "email_count": len(emails), "emails": emails})
+        html_content = await read_html_body(request)
+        write_log(f"Received HTML body with {len(html_content)} characters")
 
-            from_addr = get_from_address()
-            response_data = await call_acceptance_api(emails, subject, html_content, from_addr)
-            write_log("Acceptance API responded successfully")
-            email_queries.create_email_log(
-                session,
-                sent_by=requesting_member.id,
-                from_address=from_addr,
-                email_type=EmailLogsEmailType.ACCEPTANCE,
-                event_id=event.id,
-                recipient_count=len(emails),
-                data={
-                    "subject": subject,
-                    "html_content": html_content,
-                    "event": {
-                        "name": event.name,
-                        "date": format_event_date(event),
-                        "official": bool(event.is_official),
-                    },
-                    "member": [{"name": sub.name, "email": sub.email} for sub in submissions],
-                },
+        if submissions_queries.is_acceptance_send_running(session, event.id):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="Acceptance emails for this event are already being sent"
             )
 
-            submission_ids = [sub.submission_id for sub in submissions]
-            submissions_queries.mark_submissions_as_invited(session, submission_ids)
-            session.commit()
-            write_log(f"Marked [{len(submission_ids)}] submissions as invited")
+        progress = submissions_queries.get_acceptance_progress(session, event.id)
+        write_log(f"[{progress['remaining']}] accepted submissions have not been invited yet")
 
-            return {"sent_count": len(emails), "emails": emails}
+        background_tasks.add_task(run_acceptance_job, event.id, subject, html_content, requesting_member.id)
+        return {
+            "message": f"Acceptance emails queued for [{progress['remaining']}] recipients",
+            "queued_count": progress["remaining"],
+        }
 
-        except HTTPException:
-            raise
-        except Exception as e:
-            write_log_exception(e)
-            write_log_traceback()
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="An error occurred while sending acceptance emails",
-            )
+
+@router.get("/acceptance/blasts/{event_id:int}/progress", status_code=status.HTTP_200_OK)
+def get_acceptance_progress(event_id: int, credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)]):
+    with SessionLocal() as session:
+        events_queries.get_event_by_id(session, event_id)
+        return {
+            **submissions_queries.get_acceptance_progress(session, event_id),
+            "running": submissions_queries.is_acceptance_send_running(session, event_id),
+        }
 
 
 @router.post("/acceptance/test", status_code=status.HTTP_200_OK)
@@ -1047,79 +1510,14 @@ async def send_acceptance_test(
 
 
 @router.post("/blast", status_code=status.HTTP_200_OK)
-async def send_blast(
+def send_blast(
     request: BlastSendRequest,
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)],
     background_tasks: BackgroundTasks,
 ):
-    async def send_blast_job(
-        recipients: list[dict], guaranteed_snapshot: list[dict], requested_count: int, sent_by_id: int
-    ):
-        with LogFile("send blast [JOB]"), SessionLocal() as session:
-            try:
-                write_log_title(f"Sending blast to [{len(recipients)}] recipients")
-
-                gdg_capacity = get_send_capacity(EmailLogsFromAddress.GDG_QASSIM)
-                info_capacity = get_send_capacity(EmailLogsFromAddress.INFO_KERNELTICS)
-
-                gdg_chunk = recipients[:gdg_capacity]
-                info_chunk = recipients[gdg_capacity : gdg_capacity + info_capacity]
-                overflow = recipients[gdg_capacity + info_capacity :]
-                if overflow:
-                    write_log(
-                        f"[{len(overflow)}] recipients exceed today's combined capacity; "
-                        f"sending them via [{EmailLogsFromAddress.INFO_KERNELTICS.value}] anyway to honor guaranteed delivery"
-                    )
-                    info_chunk = info_chunk + overflow
-
-                guaranteed_emails = {g["email"] for g in guaranteed_snapshot}
-
-                for from_addr, chunk in (
-                    (EmailLogsFromAddress.GDG_QASSIM, gdg_chunk),
-                    (EmailLogsFromAddress.INFO_KERNELTICS, info_chunk),
-                ):
-                    if not chunk:
-                        continue
-                    emails = [r["email"] for r in chunk]
-                    write_log(f"Sending [{len(emails)}] recipients via [{from_addr.value}]")
-
-                    await call_blast_api(
-                        emails,
-                        request.subject,
-                        request.html_content,
-                        from_addr,
-                        request.preview_text,
-                        request.attachments,
-                    )
-                    write_log(f"Blast API responded successfully for [{from_addr.value}]")
-
-                    email_queries.create_email_log(
-                        session,
-                        sent_by=sent_by_id,
-                        from_address=from_addr,
-                        email_type=EmailLogsEmailType.BLAST,
-                        recipient_count=len(emails),
-                        data={
-                            "subject": request.subject,
-                            "html_content": request.html_content,
-                            "preview_text": request.preview_text,
-                            "order_by": request.order_by,
-                            "requested_count": requested_count,
-                            "guaranteed_recipients": [r for r in chunk if r["email"] in guaranteed_emails],
-                            "recipients": chunk,
-                            "attachments": [{"filename": a.filename, "url": a.url} for a in request.attachments],
-                        },
-                    )
-                    session.commit()
-
-            except Exception as e:
-                session.rollback()
-                write_log_exception(e)
-                write_log_traceback()
-
     with LogFile("send blast [SETUP]"), SessionLocal() as session:
         write_log_title("Preparing blast email")
-        requesting_member = members_queries.get_member_by_uni_id(session, get_uni_id_from_credentials(credentials))
+        requesting_member = resolve_member(session, credentials)
 
         guaranteed_member_ids = [r.member_id for r in request.guaranteed_recipients if r.member_id is not None]
         resolved_members = (
@@ -1133,48 +1531,102 @@ async def send_blast(
                 member = members_by_id.get(recipient.member_id)
                 if member is None or not member.email:
                     continue
-                guaranteed[member.email.lower()] = {"name": member.name, "email": member.email}
+                guaranteed[member.email.lower()] = {"name": member.name, "email": member.email, "member_id": member.id}
             elif recipient.email is not None:
                 guaranteed[recipient.email.lower()] = {"name": recipient.name, "email": recipient.email}
 
         write_log(f"Resolved [{len(guaranteed)}] guaranteed recipients")
 
-        capped_count = min(request.count, get_total_remaining_send_capacity())
-        if capped_count < request.count:
-            write_log(
-                f"Capping requested count [{request.count}] down to [{capped_count}] based on remaining send capacity"
-            )
-
         if request.order_by == "activity":
             pool = members_queries.get_blast_recipients_by_activity(
-                session, limit=capped_count, exclude_ids=list(members_by_id.keys())
+                session, limit=request.count, exclude_ids=list(members_by_id.keys())
             )
         else:
             pool = members_queries.get_blast_recipients_alphabetical(
-                session, limit=capped_count, exclude_ids=list(members_by_id.keys())
+                session, limit=request.count, exclude_ids=list(members_by_id.keys())
             )
         write_log(f"Selected [{len(pool)}] recipients via [{request.order_by}] ordering")
 
+        # guaranteed recipients come first so they land in the earliest chunks
         all_recipients = dict(guaranteed)
         for member in pool:
             if member.email:
-                all_recipients.setdefault(member.email.lower(), {"name": member.name, "email": member.email})
+                all_recipients.setdefault(
+                    member.email.lower(), {"name": member.name, "email": member.email, "member_id": member.id}
+                )
 
         recipients = list(all_recipients.values())
-        write_log(f"Queuing blast to [{len(recipients)}] total recipients")
-
-        background_tasks.add_task(
-            send_blast_job, recipients, list(guaranteed.values()), request.count, requesting_member.id
+        blast = blast_queries.create_blast(
+            session,
+            subject=request.subject,
+            html_content=request.html_content,
+            preview_text=request.preview_text,
+            attachments=[a.model_dump(mode="json") for a in request.attachments],
+            order_by=request.order_by,
+            requested_count=request.count,
+            recipients=recipients,
+            guaranteed_emails=[g["email"] for g in guaranteed.values()],
+            chunk_size=request.chunk_size or config.BLAST_CHUNK_SIZE,
+            sent_by=requesting_member.id,
         )
+        slices, completion = plan_blast(session, len(recipients), blast.chunk_size)
+        blast_queries.set_blast_plan(session, blast, [s.to_json() for s in slices], completion)
+        session.commit()
+        write_log(
+            f"Queuing blast [{blast.id}] to [{len(recipients)}] total recipients in chunks of [{blast.chunk_size}], "
+            f"[{len({s.release_at for s in slices})}] release(s), projected completion [{completion}]"
+        )
+
+        background_tasks.add_task(run_blast_job, blast.id)
 
     return {
         "message": f"Blast email queued for [{len(recipients)}] recipient(s).",
+        "blast_id": blast.id,
         "recipient_count": len(recipients),
         "guaranteed_count": len(guaranteed),
         "algorithmic_count": len(pool),
+        "projected_completion_at": completion,
     }
 
 
+@router.get("/blast/{blast_id:int}", status_code=status.HTTP_200_OK, response_model=BlastStatusOut)
+def get_blast_status(blast_id: int, credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)]):
+    with SessionLocal() as session:
+        blast = blast_queries.get_blast_by_id(session, blast_id)
+        return BlastStatusOut(
+            id=blast.id,
+            status=blast.status,
+            subject=blast.subject,
+            total_recipients=len(blast.recipients),
+            sent_count=blast.sent_count,
+            chunk_size=blast.chunk_size,
+            last_error=blast.last_error,
+            schedule=blast.schedule or [],
+            next_release_at=blast.next_release_at,
+            projected_completion_at=blast.projected_completion_at,
+            created_at=blast.created_at,
+            updated_at=blast.updated_at,
+        )
+
+
+@router.post("/blast/{blast_id:int}/resume", status_code=status.HTTP_200_OK)
+def resume_blast(
+    blast_id: int,
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)],
+    background_tasks: BackgroundTasks,
+):
+    with SessionLocal() as session:
+        blast = blast_queries.get_blast_by_id(session, blast_id)
+        if not blast_queries.is_blast_resumable(blast, datetime.now()):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail=f"Blast [{blast_id}] is [{blast.status.value}]"
+            )
+        remaining = len(blast.recipients) - blast.sent_count
+
+    background_tasks.add_task(run_blast_job, blast_id)
+    return {"message": f"Blast [{blast_id}] resumed for [{remaining}] remaining recipient(s).", "remaining": remaining}
+
+
 @router.post("/blast/test", status_code=status.HTTP_200_OK)
 async def send_blast_test(
     request: BlastTestRequest, credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)]
@@ -1231,7 +1683,7 @@ def create_email_template(
     request: EmailTemplateIn, credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)]
 ):
     with SessionLocal() as session:
-        requesting_member = members_queries.get_member_by_uni_id(session, get_uni_id_from_credentials(credentials))
+        requesting_member = resolve_member(session, credentials)
         template = email_template_queries.create_template(
             session,
             name=request.name,
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 from fastapi_clerk_auth import HTTPAuthorizationCredentials
 from app.DB import (
     events as events_queries,
@@ -15,8 +15,8 @@ from app.routers.models import (
     Form_model,
     Open_Events_model,
     Get_Submission_model,
+    submission_row_model,
     createEvent_model,
-    Member_model,
     MemberEvents_model,
     EventWithAttendance_model,
     EventDetailsModel,
@@ -35,6 +35,7 @@ from app.routers.logging import (
 )
 from app.helpers import admin_guard, authenticated_guard, resolve_member
 from app.leaderboard_cache import reset_leaderboard_cache
+from app.certificates import prerender_event_certificates
 from time import perf_counter
 from typing import Annotated
 from app.exceptions import NotFound
@@ -356,7 +357,12 @@ def delete_event(event_id: int, credentials=Depends(admin_guard)):
     response_model=Events_model,
     responses={404: {"model": NotFoundResponse, "description": "Event not found"}},
 )
-def update_event_status(event_id: int, status_data: UpdateEventStatus_model, credentials=Depends(admin_guard)):
+def update_event_status(
+    event_id: int,
+    status_data: UpdateEventStatus_model,
+    background_tasks: BackgroundTasks,
+    credentials=Depends(admin_guard),
+):
     with SessionLocal() as session:
         event = events_queries.get_event_by_id(session, event_id)
         if not event:
@@ -374,45 +380,26 @@ def update_event_status(event_id: int, status_data: UpdateEventStatus_model, cre
         except Exception:
             pass
 
+    # attendance is final once an event closes, so render its certificates ahead of the send / download rush
+    if status_data.status == "closed" and old_status != "closed":
+        background_tasks.add_task(prerender_event_certificates, event_id)
+
     return event
 
 
-# TODO: move to submissions router.
-@router.get("/submissions/{event_id:int}", status_code=status.HTTP_200_OK, response_model=list[Get_Submission_model])
+@router.get(
+    "/submissions/{event_id:int}",
+    status_code=status.HTTP_200_OK,
+    response_model=list[Get_Submission_model],
+    deprecated=True,
+    description="Every submission of the event with its full answers in one response. Use the paginated "
+    "`GET /submissions/event/{event_id}` instead, which leaves the answers out unless asked for.",
+)
 def get_submissions_by_event(event_id: int, credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)]):
     with SessionLocal() as session:
         try:
             submissions_data = submission_queries.get_submissions_by_event_id(session, event_id)
-
-            # Transform to Submission_model objects
-            submissions = []
-            for row in submissions_data:
-                member = Member_model(
-                    id=row.id,
-                    name=row.name,
-                    email=row.email,
-                    phone_number=row.phone_number,
-                    uni_id=row.uni_id,
-                    gender=row.gender,
-                    uni_level=row.uni_level,
-                    uni_college=row.uni_college,
-                )
-
-                submission = Get_Submission_model(
-                    member=member,
-                    submission_id=row.submission_id,
-                    submitted_at=row.submitted_at,
-                    form_type=row.form_type,
-                    submission_type=row.submission_type,
-                    is_accepted=bool(row.is_accepted),
-                    is_invited=bool(row.is_invited),
-                    google_submission_value=row.google_submission_value,
-                    event_id=row.event_id,
-                    form_id=row.form_id,
-                    google_form_id=row.google_form_id,
-                )
-                submissions.append(submission)
-
+            submissions = [submission_row_model(row) for row in submissions_data]
             return submissions
         except Exception:
             raise
@@ -3,6 +3,9 @@ from app.DB import members as member_queries
 from sqlalchemy import text
 from app.DB.main import SessionLocal, engine
 from app.routers.models import Member_model
+from app.http_clients import http_clients
+from app.form_sync_coalescer import form_syncs
+from app.form_sync_reconciler import form_reconciler
 import os
 from time import perf_counter
 from json import dumps
@@ -17,6 +20,48 @@ def health_check():
     return {"status": "ok"}
 
 
+@router.get(
+    "/http",
+    status_code=status.HTTP_200_OK,
+    description="Outbound HTTP client metrics per upstream service: configured pool limits, request and transport error counts, response status classes and a cumulative latency histogram. Counters are per worker process.",
+)
+def http_clients_check():
+    return http_clients.stats()
+
+
+@router.get(
+    "/forms-sync",
+    status_code=status.HTTP_200_OK,
+    description="Google Forms webhook sync counters: notifications received, dropped as duplicate messageIds, coalesced into a pending sync, and syncs started, failed, running or pending. Counters are per worker process.",
+)
+def forms_sync_check():
+    return form_syncs.stats()
+
+
+@router.get(
+    "/forms-sync/reconciler",
+    status_code=status.HTTP_200_OK,
+    description="Periodic Google Forms reconciliation: rounds run, how often a round is a full re-sync and, per open event's Google form from the last round, lag_seconds since this worker process last synced it successfully (null if it hasn't), plus its sync cursor and cursor_age_seconds (how long since the newest response seen).",
+)
+def forms_sync_reconciler_check():
+    return form_reconciler.stats()
+
+
+@router.get(
+    "/db/pool",
+    status_code=status.HTTP_200_OK,
+    description="Current database connection pool usage of this worker process, as JSON. Polled by the email load test to track pool pressure.",
+)
+def db_pool_check():
+    return {
+        "pool_size": engine.pool.size(),
+        "checked_in": engine.pool.checkedin(),
+        "checked_out": engine.pool.checkedout(),
+        "overflow": engine.pool.overflow(),
+        "pid": os.getpid(),
+    }
+
+
 @router.get(
     "/db",
     status_code=status.HTTP_200_OK,
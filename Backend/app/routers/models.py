@@ -1,4 +1,4 @@
-from pydantic import BaseModel, HttpUrl, EmailStr, field_validator, conlist, ConfigDict
+from pydantic import BaseModel, HttpUrl, EmailStr, field_validator, conlist, ConfigDict, Field
 from typing import List, Literal, Dict
 from datetime import datetime
 from pydantic.types import JsonValue
@@ -78,6 +78,10 @@ class submission_accept_model(BaseClassModel):
     is_accepted: bool
 
 
+class submission_accept_first_model(BaseClassModel):
+    count: int = Field(gt=0)
+
+
 def _validate_optional_uni_id(value: str | None) -> str | None:
     if value is None:
         return value
@@ -139,6 +143,33 @@ class Get_Submission_model(BaseClassModel):
     google_form_id: str | None = None
 
 
+def submission_row_model(row) -> Get_Submission_model:
+    """A submissions query row (view-shaped columns, answers optional) as the API model."""
+    member = Member_model(
+        id=row.id,
+        name=row.name,
+        email=row.email,
+        phone_number=row.phone_number,
+        uni_id=row.uni_id,
+        gender=row.gender,
+        uni_level=row.uni_level,
+        uni_college=row.uni_college,
+    )
+    return Get_Submission_model(
+        member=member,
+        submission_id=row.submission_id,
+        submitted_at=row.submitted_at,
+        form_type=row.form_type,
+        submission_type=row.submission_type,
+        is_accepted=bool(row.is_accepted),
+        is_invited=bool(row.is_invited),
+        google_submission_value=row._mapping.get("google_submission_value"),
+        event_id=row.event_id,
+        form_id=row.form_id,
+        google_form_id=row.google_form_id,
+    )
+
+
 class Create_Google_Submission_model(BaseClassModel):
     id: int | None = None
     form_id: int
@@ -1,13 +1,21 @@
+import csv
+import io
 import json
 import re
+from datetime import datetime, timedelta, timezone
 from time import perf_counter
-from typing import Literal, Annotated
-from fastapi import APIRouter, Depends, Request, status, HTTPException, BackgroundTasks
+from typing import Iterator, Literal, Annotated, Optional
+from fastapi import APIRouter, Depends, Query, Request, Response, status, HTTPException
+from fastapi.responses import StreamingResponse
 from app.DB.main import SessionLocal
 from app.DB import submissions as submission_queries, members as member_queries, forms as form_queries
 from fastapi_clerk_auth import HTTPAuthorizationCredentials
-from app.helpers import admin_guard, resolve_member, authenticated_guard
+from app.helpers import admin_guard, resolve_member, authenticated_guard, decode_cursor, encode_cursor
+from app.exceptions import FormNotFound, InvalidCursor
 from app.config import config
+from app.form_sync_coalescer import form_syncs
+from app.form_sync_reconciler import form_reconciler
+from app.google_forms import google_forms
 from app.routers.logging import (
     LogFile,
     write_log,
@@ -21,10 +29,13 @@ from app.routers.logging import (
     write_log_traceback,
     write_log_traceback_to,
 )
-from app.routers.models import submission_exists_model, submission_accept_model
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-from google.auth.transport.requests import Request as GoogleRequest
+from app.routers.models import (
+    Get_Submission_model,
+    submission_row_model,
+    submission_exists_model,
+    submission_accept_model,
+    submission_accept_first_model,
+)
 
 router = APIRouter()
 
@@ -78,39 +89,211 @@ def accept_submission(
     submissions: list[submission_accept_model],
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)],
 ):
+    """Apply the whole decision set at once; ids that don't exist are skipped and reported in ``missing_ids``. When
+    an id is listed twice the last decision wins."""
+    decisions = {submission.submission_id: submission.is_accepted for submission in submissions}
     with SessionLocal() as session:
         try:
-            for submission in submissions:
-                submission = submission_queries.update_is_accepted(
-                    session, submission.submission_id, submission.is_accepted
-                )
-                if submission is None:
-                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Submission not found")
+            missing_ids = submission_queries.set_submissions_accepted(session, decisions)
             session.commit()
-            return {"status": "success"}
+            return {"status": "success", "updated": len(decisions) - len(missing_ids), "missing_ids": missing_ids}
         except Exception:
+            session.rollback()
             raise
 
 
+@router.put("/accept/{event_id:int}/first", status_code=status.HTTP_200_OK)
+def accept_first_submissions(
+    event_id: int,
+    body: submission_accept_first_model,
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)],
+):
+    """Accept the event's first ``count`` submissions by submission time; earlier acceptances count toward it."""
+    with SessionLocal() as session:
+        try:
+            accepted = submission_queries.accept_first_submissions(session, event_id, body.count)
+            session.commit()
+            return {"status": "success", "accepted": accepted}
+        except Exception:
+            session.rollback()
+            raise
+
+
+# ====================== Submission listing and export ======================
+
+# CSV header -> submission row attribute
+CSV_COLUMNS = {
+    "submission_id": "submission_id",
+    "submitted_at": "submitted_at",
+    "submission_type": "submission_type",
+    "is_accepted": "is_accepted",
+    "is_invited": "is_invited",
+    "member_id": "id",
+    "name": "name",
+    "email": "email",
+    "phone_number": "phone_number",
+    "uni_id": "uni_id",
+    "gender": "gender",
+    "uni_level": "uni_level",
+    "uni_college": "uni_college",
+}
+# submissions read per query while a CSV export streams
+EXPORT_PAGE_SIZE = 500
+
+
+def parse_submission_cursor(cursor: str) -> int:
+    values = decode_cursor(cursor)
+    try:
+        (submission_id,) = values
+        return int(submission_id)
+    except (TypeError, ValueError):
+        raise InvalidCursor()
+
+
+def form_question_titles(schema: dict) -> dict[str, str]:
+    """``questionId -> title`` in form order, including each row of grid questions (as "Grid title - Row")."""
+    titles = {}
+    for item in schema.get("items", []):
+        question = item.get("questionItem", {}).get("question")
+        if question:
+            titles[question["questionId"]] = item.get("title") or question["questionId"]
+        for row in item.get("questionGroupItem", {}).get("questions", []):
+            row_title = row.get("rowQuestion", {}).get("title", "")
+            titles[row["questionId"]] = f"{item.get('title', '')} - {row_title}".strip(" -")
+    return titles
+
+
+def flatten_google_answer(answer: dict | None) -> str:
+    """One cell for a Google Forms answer: text answers (several for checkboxes) or uploaded file names, joined."""
+    if not answer:
+        return ""
+    values = [a.get("value", "") for a in answer.get("textAnswers", {}).get("answers", [])]
+    values += [a.get("fileName", "") for a in answer.get("fileUploadAnswers", {}).get("answers", [])]
+    return "; ".join(values)
+
+
+def csv_cell(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    value = getattr(value, "value", value)
+    text = str(value)
+    # keep spreadsheets from evaluating user-entered text as a formula
+    return "'" + text if text[:1] in ("=", "+", "-", "@") else text
+
+
+@router.get("/event/{event_id:int}", status_code=status.HTTP_200_OK, response_model=list[Get_Submission_model])
+def list_event_submissions(
+    event_id: int,
+    response: Response,
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)],
+    is_accepted: Annotated[Optional[bool], Query(description="Only accepted (true) or not accepted (false)")] = None,
+    is_invited: Annotated[Optional[bool], Query(description="Only invited (true) or not invited (false)")] = None,
+    submission_type: Annotated[
+        Optional[Literal["none", "partial", "google", "registration"]], Query(description="Filter by submission type")
+    ] = None,
+    include_answers: Annotated[bool, Query(description="Include the Google answers JSON of each submission")] = False,
+    cursor: Annotated[
+        Optional[str], Query(description="Opaque cursor from the previous page's X-Next-Cursor header")
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=500, description="Maximum number of submissions to return")] = 100,
+):
+    """The event's submissions in id order, a page at a time; follow ``X-Next-Cursor`` for the next page. A legacy
+    event without a form has no submissions."""
+    with SessionLocal() as session:
+        try:
+            form = form_queries.get_form_by_event_id(session, event_id)
+        except FormNotFound:
+            return []
+        rows = submission_queries.get_form_submissions_page(
+            session,
+            form.id,
+            is_accepted=is_accepted,
+            is_invited=is_invited,
+            submission_type=submission_type,
+            include_answers=include_answers,
+            after_id=parse_submission_cursor(cursor) if cursor else None,
+            limit=limit,
+        )
+        if len(rows) == limit:
+            response.headers["X-Next-Cursor"] = encode_cursor(rows[-1].submission_id)
+        return [submission_row_model(row) for row in rows]
+
+
+@router.get("/event/{event_id:int}/export.csv", status_code=status.HTTP_200_OK, response_class=StreamingResponse)
+def export_event_submissions_csv(
+    event_id: int,
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_guard)],
+    is_accepted: Annotated[Optional[bool], Query(description="Only accepted (true) or not accepted (false)")] = None,
+    is_invited: Annotated[Optional[bool], Query(description="Only invited (true) or not invited (false)")] = None,
+    submission_type: Annotated[
+        Optional[Literal["none", "partial", "google", "registration"]], Query(description="Filter by submission type")
+    ] = None,
+):
+    """The event's submissions as CSV with one column per Google Forms question, streamed page by page."""
+    with SessionLocal() as session:
+        form = form_queries.get_form_by_event_id(session, event_id)
+        form_id, google_form_id = form.id, form.google_form_id
+        question_ids = submission_queries.get_form_answer_question_ids(session, form_id)
+
+    titles = {}
+    if question_ids and google_form_id:
+        try:
+            titles = form_question_titles(fetch_schema(google_form_id))
+        except Exception:
+            # e.g. a revoked refresh token; the export still works with question ids as headers
+            pass
+    # questions in form order, then any the form no longer has
+    question_ids = [q for q in titles if q in question_ids] + [q for q in question_ids if q not in titles]
+
+    def lines() -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        # the BOM makes Excel read the file as UTF-8 (names and answers are often Arabic)
+        buffer.write("\ufeff")
+        writer.writerow([*CSV_COLUMNS, *(csv_cell(titles.get(q, q)) for q in question_ids)])
+        # one session for the whole export, so every page comes from the same snapshot
+        with SessionLocal() as session:
+            after_id = None
+            while True:
+                page = submission_queries.get_form_submissions_page(
+                    session,
+                    form_id,
+                    is_accepted=is_accepted,
+                    is_invited=is_invited,
+                    submission_type=submission_type,
+                    include_answers=True,
+                    after_id=after_id,
+                    limit=EXPORT_PAGE_SIZE,
+                )
+                for row in page:
+                    answers = row.google_submission_value or {}
+                    writer.writerow(
+                        [
+                            *(csv_cell(getattr(row, column)) for column in CSV_COLUMNS.values()),
+                            *(csv_cell(flatten_google_answer(answers.get(q))) for q in question_ids),
+                        ]
+                    )
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                if len(page) < EXPORT_PAGE_SIZE:
+                    return
+                after_id = page[-1].submission_id
+
+    headers = {"Content-Disposition": f'attachment; filename="event-{event_id}-submissions.csv"'}
+    return StreamingResponse(lines(), media_type="text/csv; charset=utf-8", headers=headers)
+
+
 # ====================== Google Forms API ======================
 
 # ==============================================================
 
 
 def get_google_credentials(refresh_token: str):
-    credentials = Credentials(
-        None,
-        refresh_token=refresh_token,
-        token_uri="https://oauth2.googleapis.com/token",
-        client_id=config.GOOGLE_CLIENT_ID,
-        client_secret=config.GOOGLE_CLIENT_SECRET,
-    )
-
-    # Refresh the token if needed
-    if not credentials.valid:
-        credentials.refresh(GoogleRequest())
-
-    return credentials
+    # cached per refresh token; only refreshed when the access token is about to expire
+    return google_forms.credentials(refresh_token)
 
 
 def fetch_schema(google_form_id: str):
@@ -124,11 +307,8 @@ def fetch_schema(google_form_id: str):
         if not form.google_refresh_token:
             raise ValueError("Form does not have a refresh token")
 
-        # Get Google credentials
-        credentials = get_google_credentials(form.google_refresh_token)
-
-        # Build the Forms API service
-        service = build("forms", "v1", credentials=credentials)
+        # Forms API service on cached credentials and the pre-parsed discovery document
+        service = google_forms.forms_service(form.google_refresh_token)
 
         # Fetch the form schema from Google
         schema = service.forms().get(formId=google_form_id).execute()
@@ -158,8 +338,126 @@ def extract_email_answer(answers: dict) -> str | None:
     return None
 
 
-def fetch_form_responses(google_form_id: str, log_file=None):
-    """Fetch all responses from a Google Form and return them"""
+def parse_google_timestamp(value: str) -> datetime:
+    """RFC 3339 timestamp from the Forms API (e.g. ``lastSubmittedTime``) as a naive UTC datetime. Google sends
+    nanoseconds; anything past microseconds is dropped."""
+    return datetime.fromisoformat(value).astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def responses_filter(since: datetime) -> str:
+    """``responses.list`` filter for responses submitted at or after ``since`` (naive UTC)."""
+    return f"timestamp >= {since.strftime('%Y-%m-%dT%H:%M:%S.%fZ')}"
+
+
+# responses written to the log as JSON per fetch; the rest only show up in the counts
+RESPONSE_LOG_SAMPLE_SIZE = 3
+# unmatched response ids listed in the sync summary
+UNMATCHED_LOG_SAMPLE_SIZE = 20
+
+
+class FormResponseStream:
+    """A form's responses, fetched one ``responses.list`` page at a time as the caller iterates, so only one page
+    is in memory however large the form is. The count, the newest ``lastSubmittedTime`` and a small sample are
+    tracked as pages go by."""
+
+    def __init__(self, form_id: int, google_form_id: str, service, since: datetime | None, log_file=None):
+        self.form_id = form_id
+        self.google_form_id = google_form_id
+        self.since = since
+        self.total = 0
+        self.pages_fetched = 0
+        self.synced_until: datetime | None = None
+        self.sample: list[dict] = []
+        self._service = service
+        self._log_file = log_file
+
+    def pages(self) -> Iterator[list[dict]]:
+        params = {"formId": self.google_form_id, "pageSize": config.GOOGLE_FORMS_RESPONSES_PAGE_SIZE}
+        if self.since is not None:
+            params["filter"] = responses_filter(self.since)
+
+        while True:
+            result = self._service.forms().responses().list(**params).execute()
+            page = result.get("responses", [])
+            self._track(page)
+            yield page
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                return
+            params["pageToken"] = page_token
+
+    def responses(self) -> Iterator[dict]:
+        for page in self.pages():
+            yield from page
+
+    def log_summary(self) -> None:
+        write_log_to(self._log_file, f"Fetched [{self.total}] responses in [{self.pages_fetched}] pages")
+        if self.sample:
+            write_log_json_to(self._log_file, {"sample_responses": self.sample})
+
+    def _track(self, page: list[dict]) -> None:
+        self.pages_fetched += 1
+        self.total += len(page)
+        self.sample.extend(page[: RESPONSE_LOG_SAMPLE_SIZE - len(self.sample)])
+        latest = latest_submitted_time(page)
+        if latest is not None and (self.synced_until is None or latest > self.synced_until):
+            self.synced_until = latest
+
+
+class ResponseMatcher:
+    """Matches Google responses to partial submissions by the email answered, one page at a time. When an email
+    answered more than once the response listed last wins, as it did before responses were streamed; that's why
+    every page is read and ``matched`` is only applied after the last one.
+
+    ``oldest_held_unmatched`` is the earliest ``lastSubmittedTime`` of an unmatched response submitted at or after
+    ``hold_since``; the sync cursor must not move past it, or the response is never fetched again."""
+
+    def __init__(self, partial_by_email: dict, hold_since: datetime | None = None):
+        self._partial_by_email = partial_by_email
+        self._hold_since = hold_since
+        self.matched: dict[int, tuple[str, dict]] = {}
+        self.no_email = 0
+        self.unmatched = 0
+        self.unmatched_sample: list[str] = []
+        self.oldest_held_unmatched: datetime | None = None
+
+    def add_page(self, page: list[dict]) -> None:
+        for response in page:
+            response_id = response.get("responseId")
+            answers = response.get("answers", {})
+
+            email = extract_email_answer(answers)
+            partial_submission = self._partial_by_email.get(email) if email else None
+            if partial_submission is not None:
+                self.matched[partial_submission.submission_id] = (response_id, answers)
+                continue
+            if not email:
+                self.no_email += 1
+            self.unmatched += 1
+            if len(self.unmatched_sample) < UNMATCHED_LOG_SAMPLE_SIZE:
+                self.unmatched_sample.append(response_id)
+            self._hold(response)
+
+    def _hold(self, response: dict) -> None:
+        if self._hold_since is None or not response.get("lastSubmittedTime"):
+            return
+        submitted_at = parse_google_timestamp(response["lastSubmittedTime"])
+        if submitted_at >= self._hold_since and (
+            self.oldest_held_unmatched is None or submitted_at < self.oldest_held_unmatched
+        ):
+            self.oldest_held_unmatched = submitted_at
+
+
+def latest_submitted_time(responses: list[dict]) -> datetime | None:
+    times = [parse_google_timestamp(r["lastSubmittedTime"]) for r in responses if r.get("lastSubmittedTime")]
+    return max(times, default=None)
+
+
+def fetch_form_responses(google_form_id: str, log_file=None, incremental: bool = False) -> FormResponseStream | None:
+    """Open a stream over a Google Form's responses; nothing is fetched until it is iterated. With
+    ``incremental``, only responses submitted since the form's sync cursor (less
+    ``GOOGLE_FORMS_SYNC_OVERLAP_SECONDS``) are fetched, and ``synced_until`` on the stream is where the cursor can
+    move once they are processed."""
     try:
         write_log_title_to(log_file, f"Fetching responses for form: {google_form_id}")
 
@@ -176,29 +474,17 @@ def fetch_form_responses(google_form_id: str, log_file=None):
                 return None
 
             write_log_to(log_file, f"Found form in database with ID: {form.id}")
-            form_id = form.id
 
-            # Get Google credentials
-            credentials = get_google_credentials(form.google_refresh_token)
+            # Forms API service on cached credentials and the pre-parsed discovery document
+            service = google_forms.forms_service(form.google_refresh_token)
             write_log_to(log_file, "Successfully authenticated with Google")
 
-            # Build the Forms API service
-            service = build("forms", "v1", credentials=credentials)
-
-            # Fetch the form responses
-            result = service.forms().responses().list(formId=google_form_id).execute()
-
-            responses = result.get("responses", [])
-            write_log_to(log_file, f"\nTotal responses found: {len(responses)}")
-
-            # Log all responses
-            for idx, response in enumerate(responses, 1):
-                write_log_to(log_file, f"\n--- Response #{idx} ---")
-                write_log_json_to(log_file, response)
+            since = None
+            if incremental and form.google_responses_synced_until is not None:
+                since = form.google_responses_synced_until - timedelta(seconds=config.GOOGLE_FORMS_SYNC_OVERLAP_SECONDS)
+                write_log_to(log_file, f"Fetching responses submitted since [{since.isoformat()}Z]")
 
-            write_log_to(log_file, "\n=== Finished fetching responses ===")
-
-            return {"form_id": form_id, "google_form_id": google_form_id, "responses": responses}
+            return FormResponseStream(form.id, google_form_id, service, since, log_file)
 
     except Exception as e:
         write_log_exception_to(log_file, e)
@@ -206,109 +492,118 @@ def fetch_form_responses(google_form_id: str, log_file=None):
         return None
 
 
-def sync_form_submissions(google_form_id: str, log_file):
+def sync_form_submissions(google_form_id: str, log_file, incremental: bool = True) -> bool:
+    """Match the form's Google responses to its partial submissions. Failures are logged, not raised; returns
+    whether the sync completed."""
     try:
         write_log_title_to(log_file, f"Running scheduled job: sync for google_form_id: {google_form_id}")
 
-        # Fetch Google Form responses
-        fetch_result = fetch_form_responses(google_form_id, log_file)
+        stream = fetch_form_responses(google_form_id, log_file, incremental=incremental)
 
-        if fetch_result is None:
+        if stream is None:
             write_log_to(log_file, "Error: Failed to fetch form responses")
-            return
-
-        form_id = fetch_result["form_id"]
-        google_responses = fetch_result["responses"]
+            return False
 
+        form_id = stream.form_id
         write_log_to(log_file, f"Form ID: {form_id}")
-        write_log_to(log_file, f"Google responses count: {len(google_responses)}")
 
-        # Get partial submissions from database
+        # each database step gets its own short session: no connection or transaction stays open while the Google
+        # pages are fetched, which can take a while on a big form
         with SessionLocal() as session:
             partial_submissions = submission_queries.get_partial_submissions_by_form_id(session, form_id)
-            write_log_to(log_file, f"Partial submissions count: {len(partial_submissions)}")
+        write_log_to(log_file, f"Partial submissions count: {len(partial_submissions)}")
+
+        if not partial_submissions:
+            # nothing to match, so skip the fetch; the cursor stays put and a later sync still sees these responses
+            write_log_to(log_file, "No partial submissions to sync")
+            return True
+
+        # Create a mapping of email (normalized) to partial submissions
+        partial_by_email = {}
+        missing_email = 0
+        for submission in partial_submissions:
+            email = (submission.email or "").strip().lower()
+            if not email:
+                missing_email += 1
+                continue
+            partial_by_email[email] = submission
+        if missing_email:
+            write_log_to(log_file, f"Partial submissions with no email on file, skipped: {missing_email}")
+
+        # a response with no partial submission yet may get one soon (the member registers on the site after
+        # filling the form), so recent unmatched responses keep the cursor from moving past them
+        hold_since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+            seconds=config.GOOGLE_FORMS_UNMATCHED_HOLD_SECONDS
+        )
+        matcher = ResponseMatcher(partial_by_email, hold_since)
+        for page in stream.pages():
+            matcher.add_page(page)
+
+        synced_until = stream.synced_until
+        if synced_until is not None and matcher.oldest_held_unmatched is not None:
+            synced_until = min(synced_until, matcher.oldest_held_unmatched)
+
+        # one transaction for the writes; the cursor only moves once the responses it covers are applied. A
+        # submission completed elsewhere since it was read is no longer partial and left alone
+        with SessionLocal() as session:
+            matched_count = submission_queries.complete_partial_submissions(session, matcher.matched)
+            if synced_until is not None:
+                form_queries.advance_form_sync_cursor(session, form_id, synced_until)
+            session.commit()
 
-            if not partial_submissions:
-                write_log_to(log_file, "No partial submissions to sync")
-                return
+        # Summary
+        stream.log_summary()
+        write_log_to(log_file, "\n=== Sync Summary ===")
+        write_log_to(log_file, f"Total Google responses read: {stream.total}")
+        write_log_to(log_file, f"Total partial submissions: {len(partial_submissions)}")
+        write_log_to(log_file, f"Successfully matched: {matched_count}")
+        if matched_count < len(matcher.matched):
+            write_log_to(log_file, f"No longer partial when updated: {len(matcher.matched) - matched_count}")
+        write_log_to(
+            log_file, f"Unmatched responses: {matcher.unmatched} ({matcher.no_email} without an email-shaped answer)"
+        )
+
+        if matcher.unmatched_sample:
+            sample = matcher.unmatched_sample
+            write_log_to(log_file, f"Unmatched response IDs (first {len(sample)}): {sample}")
+
+        write_log_to(log_file, "\n=== Sync Complete ===")
+        return True
 
-            # Create a mapping of email (normalized) to partial submissions
-            partial_by_email = {}
-            for submission in partial_submissions:
-                email = (submission.email or "").strip().lower()
-                if not email:
-                    write_log_to(log_file, f"Partial submission: ID={submission.submission_id} has no email on file, skipping")
-                    continue
-                partial_by_email[email] = submission
-                write_log_to(log_file, f"Partial submission: ID={submission.submission_id}, email={email}")
-
-            # Match Google responses to partial submissions
-            matched_count = 0
-            unmatched_responses = []
-
-            for response in google_responses:
-                response_id = response.get("responseId")
-                answers = response.get("answers", {})
-
-                email = extract_email_answer(answers)
-                if not email:
-                    write_log_to(log_file, f"Response {response_id}: No email-shaped answer found")
-                    unmatched_responses.append(response_id)
-                    continue
-
-                write_log_to(log_file, f"Response {response_id}: email={email}")
-
-                # Check if this email has a partial submission
-                if email in partial_by_email:
-                    partial_submission = partial_by_email[email]
-
-                    # Update submission with Google response data
-                    updated = submission_queries.update_google_submission(
-                        session,
-                        partial_submission.submission_id,
-                        submission_type="google",
-                        google_submission_id=response_id,
-                        google_submission_value=answers,
-                    )
+    except Exception as e:
+        write_log_exception_to(log_file, e)
+        write_log_traceback_to(log_file)
+        return False
 
-                    if updated:
-                        matched_count += 1
-                        write_log_to(
-                            log_file, f"✓ Matched and updated submission ID {partial_submission.id} for email {email}"
-                        )
-                        write_log_to(log_file, f"  - Google response ID: {response_id}")
-                    else:
-                        write_log_to(log_file, f"✗ Failed to update submission ID {partial_submission.id}")
-                else:
-                    write_log_to(
-                        log_file, f"Response {response_id}: No matching partial submission for email {email}"
-                    )
-                    unmatched_responses.append(response_id)
 
-            # Commit all updates
-            session.commit()
+def run_webhook_sync(google_form_id: str):
+    with LogFile("google forms sync [JOB]") as log:
+        incremental = not form_reconciler.take_full_sync(google_form_id)
+        if not sync_form_submissions(google_form_id, log.file, incremental=incremental):
+            # raised so the coalescer counts the failure and doesn't record the form as synced
+            raise RuntimeError(f"Google Forms sync of [{google_form_id}] failed, see its log")
 
-            # Summary
-            write_log_to(log_file, "\n=== Sync Summary ===")
-            write_log_to(log_file, f"Total Google responses: {len(google_responses)}")
-            write_log_to(log_file, f"Total partial submissions: {len(partial_submissions)}")
-            write_log_to(log_file, f"Successfully matched: {matched_count}")
-            write_log_to(log_file, f"Unmatched responses: {len(unmatched_responses)}")
 
-            if unmatched_responses:
-                write_log_to(log_file, f"Unmatched response IDs: {unmatched_responses}")
+def run_reconcile_sync(google_form_id: str):
+    with LogFile("google forms sync [RECONCILE]") as log:
+        incremental = not form_reconciler.take_full_sync(google_form_id)
+        if not sync_form_submissions(google_form_id, log.file, incremental=incremental):
+            raise RuntimeError(f"Google Forms reconciliation of [{google_form_id}] failed, see its log")
 
-            write_log_to(log_file, "\n=== Sync Complete ===")
 
-    except Exception as e:
-        write_log_exception_to(log_file, e)
-        write_log_traceback_to(log_file)
+def list_reconcilable_forms() -> list[tuple[str, datetime | None]]:
+    with SessionLocal() as session:
+        return [
+            (form.google_form_id, form.google_responses_synced_until)
+            for form in form_queries.get_open_google_forms(session)
+        ]
 
 
 @router.get("/test-google-forms/{google_form_id}", status_code=status.HTTP_200_OK)
 def test_fetch_form_responses(google_form_id: str):
     with LogFile("test google forms fetch") as log:
-        responses = fetch_form_responses(google_form_id, log.file)
+        stream = fetch_form_responses(google_form_id, log.file)
+        responses = list(stream.responses()) if stream is not None else None
         schema = fetch_schema(google_form_id)
         print("\n\n=== Responses ===\n")
         print(json.dumps(responses, indent=4, ensure_ascii=False))
@@ -319,7 +614,7 @@ def test_fetch_form_responses(google_form_id: str):
 
 
 @router.post("/google/webhook", status_code=status.HTTP_200_OK)
-async def google_forms_webhook(request: Request, background_tasks: BackgroundTasks):
+async def google_forms_webhook(request: Request):
     with LogFile("google forms webhook") as log:
         try:
             write_log_title("⚓ Google Forms Webhook Notification ⚓")
@@ -363,11 +658,17 @@ async def google_forms_webhook(request: Request, background_tasks: BackgroundTas
                 }
             )
 
-            # Sync form submissions in the background
-            background_tasks.add_task(sync_form_submissions, form_id, log.file)
-            write_log(f"Background task scheduled to sync submissions for form: {form_id}")
-
-            return {"status": "received", "form_id": form_id, "event_type": event_type, "message_id": message_id}
+            # Sync form submissions in the background, folded into any sync already pending for this form
+            sync_status = form_syncs.submit(form_id, message_id, run_webhook_sync)
+            write_log(f"Sync for form [{form_id}]: {sync_status}")
+
+            return {
+                "status": "received",
+                "form_id": form_id,
+                "event_type": event_type,
+                "message_id": message_id,
+                "sync": sync_status,
+            }
 
         except json.JSONDecodeError as e:
             write_log_exception(e)
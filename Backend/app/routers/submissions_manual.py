@@ -1,3 +1,5 @@
+from itertools import islice
+
 from fastapi import APIRouter, HTTPException, Query, status
 
 from app.DB.main import SessionLocal
@@ -24,8 +26,8 @@ def sync_manual_form_submissions(google_form_id: str, limit: int, log_file):
     try:
         write_log_title_to(log_file, f"Manual sync submissions for google_form_id: {google_form_id} (limit={limit})")
 
-        fetch_result = fetch_form_responses(google_form_id, log_file)
-        if fetch_result is None:
+        stream = fetch_form_responses(google_form_id, log_file)
+        if stream is None:
             write_log_to(log_file, "ERROR: Failed to fetch form responses")
             return {
                 "created": 0,
@@ -36,54 +38,44 @@ def sync_manual_form_submissions(google_form_id: str, limit: int, log_file):
                 "total_fetched": 0,
             }
 
-        form_id = fetch_result["form_id"]
-        google_responses = fetch_result["responses"] or []
+        form_id = stream.form_id
 
-        created = 0
-        skipped_existing = 0
-        skipped_no_member = 0
-        skipped_missing_email = 0
+        # the first response from an email is the one that creates its submission; pages past `limit` are never
+        # fetched
+        by_email: dict[str, tuple[str, dict]] = {}
         processed = 0
+        skipped_missing_email = 0
+        skipped_duplicate = 0
+        for response in islice(stream.responses(), limit):
+            processed += 1
+            answers = response.get("answers", {}) or {}
+            email = extract_email_answer(answers)
+            if not email:
+                skipped_missing_email += 1
+            elif email in by_email:
+                skipped_duplicate += 1
+            else:
+                by_email[email] = (response.get("responseId"), answers)
 
         with SessionLocal() as session:
-            for response in google_responses[:limit]:
-                processed += 1
-
-                response_id = response.get("responseId")
-                answers = response.get("answers", {}) or {}
-
-                email = extract_email_answer(answers)
-                if not email:
-                    skipped_missing_email += 1
-                    continue
-
-                member = member_queries.get_member_by_email_or_none(session, email)
-                if not member:
-                    skipped_no_member += 1
-                    continue
-
-                existing = submission_queries.get_submission_by_form_and_member(session, form_id, member.id)
-                if existing:
-                    skipped_existing += 1
-                    continue
-
-                new_submission = submission_queries.create_google_submission(
-                    session,
-                    form_id=form_id,
-                    member_id=member.id,
-                    google_submission_id=response_id,
-                    google_submission_value=answers,
-                )
-
-                if new_submission:
-                    created += 1
+            member_ids = member_queries.get_member_ids_by_emails(session, list(by_email))
+            skipped_no_member = len(by_email) - len(member_ids)
+
+            by_member = {member_id: by_email[email] for email, member_id in member_ids.items()}
+
+            existing = submission_queries.get_submitted_member_ids(session, form_id, list(by_member))
+            new_submissions = {member_id: r for member_id, r in by_member.items() if member_id not in existing}
+            created = submission_queries.create_google_submissions(session, form_id, new_submissions)
+            # rows INSERT IGNORE skipped were created by someone else in the meantime
+            skipped_existing = len(existing) + skipped_duplicate + (len(new_submissions) - created)
 
             session.commit()
 
         write_log_to(log_file, "=== Manual Sync Summary ===")
         write_log_to(log_file, f"google_form_id: {google_form_id}")
         write_log_to(log_file, f"form_id: {form_id}")
-        write_log_to(log_file, f"total_fetched: {len(google_responses)}")
+        stream.log_summary()
+        write_log_to(log_file, f"total_fetched: {stream.total}")
         write_log_to(log_file, f"processed: {processed}")
         write_log_to(log_file, f"created: {created}")
         write_log_to(log_file, f"skipped_existing: {skipped_existing}")
@@ -96,7 +88,7 @@ def sync_manual_form_submissions(google_form_id: str, limit: int, log_file):
             "skipped_no_member": skipped_no_member,
             "skipped_missing_email": skipped_missing_email,
             "processed": processed,
-            "total_fetched": len(google_responses),
+            "total_fetched": stream.total,
             "form_id": form_id,
         }
 
@@ -125,7 +117,8 @@ def manual_create_google_submissions(google_form_id: str, limit: Annotated[int,
 def manual_run_google_form_submissions(google_form_id: str):
     with LogFile("manual google submissions sync") as log:
         try:
-            return sync_form_submissions(google_form_id, log.file)
+            # a full re-sync also catches responses submitted before their partial submission existed
+            return sync_form_submissions(google_form_id, log.file, incremental=False)
         except Exception:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An error occurred while syncing submissions"
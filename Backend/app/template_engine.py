@@ -0,0 +1,101 @@
+"""
+Placeholder rendering for personalized emails.
+
+Subjects and bodies use bracketed placeholders such as ``[Name]`` or ``[Points]``. A template is split once into a
+list of literal segments and variable slots, so rendering it for thousands of recipients is a single ``join`` per
+recipient instead of one full-string ``replace`` per placeholder. Unknown bracketed text is left untouched.
+
+Stored templates are cached by id and ``updated_at``: editing a template bumps ``updated_at``, which makes the next
+lookup recompile it.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from threading import Lock
+from typing import Callable, Mapping
+
+NAME = "Name"
+EVENT_NAME = "Event Name"
+POINTS = "Points"
+RANK = "Rank"
+ATTENDANCE_DAYS = "Attendance Days"
+
+VARIABLES = (NAME, EVENT_NAME, POINTS, RANK, ATTENDANCE_DAYS)
+MEMBER_STATS_VARIABLES = frozenset({POINTS, RANK, ATTENDANCE_DAYS})
+
+PLACEHOLDER_PATTERN = re.compile(r"\[(" + "|".join(re.escape(v) for v in VARIABLES) + r")\]")
+
+
+class CompiledTemplate:
+    __slots__ = ("_parts", "_slots", "text", "variables")
+
+    def __init__(self, text: str):
+        self.text = text
+        # re.split with a capture group alternates literal, variable, literal, ...
+        parts = PLACEHOLDER_PATTERN.split(text)
+        self._parts = parts
+        self._slots = tuple((i, parts[i]) for i in range(1, len(parts), 2))
+        self.variables = frozenset(name for _, name in self._slots)
+
+    def render(self, values: Mapping[str, str]) -> str:
+        if not self._slots:
+            return self._parts[0]
+        parts = self._parts.copy()
+        for i, name in self._slots:
+            parts[i] = values.get(name, f"[{name}]")
+        return "".join(parts)
+
+
+@dataclass(frozen=True)
+class CompiledEmail:
+    subject: CompiledTemplate
+    html_content: CompiledTemplate
+
+    @property
+    def variables(self) -> frozenset[str]:
+        return self.subject.variables | self.html_content.variables
+
+    @property
+    def needs_member_stats(self) -> bool:
+        return bool(self.variables & MEMBER_STATS_VARIABLES)
+
+    def render(self, values: Mapping[str, str]) -> tuple[str, str]:
+        return self.subject.render(values), self.html_content.render(values)
+
+
+@lru_cache(maxsize=256)
+def compile_template(text: str) -> CompiledTemplate:
+    return CompiledTemplate(text)
+
+
+def compile_email(subject: str, html_content: str) -> CompiledEmail:
+    return CompiledEmail(compile_template(subject), compile_template(html_content))
+
+
+class StoredTemplateCache:
+    def __init__(self):
+        self._lock = Lock()
+        self._entries: dict[int, tuple[datetime, CompiledEmail]] = {}
+
+    def get_or_compile(
+        self, template_id: int, updated_at: datetime, load: Callable[[], tuple[str, str]]
+    ) -> CompiledEmail:
+        with self._lock:
+            entry = self._entries.get(template_id)
+        if entry is not None and entry[0] == updated_at:
+            return entry[1]
+        subject, html_content = load()
+        # stored bodies are large and each has its own cache slot here, so skip the ad-hoc lru
+        compiled = CompiledEmail(CompiledTemplate(subject), CompiledTemplate(html_content))
+        with self._lock:
+            self._entries[template_id] = (updated_at, compiled)
+        return compiled
+
+    def invalidate(self, template_id: int) -> None:
+        with self._lock:
+            self._entries.pop(template_id, None)
+
+
+stored_templates = StoredTemplateCache()
@@ -0,0 +1,59 @@
+"""
+Small in-process cache with a per-entry time-to-live.
+
+Used for short-lived memoization of read-heavy queries (e.g. certificate eligibility) where a few seconds of
+staleness is fine. Entries live in the worker process only, so each worker keeps its own copy.
+"""
+
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Hashable
+
+
+class TTLCache:
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            if len(self._entries) >= self._max_entries:
+                self._evict_expired()
+            if len(self._entries) >= self._max_entries:
+                # still full: drop the entry closest to expiring
+                del self._entries[min(self._entries, key=lambda k: self._entries[k][0])]
+            self._entries[key] = (monotonic() + self._ttl, value)
+
+    def get_or_set(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, predicate: Callable[[Hashable], bool] | None = None) -> None:
+        """Drop every entry, or only the ones whose key matches ``predicate``."""
+        with self._lock:
+            if predicate is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if predicate(k)]:
+                del self._entries[key]
+
+    def _evict_expired(self) -> None:
+        now = monotonic()
+        for key in [k for k, (expires_at, _) in self._entries.items() if expires_at < now]:
+            del self._entries[key]
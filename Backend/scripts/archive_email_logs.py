@@ -0,0 +1,57 @@
+"""
+Move ``email_logs`` rows older than ``EMAIL_LOG_RETENTION_DAYS`` into ``email_logs_archive`` so the hot table stays
+small. Meant to run daily from cron; the hourly usage rollup is untouched and the log viewer reads the archive
+whenever a query reaches back past the retention window.
+
+    uv run python scripts/archive_email_logs.py --dry-run
+    uv run python scripts/archive_email_logs.py --days 180
+
+``--days`` can keep more days hot than the retention window but never fewer: reads starting inside the window skip
+the archive, so rows archived early would vanish from them.
+"""
+
+import sys
+import argparse
+from datetime import datetime, timedelta
+from pathlib import Path
+
+script_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(script_dir.parent))
+
+from app.config import config
+from app.DB.main import SessionLocal
+from app.DB import emails as email_queries
+
+
+def main(days: int, batch_size: int, dry_run: bool):
+    cutoff = datetime.now() - timedelta(days=days)
+    with SessionLocal() as session:
+        if dry_run:
+            count = email_queries.count_archivable_email_logs(session, cutoff)
+            print(f"Dry run: {count} email logs sent before {cutoff:%Y-%m-%d %H:%M} would be archived.")
+            return
+
+        archived = 0
+        while True:
+            # one transaction per batch keeps lock time short while the app keeps writing new logs
+            moved = email_queries.archive_email_logs(session, cutoff, batch_size)
+            session.commit()
+            if not moved:
+                break
+            archived += moved
+            print(f"Archived {archived} email logs so far...")
+        print(f"\n{archived} email logs sent before {cutoff:%Y-%m-%d %H:%M} archived.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move old email logs into email_logs_archive")
+    parser.add_argument("--days", type=int, default=config.EMAIL_LOG_RETENTION_DAYS, help="Keep this many days hot")
+    parser.add_argument("--batch-size", type=int, default=config.EMAIL_LOG_ARCHIVE_BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="Count the logs that would move without moving them")
+    args = parser.parse_args()
+    if args.days < config.EMAIL_LOG_RETENTION_DAYS:
+        parser.error(
+            f"--days must be at least EMAIL_LOG_RETENTION_DAYS ({config.EMAIL_LOG_RETENTION_DAYS}): log reads that "
+            "start inside the retention window don't look at the archive"
+        )
+    main(args.days, args.batch_size, args.dry_run)
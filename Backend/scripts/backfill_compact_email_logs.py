@@ -0,0 +1,73 @@
+import sys
+import argparse
+from pathlib import Path
+
+script_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(script_dir.parent))
+
+from app.DB.main import SessionLocal
+from app.DB.schema import EmailLogs, Members
+from app.DB import emails as email_queries
+from app.DB import email_bodies as email_body_queries
+from sqlalchemy import func, select
+
+BATCH_SIZE = 500
+
+
+def compact(session, data: dict, members_by_email: dict[str, int]) -> dict:
+    data = dict(data)
+    data["html_hash"] = email_body_queries.store_email_body(session, data.pop("html_content") or "")
+
+    for key in ("recipients", "member"):
+        if isinstance(data.get(key), list):
+            recipients = [
+                {**r, "member_id": members_by_email.get((r.get("email") or "").lower())} for r in data.pop(key)
+            ]
+            data.update(email_queries.compact_recipients(recipients))
+    if isinstance(data.get("guaranteed_recipients"), list):
+        data["guaranteed_emails"] = [r["email"] for r in data.pop("guaranteed_recipients")]
+    return data
+
+
+def main(dry_run: bool):
+    with SessionLocal() as session:
+        members_by_email = {
+            email: member_id
+            for member_id, email in session.execute(select(Members.id, Members.email_normalized)).all()
+            if email
+        }
+        last_id = 0
+        updated = 0
+        skipped = 0
+        while True:
+            logs = session.scalars(
+                select(EmailLogs).where(EmailLogs.id > last_id).order_by(EmailLogs.id).limit(BATCH_SIZE)
+            ).all()
+            if not logs:
+                break
+            for log in logs:
+                last_id = log.id
+                if not log.data or "html_content" not in log.data:
+                    skipped += 1
+                    continue
+                print(f"Email log {log.id} ({log.email_type.value}): compacting")
+                if not dry_run:
+                    log.data = compact(session, log.data, members_by_email)
+                updated += 1
+            if not dry_run:
+                session.commit()
+
+        if not dry_run:
+            print(f"\n{updated} email logs compacted, {skipped} skipped.")
+        else:
+            session.rollback()
+            print(f"\nDry run: {updated} would be compacted, {skipped} skipped (no changes applied).")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Move email log HTML bodies into email_bodies and store member recipients as [member_id, email] pairs"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Preview changes without applying them")
+    args = parser.parse_args()
+    main(args.dry_run)
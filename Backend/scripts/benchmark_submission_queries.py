@@ -0,0 +1,123 @@
+"""
+Compare the submission queries in ``app/DB/submissions.py``, which read the base tables, against the same filters
+on the ``forms_submissions`` view they replaced. Read-only; run it against a copy of production data for numbers
+that mean anything.
+
+For each query it checks that both return the same submission ids, times ``--runs`` executions of each and prints
+the median / p95 plus MySQL's ``EXPLAIN`` so the chosen indexes (or a full scan of the view) are visible.
+
+    uv run python scripts/benchmark_submission_queries.py --event-id 42 --runs 50
+"""
+
+import sys
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+script_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(script_dir.parent))
+
+from sqlalchemy import event, select
+
+from app.DB.main import SessionLocal
+from app.DB import submissions as submission_queries
+from app.DB.schema import Forms, t_forms_submissions
+
+view = t_forms_submissions.c
+
+
+def view_queries(event_id: int, form_id: int) -> dict:
+    return {
+        "partial submissions by form": select(t_forms_submissions).where(
+            view.form_id == form_id, view.submission_type == "partial"
+        ),
+        "submissions by event": select(t_forms_submissions).where(view.event_id == event_id),
+        "accepted not invited by event": select(t_forms_submissions).where(
+            view.event_id == event_id, view.is_accepted == 1, view.is_invited == 0, view.submission_type != "partial"
+        ),
+    }
+
+
+def base_table_queries(event_id: int, form_id: int) -> dict:
+    return {
+        "partial submissions by form": lambda session: submission_queries.get_partial_submissions_by_form_id(
+            session, form_id
+        ),
+        "submissions by event": lambda session: submission_queries.get_submissions_by_event_id(session, event_id),
+        "accepted not invited by event": lambda session: submission_queries.get_accepted_not_invited_by_event(
+            session, event_id
+        ),
+    }
+
+
+def timed(run, runs: int) -> tuple[list, list[float]]:
+    timings = []
+    rows = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        rows = run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return rows, timings
+
+
+def summary(timings: list[float]) -> str:
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"median {statistics.median(ordered):.2f} ms, p95 {p95:.2f} ms"
+
+
+def explain(session, statement: str, parameters) -> list[str]:
+    rows = session.connection().exec_driver_sql(f"EXPLAIN {statement}", parameters).mappings().all()
+    return [f"{row['table']}: type={row['type']} key={row['key']} rows={row['rows']}" for row in rows]
+
+
+def issued_sql(session, run) -> tuple[str, object]:
+    """The SQL (and driver parameters) ``run`` sends, captured off the connection."""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    connection = session.connection()
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        run()
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+    return captured[-1]
+
+
+def main(event_id: int, runs: int, show_explain: bool):
+    with SessionLocal() as session:
+        form_id = session.scalar(select(Forms.id).where(Forms.event_id == event_id))
+        if form_id is None:
+            print(f"Event [{event_id}] has no form.")
+            return
+
+        base = base_table_queries(event_id, form_id)
+        for name, statement in view_queries(event_id, form_id).items():
+            view_rows, view_timings = timed(lambda: session.execute(statement).all(), runs)
+            base_rows, base_timings = timed(lambda: base[name](session), runs)
+
+            same = sorted(r.submission_id for r in view_rows) == sorted(r.submission_id for r in base_rows)
+            print(f"== {name} == ({len(base_rows)} rows, {'same' if same else 'DIFFERENT'} submission ids)")
+            print(f"  view:       {summary(view_timings)}")
+            print(f"  base table: {summary(base_timings)}")
+            if show_explain:
+                for label, run in (
+                    ("view", lambda: session.execute(statement).all()),
+                    ("base table", lambda: base[name](session)),
+                ):
+                    print(f"  {label} plan:")
+                    for line in explain(session, *issued_sql(session, run)):
+                        print(f"    {line}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark submission queries: base tables vs forms_submissions view")
+    parser.add_argument("--event-id", type=int, required=True, help="Event whose form and submissions to query")
+    parser.add_argument("--runs", type=int, default=20, help="Executions per query and variant")
+    parser.add_argument("--no-explain", action="store_true", help="Skip printing the EXPLAIN plans")
+    args = parser.parse_args()
+    main(args.event_id, args.runs, not args.no_explain)
@@ -0,0 +1,188 @@
+"""
+Local stand-in for the certificate / email service behind ``CERTIFICATE_API_URL``.
+
+Implements the endpoints the backend calls (``/blasts``, ``/emails/certificate``, ``/emails/custom``,
+``/generations/certificate`` and the generated file download) without sending anything, with configurable latency,
+error rate and throttling so the email paths can be load-tested. Point the backend at it with
+``CERTIFICATE_API_URL=http://127.0.0.1:7002`` in ``.env.local``.
+
+    uv run python scripts/fake_email_service.py --port 7002 --latency-ms 300 --jitter-ms 200 --error-rate 0.02 \
+        --max-concurrency 20 --rate-per-second 50
+
+``GET /stats`` reports what was received (requests, recipients, rejections, first/last timestamps) and
+``POST /stats/reset`` clears it between runs.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+import time
+from dataclasses import dataclass, field
+
+import uvicorn
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+
+# a minimal valid one-page PDF, enough for the download path to stream and cache
+FAKE_PDF = (
+    b"%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj\n"
+    b"3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]>>endobj\ntrailer<</Root 1 0 R>>\n%%EOF\n"
+)
+
+
+@dataclass
+class Settings:
+    latency_ms: float = 200.0
+    jitter_ms: float = 100.0
+    error_rate: float = 0.0
+    max_concurrency: int = 0  # 0 = unlimited
+    rate_per_second: float = 0.0  # 0 = unlimited
+
+
+@dataclass
+class Stats:
+    requests: dict[str, int] = field(default_factory=dict)
+    recipients: int = 0
+    errors: int = 0
+    throttled: int = 0
+    first_request_at: float | None = None
+    last_success_at: float | None = None
+
+    def snapshot(self, in_flight: int) -> dict:
+        elapsed = (
+            self.last_success_at - self.first_request_at
+            if self.first_request_at is not None and self.last_success_at is not None
+            else None
+        )
+        return {
+            "requests": dict(self.requests),
+            "recipients": self.recipients,
+            "errors": self.errors,
+            "throttled": self.throttled,
+            "in_flight": in_flight,
+            "first_request_at": self.first_request_at,
+            "last_success_at": self.last_success_at,
+            "recipients_per_second": round(self.recipients / elapsed, 2) if elapsed else None,
+        }
+
+
+class Throttle:
+    """Rejects with 429 above ``max_concurrency`` in-flight requests or ``rate_per_second`` (token bucket)."""
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.in_flight = 0
+        self._tokens = settings.rate_per_second
+        self._refilled_at = time.monotonic()
+
+    def try_acquire(self) -> bool:
+        if self.settings.max_concurrency and self.in_flight >= self.settings.max_concurrency:
+            return False
+        if self.settings.rate_per_second:
+            now = time.monotonic()
+            self._tokens = min(
+                self.settings.rate_per_second, self._tokens + (now - self._refilled_at) * self.settings.rate_per_second
+            )
+            self._refilled_at = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+        self.in_flight += 1
+        return True
+
+    def release(self) -> None:
+        self.in_flight -= 1
+
+
+def create_app(settings: Settings) -> FastAPI:
+    app = FastAPI(title="Fake email service")
+    stats = Stats()
+    throttle = Throttle(settings)
+
+    async def simulate(kind: str, recipients: int, body: dict) -> Response:
+        stats.requests[kind] = stats.requests.get(kind, 0) + 1
+        if stats.first_request_at is None:
+            stats.first_request_at = time.time()
+        if not throttle.try_acquire():
+            stats.throttled += 1
+            return JSONResponse({"detail": "Too many requests"}, status_code=429)
+        try:
+            delay = max(0.0, settings.latency_ms + random.uniform(-settings.jitter_ms, settings.jitter_ms))
+            await asyncio.sleep(delay / 1000)
+            if random.random() < settings.error_rate:
+                stats.errors += 1
+                return JSONResponse({"detail": "Simulated upstream failure"}, status_code=random.choice((502, 503)))
+            stats.recipients += recipients
+            stats.last_success_at = time.time()
+            return JSONResponse(body)
+        finally:
+            throttle.release()
+
+    @app.post("/blasts")
+    async def blasts(request: Request):
+        # query parameters + text/html body by default, one JSON body with BLAST_API_JSON_BODY=true
+        if request.headers.get("content-type", "").startswith("application/json"):
+            emails = (await request.json()).get("emails") or []
+        else:
+            await request.body()
+            emails = request.query_params.getlist("emails")
+        return await simulate("blasts", len(emails), {"status": "sent", "recipients": len(emails)})
+
+    @app.post("/emails/certificate")
+    async def certificate_email(request: Request):
+        await request.json()
+        return await simulate("emails/certificate", 1, {"status": "sent"})
+
+    @app.post("/emails/custom")
+    async def custom_email(request: Request):
+        await request.json()
+        return await simulate("emails/custom", 1, {"status": "sent"})
+
+    @app.post("/generations/certificate")
+    async def generate_certificate(request: Request):
+        payload = await request.body()
+        key = hashlib.sha256(payload).hexdigest()[:32]
+        url = f"{str(request.base_url).rstrip('/')}/files/{key}.pdf"
+        return await simulate("generations/certificate", 0, {"url": url})
+
+    @app.get("/files/{name}")
+    async def file(name: str):
+        return Response(FAKE_PDF, media_type="application/pdf")
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats.snapshot(throttle.in_flight)
+
+    @app.post("/stats/reset")
+    async def reset_stats():
+        nonlocal stats
+        stats = Stats()
+        return {"status": "reset"}
+
+    return app
+
+
+# `uvicorn scripts.fake_email_service:app` uses the defaults; the CLI below exposes every knob
+app = create_app(Settings())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a fake certificate/email service for load testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7002)
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="Mean simulated upstream latency")
+    parser.add_argument("--jitter-ms", type=float, default=100.0, help="Uniform +/- jitter around the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 502/503")
+    parser.add_argument("--max-concurrency", type=int, default=0, help="429 above this many in-flight (0 = off)")
+    parser.add_argument("--rate-per-second", type=float, default=0.0, help="429 above this request rate (0 = off)")
+    args = parser.parse_args()
+
+    settings = Settings(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        max_concurrency=args.max_concurrency,
+        rate_per_second=args.rate_per_second,
+    )
+    uvicorn.run(create_app(settings), host=args.host, port=args.port, log_level="warning")
@@ -36,6 +36,7 @@ sys.path.insert(0, str(script_dir.parent))
 
 from sqlalchemy import func, select
 from app.DB.main import SessionLocal
+from app.DB.members import refresh_member_last_activity
 from app.DB.schema import EmailLogs, EmailTemplates, Members, MembersLogs, Role, Submissions
 
 
@@ -159,6 +160,8 @@ def merge_group(session, members: list[Members], report: list[str]) -> dict:
         session.flush()
         session.delete(dup)
 
+    session.flush()
+    refresh_member_last_activity(session, [canonical.id])
     return stats
 
 
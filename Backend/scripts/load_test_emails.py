@@ -0,0 +1,201 @@
+"""
+Load test for the email endpoints, meant to run against a local backend whose ``CERTIFICATE_API_URL`` points at
+``scripts/fake_email_service.py`` -- never against production, it really queues sends.
+
+Each scenario fires ``--requests`` calls at one endpoint with ``--concurrency`` in flight, then waits until the fake
+service has received every expected recipient. It reports:
+
+- request throughput and latency of the endpoint itself (how long the admin waits for the job to be queued)
+- end-to-end send time and recipients/sec as seen by the fake service
+- peak DB pool usage, sampled from ``GET /health/db/pool`` while the jobs run
+
+    uv run python scripts/load_test_emails.py --token "$ADMIN_JWT" --event-id 42 --member-ids 1,2,3 \
+        --scenarios blast,custom,certificates --requests 20 --concurrency 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass, field
+
+import httpx
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    latencies_ms: list[float] = field(default_factory=list)
+    failures: int = 0
+    expected_recipients: int = 0
+    received_recipients: int = 0
+    requests_elapsed_s: float = 0.0
+    end_to_end_s: float | None = None
+    peak_checked_out: int = 0
+    peak_overflow: int = 0
+    upstream_errors: int = 0
+    upstream_throttled: int = 0
+
+    def report(self) -> str:
+        ok = len(self.latencies_ms)
+        lines = [f"== {self.name} =="]
+        if ok:
+            ordered = sorted(self.latencies_ms)
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+            lines.append(
+                f"  requests: {ok} ok, {self.failures} failed, {ok / self.requests_elapsed_s:.1f} req/s, "
+                f"p50 {statistics.median(ordered):.0f} ms, p95 {p95:.0f} ms"
+            )
+        else:
+            lines.append(f"  requests: 0 ok, {self.failures} failed")
+        lines.append(
+            f"  recipients: {self.received_recipients}/{self.expected_recipients} received by the fake service"
+        )
+        if self.end_to_end_s:
+            lines.append(
+                f"  end-to-end: {self.end_to_end_s:.1f} s, {self.received_recipients / self.end_to_end_s:.1f} recipients/s"
+            )
+        else:
+            lines.append("  end-to-end: did not finish before the timeout")
+        lines.append(f"  upstream: {self.upstream_errors} simulated errors, {self.upstream_throttled} throttled")
+        lines.append(f"  db pool: peak {self.peak_checked_out} checked out, peak overflow {self.peak_overflow}")
+        return "\n".join(lines)
+
+
+async def sample_pool(backend: httpx.AsyncClient, result: ScenarioResult, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        try:
+            pool = (await backend.get("/health/db/pool")).json()
+            result.peak_checked_out = max(result.peak_checked_out, pool["checked_out"])
+            result.peak_overflow = max(result.peak_overflow, pool["overflow"])
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.2)
+
+
+async def fire(
+    backend: httpx.AsyncClient, result: ScenarioResult, concurrency: int, requests: list[tuple[str, str, dict | None]]
+) -> list[dict]:
+    semaphore = asyncio.Semaphore(concurrency)
+    bodies: list[dict] = []
+
+    async def one(method: str, path: str, payload: dict | None) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                response = await backend.request(method, path, json=payload)
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                result.failures += 1
+                print(f"  {method} {path} failed: {e}")
+                return
+            result.latencies_ms.append((time.perf_counter() - started) * 1000)
+            bodies.append(response.json())
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(*r) for r in requests))
+    result.requests_elapsed_s = time.perf_counter() - started
+    return bodies
+
+
+async def wait_for_recipients(fake: httpx.AsyncClient, result: ScenarioResult, timeout_s: float) -> None:
+    deadline = time.monotonic() + timeout_s
+    while True:
+        stats = (await fake.get("/stats")).json()
+        result.received_recipients = stats["recipients"]
+        result.upstream_errors = stats["errors"]
+        result.upstream_throttled = stats["throttled"]
+        if result.expected_recipients == 0:
+            return
+        if stats["recipients"] >= result.expected_recipients:
+            result.end_to_end_s = stats["last_success_at"] - stats["first_request_at"]
+            return
+        if time.monotonic() > deadline:
+            return
+        await asyncio.sleep(0.5)
+
+
+def build_requests(args, scenario: str) -> list[tuple[str, str, dict | None]]:
+    html = "<p>Load test for [Name]</p>"
+    if scenario == "blast":
+        payload = {
+            "subject": "Load test",
+            "html_content": html,
+            "count": args.blast_count,
+            "order_by": "activity",
+            "guaranteed_recipients": [],
+            "attachments": [],
+        }
+        return [("POST", "/emails/blast", payload)] * args.requests
+    if scenario == "custom":
+        payload = {
+            "subject": "Load test [Event Name]",
+            "html_content": html,
+            "members": [{"member_id": member_id} for member_id in args.member_ids],
+            "attachments": [],
+        }
+        return [("POST", f"/emails/custom/{args.event_id}", payload)] * args.requests
+    if scenario == "certificates":
+        # repeated sends to the same event must not double-send: the claims make every run after the first a no-op
+        return [("POST", f"/emails/{args.event_id}", None)] * args.requests
+    raise ValueError(f"Unknown scenario {scenario}")
+
+
+def expected_recipients(args, scenario: str, bodies: list[dict]) -> int:
+    if scenario == "blast":
+        return sum(body.get("recipient_count", 0) for body in bodies)
+    if scenario == "custom":
+        return len(bodies) * len(args.member_ids)
+    return args.certificate_eligible
+
+
+async def run_scenario(args, scenario: str) -> ScenarioResult:
+    result = ScenarioResult(name=scenario)
+    headers = {"Authorization": f"Bearer {args.token}"}
+    async with (
+        httpx.AsyncClient(base_url=args.backend_url, headers=headers, timeout=120.0) as backend,
+        httpx.AsyncClient(base_url=args.fake_url, timeout=10.0) as fake,
+    ):
+        await fake.post("/stats/reset")
+        if scenario == "certificates":
+            eligible = await backend.get(f"/emails/certificate-event/eligible-count/{args.event_id}")
+            eligible.raise_for_status()
+            args.certificate_eligible = eligible.json()["eligible_count"]
+
+        stop = asyncio.Event()
+        sampler = asyncio.create_task(sample_pool(backend, result, stop))
+        try:
+            bodies = await fire(backend, result, args.concurrency, build_requests(args, scenario))
+            result.expected_recipients = expected_recipients(args, scenario, bodies)
+            await wait_for_recipients(fake, result, args.timeout)
+        finally:
+            stop.set()
+            await sampler
+    return result
+
+
+async def main(args) -> None:
+    for scenario in args.scenarios:
+        print(f"Running [{scenario}] with [{args.requests}] requests, [{args.concurrency}] in flight...")
+        print((await run_scenario(args, scenario)).report())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the email endpoints against the fake email service")
+    parser.add_argument("--backend-url", default="http://127.0.0.1:7001")
+    parser.add_argument("--fake-url", default="http://127.0.0.1:7002")
+    parser.add_argument("--token", required=True, help="Admin bearer token for the backend")
+    parser.add_argument("--scenarios", default="blast,custom,certificates", type=lambda v: v.split(","))
+    parser.add_argument("--event-id", type=int, help="Event for the custom and certificate scenarios")
+    parser.add_argument("--member-ids", default="", type=lambda v: [int(i) for i in v.split(",") if i])
+    parser.add_argument("--blast-count", type=int, default=200, help="Recipients per blast request")
+    parser.add_argument("--requests", type=int, default=10, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=5, help="Requests in flight at once")
+    parser.add_argument("--timeout", type=float, default=600.0, help="Seconds to wait for all sends to arrive")
+    args = parser.parse_args()
+
+    if {"custom", "certificates"} & set(args.scenarios) and args.event_id is None:
+        parser.error("--event-id is required for the custom and certificates scenarios")
+    if "custom" in args.scenarios and not args.member_ids:
+        parser.error("--member-ids is required for the custom scenario")
+    asyncio.run(main(args))
@@ -0,0 +1,477 @@
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.config import config
+from app.DB import blasts as blast_queries
+from app.DB.schema import EmailBlastsStatus
+from tests.utils import assert_2xx, assert_conflict, assert_forbidden, assert_not_found
+
+
+def create_blast(db_session: Session, seed_refs, recipient_count: int = 3, **overrides):
+    fields = {
+        "subject": "Hello",
+        "html_content": "<p>Hello</p>",
+        "preview_text": None,
+        "attachments": [],
+        "order_by": "alphabetical",
+        "requested_count": recipient_count,
+        "recipients": [{"name": f"R{i}", "email": f"r{i}@example.com"} for i in range(recipient_count)],
+        "guaranteed_emails": [],
+        "chunk_size": 2,
+        "sent_by": seed_refs.ahmed.id,
+    }
+    fields.update(overrides)
+    blast = blast_queries.create_blast(db_session, **fields)
+    db_session.commit()
+    return blast
+
+
+def test_blast_api_request_keeps_the_query_string_contract_by_default():
+    from app.DB.schema import EmailLogsFromAddress
+    from app.routers.emails import blast_api_request
+
+    request = blast_api_request(
+        ["a@example.com", "b@example.com"],
+        "Hello",
+        "<p>Hi</p>",
+        EmailLogsFromAddress.INFO_KERNELTICS,
+        attachments=[{"filename": "a.pdf", "url": "https://example.com/a.pdf"}],
+    )
+
+    assert request["content"] == "<p>Hi</p>"
+    assert request["headers"] == {"Content-Type": "text/html; charset=utf-8"}
+    assert request["params"]["emails"] == ["a@example.com", "b@example.com"]
+    assert request["params"]["attachments"] == '[{"filename": "a.pdf", "url": "https://example.com/a.pdf"}]'
+
+
+def test_blast_status_requires_admin(client: TestClient):
+    assert_forbidden(client.get("/emails/blast/1"))
+
+
+def test_blast_status_not_found(admin_client: TestClient):
+    assert_not_found(admin_client.get("/emails/blast/999999"))
+
+
+def test_blast_status_reports_progress(admin_client: TestClient, db_session: Session, seed_refs):
+    blast = create_blast(db_session, seed_refs, recipient_count=5)
+    blast_queries.record_chunk_sent(db_session, blast, 2)
+    db_session.commit()
+
+    response = admin_client.get(f"/emails/blast/{blast.id}")
+    assert_2xx(response)
+    body = response.json()
+    assert body["status"] == "queued"
+    assert body["sent_count"] == 2
+    assert body["total_recipients"] == 5
+
+
+def test_claim_blast_is_exclusive(db_session: Session, seed_refs):
+    blast = create_blast(db_session, seed_refs)
+
+    assert blast_queries.claim_blast(db_session, blast.id) is True
+    assert blast_queries.claim_blast(db_session, blast.id) is False
+
+
+def test_stale_sending_blast_can_be_resumed(admin_client: TestClient, db_session: Session, seed_refs):
+    blast = create_blast(db_session, seed_refs)
+    assert blast_queries.claim_blast(db_session, blast.id) is True
+    db_session.commit()
+    # a job that is still sending holds the blast
+    assert_conflict(admin_client.post(f"/emails/blast/{blast.id}/resume"))
+
+    # its job died: no chunk recorded for longer than the stale timeout
+    db_session.refresh(blast)
+    blast.updated_at = datetime.now() - timedelta(seconds=config.BLAST_SENDING_STALE_SECONDS + 60)
+    db_session.commit()
+    assert blast_queries.is_blast_resumable(blast, datetime.now()) is True
+    assert blast_queries.claim_blast(db_session, blast.id) is True
+    assert blast_queries.claim_blast(db_session, blast.id) is False
+
+
+def test_resume_completed_blast_conflicts(admin_client: TestClient, db_session: Session, seed_refs):
+    blast = create_blast(db_session, seed_refs)
+    blast_queries.set_blast_status(db_session, blast, EmailBlastsStatus.COMPLETED)
+    db_session.commit()
+
+    assert_conflict(admin_client.post(f"/emails/blast/{blast.id}/resume"))
+
+
+def test_blast_activity_order_follows_member_logs(db_session: Session, seed_refs):
+    from datetime import datetime, timedelta
+    from app.DB import logs as log_queries, members as member_queries
+
+    log = log_queries.create_log(db_session, None, seed_refs.member_action.id)
+    log_queries.create_member_log(db_session, seed_refs.ahmed.id, log.id, datetime.now() - timedelta(days=2))
+    log_queries.create_member_log(db_session, seed_refs.sara.id, log.id, datetime.now() - timedelta(days=1))
+
+    recipients = member_queries.get_blast_recipients_by_activity(db_session, limit=2, exclude_ids=[])
+    assert [m.id for m in recipients] == [seed_refs.sara.id, seed_refs.ahmed.id]
+
+    # removing sara's only log drops her behind ahmed again
+    log_queries.delete_member_log(db_session, seed_refs.sara.id, log.id, datetime.now() - timedelta(days=1))
+    recipients = member_queries.get_blast_recipients_by_activity(db_session, limit=2, exclude_ids=[])
+    assert recipients[0].id == seed_refs.ahmed.id
+
+
+def test_deleting_a_log_refreshes_member_last_activity(db_session: Session, seed_refs):
+    from app.DB import logs as log_queries
+    from app.DB.schema import Members
+
+    older = datetime.now().replace(microsecond=0) - timedelta(days=3)
+    newer = older + timedelta(days=2)
+    old_log = log_queries.create_log(db_session, None, seed_refs.member_action.id)
+    log_queries.create_member_log(db_session, seed_refs.sara.id, old_log.id, older)
+    new_log = log_queries.create_log(db_session, None, seed_refs.member_action.id)
+    log_queries.create_member_log(db_session, seed_refs.sara.id, new_log.id, newer)
+    db_session.commit()
+    assert db_session.get(Members, seed_refs.sara.id).last_activity_at == newer
+
+    assert log_queries.delete_log(db_session, new_log.id) is True
+    db_session.commit()
+    db_session.expire_all()
+    assert db_session.get(Members, seed_refs.sara.id).last_activity_at == older
+
+    assert log_queries.delete_log(db_session, old_log.id) is True
+    db_session.commit()
+    db_session.expire_all()
+    assert db_session.get(Members, seed_refs.sara.id).last_activity_at is None
+
+
+def test_certificate_eligible_count_excludes_already_sent(admin_client: TestClient, db_session: Session, seed_refs):
+    from datetime import datetime
+    from app.DB import emails as email_queries, logs as log_queries
+    from app.DB.schema import EmailLogsEmailType, EmailLogsFromAddress
+    from tests.factories import make_create_event_payload
+
+    response = admin_client.post("/events", json=make_create_event_payload(seed_refs))
+    assert_2xx(response)
+    event_id = response.json()["id"]
+
+    log = log_queries.create_log(db_session, event_id, seed_refs.member_action.id)
+    log_queries.create_member_log(db_session, seed_refs.ahmed.id, log.id, datetime(2026, 6, 29, 12))
+    log_queries.create_member_log(db_session, seed_refs.sara.id, log.id, datetime(2026, 6, 29, 13))
+    email_queries.create_email_log(
+        db_session,
+        sent_by=seed_refs.ahmed.id,
+        from_address=EmailLogsFromAddress.INFO_KERNELTICS,
+        email_type=EmailLogsEmailType.EVENT_CERTIFICATE,
+        member_id=seed_refs.sara.id,
+        event_id=event_id,
+    )
+    db_session.commit()
+
+    response = admin_client.get(f"/emails/certificate-event/eligible-count/{event_id}")
+    assert_2xx(response)
+    body = response.json()
+    assert [m["id"] for m in body["eligible_members"]] == [seed_refs.ahmed.id]
+    assert body["eligible_count"] == 1
+    assert body["sent_count"] == 1
+
+
+def test_full_attendance_agrees_across_certificate_queries(admin_client: TestClient, db_session: Session, seed_refs):
+    from app.DB import emails as email_queries, events as events_queries, logs as log_queries
+    from tests.factories import make_create_event_payload, make_event
+
+    two_days = make_event(start_datetime="2026-06-29T00:00:00", end_datetime="2026-06-30T00:00:00")
+    response = admin_client.post("/events", json=make_create_event_payload(seed_refs, event=two_days))
+    assert_2xx(response)
+    event_id = response.json()["id"]
+
+    log = log_queries.create_log(db_session, event_id, seed_refs.member_action.id)
+    for day in (29, 30):
+        log_queries.create_member_log(db_session, seed_refs.ahmed.id, log.id, datetime(2026, 6, day, 12))
+    log_queries.create_member_log(db_session, seed_refs.sara.id, log.id, datetime(2026, 6, 29, 12))
+    db_session.commit()
+    event = events_queries.get_event_by_id(db_session, event_id)
+
+    assert [m["id"] for m in log_queries.get_full_attendance_members(db_session, event)] == [seed_refs.ahmed.id]
+    assert [m["id"] for m in email_queries.get_certificate_eligible_members(db_session, event)] == [seed_refs.ahmed.id]
+    assert log_queries.has_attended_all_days(db_session, event, seed_refs.ahmed.id) is True
+    assert log_queries.has_attended_all_days(db_session, event, seed_refs.sara.id) is False
+
+
+def test_email_usage_reads_hourly_rollup(admin_client: TestClient, db_session: Session, seed_refs):
+    from app.DB import emails as email_queries
+    from app.DB.schema import EmailLogsEmailType, EmailLogsFromAddress
+
+    for count in (3, 4):
+        email_queries.create_email_log(
+            db_session,
+            sent_by=seed_refs.ahmed.id,
+            from_address=EmailLogsFromAddress.GDG_QASSIM,
+            email_type=EmailLogsEmailType.BLAST,
+            recipient_count=count,
+        )
+    db_session.commit()
+
+    assert email_queries.get_email_address_usage(db_session, 1, EmailLogsFromAddress.GDG_QASSIM) == 7
+    assert email_queries.get_email_address_usage(db_session, 1, EmailLogsFromAddress.INFO_KERNELTICS) == 0
+
+    response = admin_client.get("/emails/stats/dashboard", params={"period": 30})
+    assert_2xx(response)
+    assert response.json()["by_type"] == {"blast": 7}
+
+
+def test_enriched_logs_cursor_pages_without_overlap(admin_client: TestClient, db_session: Session, seed_refs):
+    from app.DB import emails as email_queries
+    from app.DB.schema import EmailLogsEmailType, EmailLogsFromAddress
+
+    # same-second logs share sent_at, so only the id tiebreaker keeps pages apart
+    for _ in range(5):
+        email_queries.create_email_log(
+            db_session,
+            sent_by=seed_refs.ahmed.id,
+            from_address=EmailLogsFromAddress.INFO_KERNELTICS,
+            email_type=EmailLogsEmailType.ACCEPTANCE,
+        )
+    db_session.commit()
+
+    seen = []
+    params = {"email_type": "acceptance", "limit": 2}
+    while True:
+        response = admin_client.get("/emails/logs/enriched", params=params)
+        assert_2xx(response)
+        seen += [log["id"] for log in response.json()]
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params["cursor"] = response.headers["X-Next-Cursor"]
+
+    assert len(seen) == 5
+    assert seen == sorted(seen, reverse=True)
+
+
+def test_archived_logs_stay_visible_to_the_log_viewer(admin_client: TestClient, db_session: Session, seed_refs):
+    from datetime import datetime, timedelta
+    from app.DB import emails as email_queries
+    from app.DB.schema import EmailLogs, EmailLogsEmailType, EmailLogsFromAddress
+
+    old_sent_at = datetime.now() - timedelta(days=400)
+    logs = []
+    for _ in range(3):
+        log = email_queries.create_email_log(
+            db_session,
+            sent_by=seed_refs.ahmed.id,
+            from_address=EmailLogsFromAddress.INFO_KERNELTICS,
+            email_type=EmailLogsEmailType.ACCEPTANCE,
+        )
+        logs.append(log)
+    for log in logs[:2]:
+        log.sent_at = old_sent_at
+    db_session.commit()
+    old_ids = {log.id for log in logs[:2]}
+
+    cutoff = datetime.now() - timedelta(days=1)
+    assert email_queries.archive_email_logs(db_session, cutoff, batch_size=1) == 1
+    assert email_queries.archive_email_logs(db_session, cutoff, batch_size=10) == 1
+    assert email_queries.archive_email_logs(db_session, cutoff, batch_size=10) == 0
+    db_session.commit()
+    assert db_session.get(EmailLogs, logs[0].id) is None
+
+    response = admin_client.get("/emails/logs/enriched", params={"email_type": "acceptance"})
+    assert_2xx(response)
+    assert [log["id"] for log in response.json()] == [logs[2].id, *sorted(old_ids, reverse=True)]
+
+    recent = admin_client.get(
+        "/emails/logs/enriched", params={"email_type": "acceptance", "start_date": cutoff.isoformat()}
+    )
+    assert_2xx(recent)
+    assert [log["id"] for log in recent.json()] == [logs[2].id]
+
+    assert_2xx(admin_client.get(f"/emails/logs/{logs[0].id}/details"))
+
+
+def test_event_and_member_log_reads_include_the_archive(admin_client: TestClient, db_session: Session, seed_refs):
+    from app.DB import emails as email_queries
+    from app.DB.schema import EmailLogs, EmailLogsEmailType, EmailLogsFromAddress
+    from tests.factories import make_create_event_payload
+
+    response = admin_client.post("/events", json=make_create_event_payload(seed_refs))
+    assert_2xx(response)
+    event_id = response.json()["id"]
+
+    logs = [
+        email_queries.create_email_log(
+            db_session,
+            sent_by=seed_refs.ahmed.id,
+            from_address=EmailLogsFromAddress.INFO_KERNELTICS,
+            email_type=EmailLogsEmailType.EVENT_CERTIFICATE,
+            member_id=seed_refs.sara.id,
+            event_id=event_id,
+        )
+        for _ in range(2)
+    ]
+    archived, recent = logs
+    archived.sent_at = datetime.now() - timedelta(days=400)
+    db_session.commit()
+    archived_id, archived_sent_at, recent_id = archived.id, archived.sent_at, recent.id
+    assert email_queries.archive_email_logs(db_session, datetime.now() - timedelta(days=1), batch_size=10) == 1
+    db_session.commit()
+    assert db_session.get(EmailLogs, archived_id) is None
+
+    expected = [recent_id, archived_id]
+    assert [row["id"] for row in email_queries.get_email_logs_by_event_id(db_session, event_id)] == expected
+    by_member = email_queries.get_email_logs_by_member_id(db_session, seed_refs.sara.id)
+    assert [row["id"] for row in by_member if row["event_id"] == event_id] == expected
+    assert [row["id"] for row in email_queries.get_event_certificate_email_log(db_session, event_id)] == expected
+    assert email_queries.get_email_log_sort_key(db_session, archived_id) == (archived_sent_at, archived_id)
+
+
+def test_enriched_logs_rejects_malformed_cursor(admin_client: TestClient):
+    from tests.utils import assert_bad_request
+
+    assert_bad_request(admin_client.get("/emails/logs/enriched", params={"cursor": "not-a-cursor"}))
+
+
+def test_email_log_details_rehydrates_compact_data(admin_client: TestClient, db_session: Session, seed_refs):
+    from app.DB import email_bodies as email_body_queries, emails as email_queries
+    from app.DB.schema import EmailLogsEmailType, EmailLogsFromAddress
+
+    html = "<p>Hello everyone</p>"
+    recipients = [
+        {"name": seed_refs.ahmed.name, "email": seed_refs.ahmed.email, "member_id": seed_refs.ahmed.id},
+        {"name": "Guest", "email": "guest@example.com"},
+    ]
+    log = email_queries.create_email_log(
+        db_session,
+        sent_by=seed_refs.ahmed.id,
+        from_address=EmailLogsFromAddress.GDG_QASSIM,
+        email_type=EmailLogsEmailType.BLAST,
+        recipient_count=2,
+        data={
+            "subject": "Hi",
+            # storing the same body twice keeps a single row
+            "html_hash": email_body_queries.store_email_body(db_session, html),
+            "guaranteed_emails": ["guest@example.com"],
+            **email_queries.compact_recipients(recipients),
+        },
+    )
+    assert email_body_queries.store_email_body(db_session, html) == log.data["html_hash"]
+    db_session.commit()
+
+    listed = admin_client.get("/emails/logs/enriched", params={"email_type": "blast"}).json()
+    assert "html_content" not in listed[0]["data"]
+
+    response = admin_client.get(f"/emails/logs/{log.id}/details")
+    assert_2xx(response)
+    data = response.json()["data"]
+    assert data["html_content"] == html
+    assert [r["email"] for r in data["recipients"]] == [seed_refs.ahmed.email, "guest@example.com"]
+    assert data["guaranteed_recipients"] == [{"name": "Guest", "email": "guest@example.com"}]
+
+
+def test_email_log_details_keep_the_address_the_mail_went_to(admin_client: TestClient, db_session: Session, seed_refs):
+    from app.DB import emails as email_queries
+    from app.DB.schema import EmailLogsEmailType, EmailLogsFromAddress
+
+    sent_to = seed_refs.ahmed.email
+    log = email_queries.create_email_log(
+        db_session,
+        sent_by=seed_refs.ahmed.id,
+        from_address=EmailLogsFromAddress.GDG_QASSIM,
+        email_type=EmailLogsEmailType.BLAST,
+        recipient_count=1,
+        data=email_queries.compact_recipients(
+            [{"name": seed_refs.ahmed.name, "email": sent_to, "member_id": seed_refs.ahmed.id}]
+        ),
+    )
+    # written by the earlier compact form, which kept only ids; 999999 stands in for a deleted member
+    legacy = email_queries.create_email_log(
+        db_session,
+        sent_by=seed_refs.ahmed.id,
+        from_address=EmailLogsFromAddress.GDG_QASSIM,
+        email_type=EmailLogsEmailType.BLAST,
+        recipient_count=2,
+        data={"recipient_member_ids": [seed_refs.sara.id, 999999], "external_recipients": []},
+    )
+    seed_refs.ahmed.email = "changed-later@example.com"
+    db_session.commit()
+
+    recipients = admin_client.get(f"/emails/logs/{log.id}/details").json()["data"]["recipients"]
+    assert recipients == [{"name": seed_refs.ahmed.name, "email": sent_to, "member_id": seed_refs.ahmed.id}]
+
+    recipients = admin_client.get(f"/emails/logs/{legacy.id}/details").json()["data"]["recipients"]
+    assert recipients == [
+        {"name": seed_refs.sara.name, "email": seed_refs.sara.email, "member_id": seed_refs.sara.id},
+        {"name": None, "email": None, "member_id": 999999},
+    ]
+
+
+def test_email_log_details_not_found(admin_client: TestClient):
+    assert_not_found(admin_client.get("/emails/logs/999999/details"))
+
+
+def test_acceptance_progress_for_event_without_submissions(admin_client: TestClient, seed_refs):
+    from tests.factories import make_create_event_payload
+
+    response = admin_client.post("/events", json=make_create_event_payload(seed_refs))
+    assert_2xx(response)
+    event_id = response.json()["id"]
+
+    response = admin_client.get(f"/emails/acceptance/blasts/{event_id}/progress")
+    assert_2xx(response)
+    assert response.json() == {"accepted": 0, "invited": 0, "remaining": 0, "running": False}
+
+
+def test_acceptance_progress_event_not_found(admin_client: TestClient):
+    assert_not_found(admin_client.get("/emails/acceptance/blasts/999999/progress"))
+
+
+def test_prerender_progress_counts_rendered_certificates(admin_client: TestClient, db_session: Session, seed_refs):
+    from datetime import datetime
+    from app.DB import certificates as certificate_queries, logs as log_queries
+    from tests.factories import make_create_event_payload
+
+    response = admin_client.post("/events", json=make_create_event_payload(seed_refs))
+    assert_2xx(response)
+    event_id = response.json()["id"]
+
+    log = log_queries.create_log(db_session, event_id, seed_refs.member_action.id)
+    log_queries.create_member_log(db_session, seed_refs.ahmed.id, log.id, datetime(2026, 6, 29, 12))
+    log_queries.create_member_log(db_session, seed_refs.sara.id, log.id, datetime(2026, 6, 29, 13))
+    for file_url in ("https://files.example.com/a.pdf", "https://files.example.com/b.pdf"):
+        certificate_queries.upsert_certificate(
+            db_session,
+            event_id=event_id,
+            member_id=seed_refs.ahmed.id,
+            language="ar",
+            format="pdf",
+            cache_key="0" * 64,
+            file_url=file_url,
+        )
+    db_session.commit()
+
+    response = admin_client.get(f"/emails/certificates/{event_id}/prerender")
+    assert_2xx(response)
+    assert response.json() == {"attendees": 2, "rendered": 1}
+    stored = certificate_queries.get_certificate(db_session, event_id, seed_refs.ahmed.id, "ar", "pdf")
+    assert stored is not None and stored.file_url == "https://files.example.com/b.pdf"
+
+
+def test_certificate_send_claim_is_exclusive(admin_client: TestClient, db_session: Session, seed_refs):
+    from datetime import datetime, timedelta
+    from app.DB import email_claims as email_claim_queries
+    from app.DB.schema import EmailLogsEmailType, EmailSendClaims
+    from tests.factories import make_create_event_payload
+
+    response = admin_client.post("/events", json=make_create_event_payload(seed_refs))
+    assert_2xx(response)
+    key = {"event_id": response.json()["id"], "member_id": seed_refs.ahmed.id}
+    email_type = EmailLogsEmailType.EVENT_CERTIFICATE
+
+    assert email_claim_queries.claim_email_send(db_session, email_type=email_type, token="a" * 32, **key)
+    assert not email_claim_queries.claim_email_send(db_session, email_type=email_type, token="b" * 32, **key)
+
+    # a claim abandoned by a dead job can be taken over once it's stale
+    claim = db_session.get(EmailSendClaims, (key["event_id"], key["member_id"], email_type))
+    claim.claimed_at = datetime.now() - timedelta(days=1)
+    db_session.flush()
+    assert email_claim_queries.claim_email_send(db_session, email_type=email_type, token="b" * 32, **key)
+
+    email_claim_queries.mark_email_sent(db_session, email_type=email_type, token="b" * 32, email_log_id=1, **key)
+    email_claim_queries.release_email_send(db_session, email_type=email_type, token="b" * 32, **key)
+    db_session.refresh(claim)
+    claim.claimed_at = datetime.now() - timedelta(days=1)
+    db_session.flush()
+    assert not email_claim_queries.claim_email_send(db_session, email_type=email_type, token="c" * 32, **key)
@@ -126,6 +126,147 @@ def test_get_form_by_google_form_id_not_found(db_session):
     assert form is None
 
 
+def test_google_sync_bulk_helpers(admin_client: TestClient, db_session, seed_refs):
+    """The batched helpers the Google sync uses: email lookup, partial completion and submission creation."""
+    from app.DB import members as member_queries, submissions as submission_queries
+
+    event_response = admin_client.post("/events", json=make_create_event_payload(form_type="google"))
+    assert_2xx(event_response)
+    form_id = admin_client.get(f"/events/{event_response.json()['id']}/form").json()["id"]
+
+    member_ids = member_queries.get_member_ids_by_emails(
+        db_session, ["AHMED@example.com", "sara@example.com", "nobody@example.com"]
+    )
+    assert member_ids == {"ahmed@example.com": seed_refs.ahmed.id, "sara@example.com": seed_refs.sara.id}
+
+    partial = submission_queries.create_submission(db_session, form_id, "partial", seed_refs.ahmed.id)
+    answers = {"q1": {"textAnswers": {"answers": [{"value": "ahmed@example.com"}]}}}
+    assert submission_queries.complete_partial_submissions(db_session, {partial.id: ("resp-1", answers)}) == 1
+    # already google now, so a second pass leaves it alone
+    assert submission_queries.complete_partial_submissions(db_session, {partial.id: ("resp-2", {})}) == 0
+
+    assert submission_queries.get_submitted_member_ids(
+        db_session, form_id, [seed_refs.ahmed.id, seed_refs.sara.id]
+    ) == {seed_refs.ahmed.id}
+    created = submission_queries.create_google_submissions(
+        db_session, form_id, {seed_refs.ahmed.id: ("resp-3", {}), seed_refs.sara.id: ("resp-4", {})}
+    )
+    assert created == 1
+    db_session.commit()
+
+    ahmed = submission_queries.get_submission_by_form_and_member(db_session, form_id, seed_refs.ahmed.id)
+    assert (ahmed.google_submission_id, ahmed.google_submission_value) == ("resp-1", answers)
+    sara = submission_queries.get_submission_by_form_and_member(db_session, form_id, seed_refs.sara.id)
+    assert sara.submission_type == "google"
+
+
+def test_submission_queries_match_the_view(admin_client: TestClient, db_session, seed_refs):
+    """The base-table submission queries return the same rows as the forms_submissions view they replaced."""
+    from sqlalchemy import select
+
+    from app.DB import submissions as submission_queries
+    from app.DB.schema import t_forms_submissions
+
+    event_response = admin_client.post("/events", json=make_create_event_payload(form_type="google"))
+    assert_2xx(event_response)
+    event_id = event_response.json()["id"]
+    form_id = admin_client.get(f"/events/{event_id}/form").json()["id"]
+
+    partial = submission_queries.create_submission(db_session, form_id, "partial", seed_refs.ahmed.id)
+    accepted = submission_queries.create_submission(db_session, form_id, "google", seed_refs.sara.id)
+    accepted.is_accepted = 1
+    db_session.commit()
+
+    view = t_forms_submissions.c
+    by_event = submission_queries.get_submissions_by_event_id(db_session, event_id)
+    from_view = db_session.execute(select(t_forms_submissions).where(view.event_id == event_id)).all()
+    assert sorted(tuple(row._mapping.items()) for row in by_event) == sorted(
+        tuple(row._mapping.items()) for row in from_view
+    )
+
+    partials = submission_queries.get_partial_submissions_by_form_id(db_session, form_id)
+    assert [(row.submission_id, row.email) for row in partials] == [(partial.id, seed_refs.ahmed.email)]
+
+    pending = submission_queries.get_accepted_not_invited_by_event(db_session, event_id)
+    assert [row.submission_id for row in pending] == [accepted.id]
+    assert submission_queries.get_acceptance_progress(db_session, event_id) == {
+        "accepted": 1,
+        "invited": 0,
+        "remaining": 1,
+    }
+
+
+def test_bulk_submission_acceptance(admin_client: TestClient, db_session, seed_refs):
+    from app.DB import submissions as submission_queries
+
+    event_response = admin_client.post("/events", json=make_create_event_payload(form_type="registration"))
+    assert_2xx(event_response)
+    event_id = event_response.json()["id"]
+    form_id = admin_client.get(f"/events/{event_id}/form").json()["id"]
+    ahmed = submission_queries.create_submission(db_session, form_id, "registration", seed_refs.ahmed.id)
+    sara = submission_queries.create_submission(db_session, form_id, "registration", seed_refs.sara.id)
+    db_session.commit()
+    ahmed_id, sara_id = ahmed.id, sara.id
+
+    response = admin_client.put(
+        "/submissions/accept",
+        json=[
+            {"submission_id": ahmed_id, "is_accepted": True},
+            {"submission_id": sara_id, "is_accepted": True},
+            {"submission_id": 999999, "is_accepted": True},
+            {"submission_id": sara_id, "is_accepted": False},
+        ],
+    )
+    assert_2xx(response)
+    assert response.json() == {"status": "success", "updated": 2, "missing_ids": [999999]}
+    db_session.expire_all()
+    assert submission_queries.get_acceptance_progress(db_session, event_id)["accepted"] == 1
+
+    # ahmed submitted first and is already accepted, so accepting the first two only adds sara
+    response = admin_client.put(f"/submissions/accept/{event_id}/first", json={"count": 2})
+    assert_2xx(response)
+    assert response.json() == {"status": "success", "accepted": 1}
+    assert submission_queries.get_acceptance_progress(db_session, event_id)["accepted"] == 2
+
+
+def test_event_submissions_pages_and_csv_export(admin_client: TestClient, db_session, seed_refs):
+    from app.DB import submissions as submission_queries
+
+    event_response = admin_client.post("/events", json=make_create_event_payload(form_type="google"))
+    assert_2xx(event_response)
+    event_id = event_response.json()["id"]
+    form_id = admin_client.get(f"/events/{event_id}/form").json()["id"]
+    answers = {"q1": {"questionId": "q1", "textAnswers": {"answers": [{"value": "=1+1"}, {"value": "Option 2"}]}}}
+    submission_queries.create_google_submissions(db_session, form_id, {seed_refs.ahmed.id: ("resp-1", answers)})
+    submission_queries.create_submission(db_session, form_id, "partial", seed_refs.sara.id)
+    db_session.commit()
+
+    first = admin_client.get(f"/submissions/event/{event_id}", params={"limit": 1})
+    assert_2xx(first)
+    assert [s["member"]["id"] for s in first.json()] == [seed_refs.ahmed.id]
+    assert first.json()[0]["google_submission_value"] is None
+    second = admin_client.get(
+        f"/submissions/event/{event_id}", params={"limit": 1, "cursor": first.headers["X-Next-Cursor"]}
+    )
+    assert [s["member"]["id"] for s in second.json()] == [seed_refs.sara.id]
+
+    google_only = admin_client.get(
+        f"/submissions/event/{event_id}", params={"submission_type": "google", "include_answers": True}
+    )
+    assert [s["google_submission_value"] for s in google_only.json()] == [answers]
+    assert "X-Next-Cursor" not in google_only.headers
+    assert admin_client.get(f"/submissions/event/{event_id}", params={"cursor": "not-a-cursor"}).status_code == 400
+
+    export = admin_client.get(f"/submissions/event/{event_id}/export.csv")
+    assert_2xx(export)
+    assert export.headers["content-type"].startswith("text/csv")
+    lines = export.text.lstrip("\ufeff").splitlines()
+    # the test form has no Google refresh token, so the question id stands in for its title
+    assert lines[0].endswith(",uni_college,q1")
+    assert len(lines) == 3
+    assert lines[1].endswith(",'=1+1; Option 2")
+
+
 # =============================================================================
 # Data Integrity Violation Tests
 # =============================================================================
@@ -433,3 +433,20 @@ def test_create_member_does_not_fold_already_claimed_email(clerk_client: TestCli
     response = clerk_client.post("/members/")
     assert response.status_code == 409
     assert "email" in response.json()["detail"].lower()
+
+
+def test_email_lookup_ignores_case_and_surrounding_spaces(db_session):
+    """Lookups go through the generated members.email_normalized column, so stored casing or stray spaces on either
+    side don't matter."""
+    from app.DB import members as member_queries
+
+    member = Members(**make_member(email="  Mixed.Case@Example.com "))
+    db_session.add(member)
+    db_session.commit()
+    db_session.refresh(member)
+
+    assert member.email_normalized == "mixed.case@example.com"
+    assert member_queries.get_member_by_email_or_none(db_session, "MIXED.case@example.COM").id == member.id
+    assert member_queries.get_member_ids_by_emails(db_session, [" mixed.case@example.com"]) == {
+        "mixed.case@example.com": member.id
+    }
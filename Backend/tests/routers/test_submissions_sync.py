@@ -41,3 +41,107 @@ def test_extract_email_answer_handles_empty_answers():
     from app.routers.submissions import extract_email_answer
 
     assert extract_email_answer({}) is None
+
+
+def test_response_matcher_lets_the_last_response_of_an_email_win_across_pages():
+    from types import SimpleNamespace
+    from app.routers.submissions import ResponseMatcher
+
+    def response(response_id: str, email: str | None) -> dict:
+        value = email or "not an email"
+        return {"responseId": response_id, "answers": {"q1": {"textAnswers": {"answers": [{"value": value}]}}}}
+
+    matcher = ResponseMatcher({"a@example.com": SimpleNamespace(submission_id=1)})
+    matcher.add_page([response("r1", "a@example.com"), response("r2", "stranger@example.com")])
+    matcher.add_page([response("r3", None), response("r4", "A@example.com")])
+
+    assert {submission_id: response_id for submission_id, (response_id, _) in matcher.matched.items()} == {1: "r4"}
+    assert (matcher.unmatched, matcher.no_email, matcher.unmatched_sample) == (2, 1, ["r2", "r3"])
+
+
+def test_response_matcher_holds_the_cursor_at_the_oldest_recent_unmatched_response():
+    from datetime import datetime
+    from types import SimpleNamespace
+    from app.routers.submissions import ResponseMatcher
+
+    def response(response_id: str, email: str, submitted_at: str) -> dict:
+        answers = {"q1": {"textAnswers": {"answers": [{"value": email}]}}}
+        return {"responseId": response_id, "answers": answers, "lastSubmittedTime": submitted_at}
+
+    matcher = ResponseMatcher({"a@example.com": SimpleNamespace(submission_id=1)}, datetime(2026, 10, 1))
+    matcher.add_page(
+        [
+            response("too-old", "old@example.com", "2026-09-20T08:00:00Z"),
+            response("matched", "a@example.com", "2026-10-02T08:00:00Z"),
+            response("held", "late@example.com", "2026-10-03T08:00:00Z"),
+            response("newer", "later@example.com", "2026-10-04T08:00:00Z"),
+        ]
+    )
+
+    assert matcher.oldest_held_unmatched == datetime(2026, 10, 3, 8)
+
+
+def test_parse_google_timestamp_converts_to_naive_utc():
+    from datetime import datetime
+    from app.routers.submissions import parse_google_timestamp
+
+    assert parse_google_timestamp("2026-10-19T08:30:00.123456789Z") == datetime(2026, 10, 19, 8, 30, 0, 123456)
+    assert parse_google_timestamp("2026-10-19T11:30:00+03:00") == datetime(2026, 10, 19, 8, 30)
+
+
+def test_responses_filter_uses_rfc3339_utc():
+    from datetime import datetime
+    from app.routers.submissions import responses_filter
+
+    assert responses_filter(datetime(2026, 10, 19, 8, 30, 5, 42)) == "timestamp >= 2026-10-19T08:30:05.000042Z"
+
+
+def test_latest_submitted_time_skips_responses_without_timestamp():
+    from datetime import datetime
+    from app.routers.submissions import latest_submitted_time
+
+    responses = [
+        {"responseId": "a", "lastSubmittedTime": "2026-10-19T08:30:00Z"},
+        {"responseId": "b", "lastSubmittedTime": "2026-10-19T09:00:00.5Z"},
+        {"responseId": "c"},
+    ]
+    assert latest_submitted_time(responses) == datetime(2026, 10, 19, 9, 0, 0, 500000)
+    assert latest_submitted_time([]) is None
+
+
+def test_flatten_google_answer_joins_text_and_file_answers():
+    from app.routers.submissions import flatten_google_answer
+
+    assert flatten_google_answer(REAL_FORM_156_RESPONSE_ANSWERS["32cf98a8"]) == "طلاب"
+    checkboxes = {"textAnswers": {"answers": [{"value": "Option 1"}, {"value": "Option 3"}]}}
+    assert flatten_google_answer(checkboxes) == "Option 1; Option 3"
+    assert (
+        flatten_google_answer({"fileUploadAnswers": {"answers": [{"fileId": "f1", "fileName": "cv.pdf"}]}}) == "cv.pdf"
+    )
+    assert flatten_google_answer(None) == ""
+
+
+def test_form_question_titles_follow_form_order_including_grid_rows():
+    from app.routers.submissions import form_question_titles
+
+    schema = {
+        "items": [
+            {"title": "Email", "questionItem": {"question": {"questionId": "128490c7"}}},
+            {"title": "Section header"},
+            {
+                "title": "Availability",
+                "questionGroupItem": {
+                    "questions": [
+                        {"questionId": "a1", "rowQuestion": {"title": "Day 1"}},
+                        {"questionId": "a2", "rowQuestion": {"title": "Day 2"}},
+                    ]
+                },
+            },
+        ]
+    }
+
+    assert form_question_titles(schema) == {
+        "128490c7": "Email",
+        "a1": "Availability - Day 1",
+        "a2": "Availability - Day 2",
+    }
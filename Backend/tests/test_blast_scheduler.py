@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.blast_scheduler import plan_blast_schedule, projected_completion
+from app.DB.schema import EmailLogsFromAddress
+
+CLUB = EmailLogsFromAddress.GDG_QASSIM
+INFO = EmailLogsFromAddress.INFO_KERNELTICS
+NOW = datetime(2026, 10, 19, 12, 0)
+
+
+def test_plan_fills_club_address_first_then_info() -> None:
+    slices = plan_blast_schedule(500, NOW, {CLUB: 400, INFO: 1500}, [], (CLUB, INFO))
+
+    assert [(s.release_at, s.from_address, s.count) for s in slices] == [(NOW, CLUB, 400), (NOW, INFO, 100)]
+
+
+def test_plan_releases_slices_as_earlier_sends_age_out() -> None:
+    recent_sends = [(CLUB, NOW - timedelta(hours=20), 300), (CLUB, NOW - timedelta(hours=2), 100)]
+
+    slices = plan_blast_schedule(650, NOW, {CLUB: 400, INFO: 0}, recent_sends, (CLUB, INFO))
+
+    assert [(s.release_at, s.count) for s in slices] == [
+        (NOW + timedelta(hours=4), 300),
+        (NOW + timedelta(hours=22), 100),
+        (NOW + timedelta(hours=28), 250),
+    ]
+    assert projected_completion(slices, 50, 2) == NOW + timedelta(hours=28, seconds=8)
+
+
+def test_plan_requires_a_sending_address() -> None:
+    with pytest.raises(ValueError):
+        plan_blast_schedule(1, NOW, {CLUB: 0, INFO: 0}, [], (CLUB, INFO))
+    assert plan_blast_schedule(0, NOW, {CLUB: 0, INFO: 0}, [], (CLUB, INFO)) == []
+
+
+def test_plan_merges_single_sends_into_chunk_sized_slices() -> None:
+    # a day of one-at-a-time certificate emails would otherwise free (and plan) one recipient at a time
+    recent_sends = [(CLUB, NOW - timedelta(days=1) + timedelta(seconds=30 * (i + 1)), 1) for i in range(2000)]
+
+    slices = plan_blast_schedule(1000, NOW, {CLUB: 2000, INFO: 0}, recent_sends, (CLUB, INFO), min_slice=50)
+
+    assert sum(s.count for s in slices) == 1000
+    assert len(slices) == 20
+    assert all(s.count == 50 for s in slices)
+    assert slices[-1].release_at == NOW + timedelta(seconds=30 * 1000)
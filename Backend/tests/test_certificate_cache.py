@@ -0,0 +1,88 @@
+import os
+from pathlib import Path
+
+from app.certificate_cache import (
+    CertificateCacheWriter,
+    certificate_cache_key,
+    certificate_cache_path,
+    sweep_certificate_cache,
+    touch_certificate,
+)
+
+
+def test_certificate_cache_key_ignores_field_order() -> None:
+    a = {"language": "ar", "format": "pdf", "member": {"name": "Ahmed", "email": "a@example.com"}}
+    b = {"member": {"email": "a@example.com", "name": "Ahmed"}, "format": "pdf", "language": "ar"}
+
+    assert certificate_cache_key(a) == certificate_cache_key(b)
+    assert certificate_cache_key(a) != certificate_cache_key({**a, "format": "png"})
+
+
+def test_certificate_cache_writer_only_publishes_on_commit(tmp_path: Path) -> None:
+    key = certificate_cache_key({"event": "e"})
+    path = certificate_cache_path(key, "pdf", root=str(tmp_path))
+
+    abandoned = CertificateCacheWriter(path)
+    abandoned.write(b"partial")
+    abandoned.discard()
+    assert not path.exists()
+    assert list(path.parent.iterdir()) == []
+
+    writer = CertificateCacheWriter(path)
+    writer.write(b"%PDF-")
+    writer.write(b"1.7")
+    writer.commit()
+    writer.discard()
+    assert path.read_bytes() == b"%PDF-1.7"
+
+
+def test_certificate_cache_sweep_evicts_expired_then_least_recently_used(tmp_path: Path) -> None:
+    now = 1_000_000.0  # well before the real clock, so the touched hit reads as the newest
+
+    def cached(name: str, size: int, age: float) -> Path:
+        path = certificate_cache_path(certificate_cache_key({"event": name}), "pdf", root=str(tmp_path))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * size)
+        os.utime(path, (now - age, now - age))
+        return path
+
+    expired = cached("expired", 10, age=100)
+    oldest = cached("oldest", 10, age=30)
+    hit = cached("hit", 10, age=20)
+    newest = cached("newest", 10, age=10)
+    in_flight = tmp_path / "ab" / "upload.part"
+    in_flight.parent.mkdir(exist_ok=True)
+    in_flight.write_bytes(b"x" * 100)
+    os.utime(in_flight, (now - 5, now - 5))
+
+    # a hit makes "hit" the most recently used, so "newest" goes before it
+    touch_certificate(hit)
+
+    removed = sweep_certificate_cache(tmp_path, max_bytes=15, max_age_seconds=60, now=now)
+
+    assert removed == 3
+    assert not expired.exists()
+    assert not oldest.exists()
+    assert not newest.exists()
+    assert hit.exists()
+    assert in_flight.exists()
+
+
+def test_content_encoded_certificate_is_still_cached(tmp_path: Path) -> None:
+    import asyncio
+    import gzip
+
+    import httpx
+
+    from app.routers.emails import stream_certificate_into_cache
+
+    body = b"%PDF-1.7 " * 1000
+    wire = gzip.compress(body)
+    upstream = httpx.Response(200, headers={"content-encoding": "gzip", "content-length": str(len(wire))}, content=wire)
+    path = certificate_cache_path(certificate_cache_key({"event": "gzip"}), "pdf", root=str(tmp_path))
+
+    async def drain() -> bytes:
+        return b"".join([chunk async for chunk in stream_certificate_into_cache(upstream, path)])
+
+    assert asyncio.run(drain()) == body
+    assert path.read_bytes() == body
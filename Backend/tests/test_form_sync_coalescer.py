@@ -0,0 +1,100 @@
+import asyncio
+import threading
+
+from app.form_sync_coalescer import FormSyncCoalescer
+
+
+def test_burst_of_notifications_runs_one_sync() -> None:
+    synced: list[str] = []
+
+    async def scenario() -> list[str]:
+        coalescer = FormSyncCoalescer(debounce_seconds=0.01, message_ttl_seconds=60)
+        results = [coalescer.submit("form-a", f"m{i}", synced.append) for i in range(5)]
+        await asyncio.sleep(0.1)
+        assert coalescer.stats()["syncs_pending"] == 0
+        assert coalescer.counters.coalesced == 4
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert results == ["scheduled"] + ["coalesced"] * 4
+    assert synced == ["form-a"]
+
+
+def test_notification_during_a_running_sync_queues_exactly_one_more() -> None:
+    release = threading.Event()
+    synced: list[str] = []
+
+    def slow_sync(form_id: str) -> None:
+        release.wait(1)
+        synced.append(form_id)
+
+    async def scenario() -> list[str]:
+        coalescer = FormSyncCoalescer(debounce_seconds=0.01, message_ttl_seconds=60)
+        results = [coalescer.submit("form-a", "m1", slow_sync)]
+        await asyncio.sleep(0.05)
+        assert coalescer.stats()["syncs_in_flight"] == 1
+        results += [coalescer.submit("form-a", "m2", slow_sync), coalescer.submit("form-a", "m3", slow_sync)]
+        release.set()
+        await asyncio.sleep(0.1)
+        return results
+
+    assert asyncio.run(scenario()) == ["scheduled", "queued", "coalesced"]
+    assert synced == ["form-a", "form-a"]
+
+
+def test_redelivered_message_is_dropped() -> None:
+    async def scenario() -> tuple[list[str], dict]:
+        coalescer = FormSyncCoalescer(debounce_seconds=0.01, message_ttl_seconds=60)
+        results = [coalescer.submit("form-a", "m1", lambda _: None) for _ in range(2)]
+        results.append(coalescer.submit("form-b", "m1", lambda _: None))
+        await asyncio.sleep(0.05)
+        return results, coalescer.stats()
+
+    results, stats = asyncio.run(scenario())
+
+    assert results == ["scheduled", "duplicate", "duplicate"]
+    assert stats["dropped_duplicates"] == 2
+    assert stats["syncs_started"] == 1
+
+
+def test_failed_sync_is_counted_and_frees_the_form() -> None:
+    def failing_sync(form_id: str) -> None:
+        raise RuntimeError("Google is down")
+
+    async def scenario() -> tuple[str, dict]:
+        coalescer = FormSyncCoalescer(debounce_seconds=0.01, message_ttl_seconds=60)
+        coalescer.submit("form-a", "m1", failing_sync)
+        await asyncio.sleep(0.05)
+        return coalescer.submit("form-a", "m2", failing_sync), coalescer.stats()
+
+    result, stats = asyncio.run(scenario())
+
+    assert result == "scheduled"
+    assert stats["syncs_failed"] == 1
+
+
+def test_syncs_across_forms_are_bounded_by_max_concurrent() -> None:
+    lock = threading.Lock()
+    running = peak = 0
+
+    def sync(form_id: str) -> None:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        threading.Event().wait(0.05)
+        with lock:
+            running -= 1
+
+    async def scenario() -> FormSyncCoalescer:
+        coalescer = FormSyncCoalescer(debounce_seconds=0.01, message_ttl_seconds=60, max_concurrent=2)
+        for i in range(5):
+            coalescer.submit(f"form-{i}", None, sync)
+        await asyncio.sleep(0.3)
+        return coalescer
+
+    coalescer = asyncio.run(scenario())
+
+    assert peak == 2
+    assert sorted(coalescer.last_synced_at) == [f"form-{i}" for i in range(5)]
@@ -0,0 +1,67 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from app.form_sync_coalescer import FormSyncCoalescer
+from app.form_sync_reconciler import FormSyncReconciler
+
+
+def test_round_syncs_every_listed_form_and_reports_lag() -> None:
+    synced: list[str] = []
+    cursor = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=10)
+
+    def list_forms() -> list[tuple[str, datetime | None]]:
+        return [("form-a", cursor), ("form-b", None)]
+
+    def sync(form_id: str) -> None:
+        if form_id == "form-b":
+            raise RuntimeError("Google is down")
+        synced.append(form_id)
+
+    async def scenario() -> tuple[int, dict]:
+        coalescer = FormSyncCoalescer(debounce_seconds=0.01, message_ttl_seconds=60, max_concurrent=1)
+        reconciler = FormSyncReconciler(coalescer, interval_seconds=60, jitter_seconds=5)
+        submitted = await reconciler.reconcile_once(list_forms, sync)
+        await asyncio.sleep(0.1)
+        return submitted, reconciler.stats()
+
+    submitted, stats = asyncio.run(scenario())
+
+    assert submitted == 2
+    assert synced == ["form-a"]
+    assert stats["rounds"] == 1
+    assert stats["forms"]["form-a"]["synced_until"] == cursor.isoformat()
+    # lag is time since the last successful sync, not since the newest response
+    assert 0 <= stats["forms"]["form-a"]["lag_seconds"] < 1
+    assert 600 <= stats["forms"]["form-a"]["cursor_age_seconds"] < 601
+    # never synced successfully and no cursor yet
+    assert stats["forms"]["form-b"] == {"lag_seconds": None, "synced_until": None, "cursor_age_seconds": None}
+
+
+def test_interval_is_jittered_within_bounds() -> None:
+    reconciler = FormSyncReconciler(FormSyncCoalescer(0, 60), interval_seconds=60, jitter_seconds=5)
+
+    delays = [reconciler.next_delay() for _ in range(200)]
+
+    assert all(55 <= delay <= 65 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_first_and_every_nth_round_mark_forms_for_a_full_sync() -> None:
+    full_rounds: list[int] = []
+
+    async def scenario() -> None:
+        coalescer = FormSyncCoalescer(debounce_seconds=0, message_ttl_seconds=60)
+        reconciler = FormSyncReconciler(coalescer, interval_seconds=60, jitter_seconds=0, full_every=3)
+
+        def sync(form_id: str) -> None:
+            if reconciler.take_full_sync(form_id):
+                full_rounds.append(reconciler.rounds)
+
+        for _ in range(7):
+            await reconciler.reconcile_once(lambda: [("form-a", None)], sync)
+            await asyncio.sleep(0.05)
+
+    asyncio.run(scenario())
+
+    # rounds are counted once submitted, so round 1 is the first
+    assert full_rounds == [1, 4, 7]
@@ -0,0 +1,171 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from urllib.parse import parse_qs, urlparse
+
+import httplib2
+import pytest
+from google.auth.exceptions import RefreshError
+
+from app.google_forms import GoogleFormsClients
+
+
+class FakeTokenEndpoint:
+    """Local stand-in for Google's OAuth token endpoint that counts refreshes."""
+
+    def __init__(self, expires_in: int = 3600, status: int = 200):
+        self.expires_in = expires_in
+        self.status = status
+        self.refreshes = 0
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                endpoint.refreshes += 1
+                if endpoint.status == 200:
+                    body = {"access_token": f"token-{endpoint.refreshes}", "expires_in": endpoint.expires_in}
+                else:
+                    body = {"error": "invalid_grant", "error_description": "Token has been revoked."}
+                payload = json.dumps(body).encode()
+                self.send_response(endpoint.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.uri = f"http://127.0.0.1:{self._server.server_port}/token"
+        Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def token_endpoint():
+    endpoint = FakeTokenEndpoint()
+    yield endpoint
+    endpoint.close()
+
+
+def test_access_token_is_reused_until_expiry(token_endpoint: FakeTokenEndpoint) -> None:
+    clients = GoogleFormsClients(token_uri=token_endpoint.uri)
+
+    first = clients.credentials("refresh-a")
+    second = clients.credentials("refresh-a")
+
+    assert first is second
+    assert first.token == "token-1"
+    assert token_endpoint.refreshes == 1
+
+
+def test_each_refresh_token_has_its_own_credentials(token_endpoint: FakeTokenEndpoint) -> None:
+    clients = GoogleFormsClients(token_uri=token_endpoint.uri)
+
+    assert clients.credentials("refresh-a").token != clients.credentials("refresh-b").token
+    assert token_endpoint.refreshes == 2
+
+
+def test_expiring_access_token_is_refreshed(token_endpoint: FakeTokenEndpoint) -> None:
+    # google-auth treats tokens inside its refresh threshold as expired
+    token_endpoint.expires_in = 60
+    clients = GoogleFormsClients(token_uri=token_endpoint.uri)
+
+    clients.credentials("refresh-a")
+    assert clients.credentials("refresh-a").token == "token-2"
+
+
+def test_failed_refresh_is_not_cached(token_endpoint: FakeTokenEndpoint) -> None:
+    token_endpoint.status = 400
+    clients = GoogleFormsClients(token_uri=token_endpoint.uri)
+
+    with pytest.raises(RefreshError):
+        clients.credentials("revoked")
+
+    token_endpoint.status = 200
+    assert clients.credentials("revoked").token == "token-2"
+
+
+def test_forms_service_parses_the_discovery_document_once(token_endpoint: FakeTokenEndpoint) -> None:
+    clients = GoogleFormsClients(token_uri=token_endpoint.uri)
+
+    first = clients.forms_service("refresh-a")
+    document = clients._discovery_doc
+    second = clients.forms_service("refresh-a")
+
+    assert clients._discovery_doc is document
+    assert first is not second
+    assert hasattr(second.forms(), "responses")
+    assert token_endpoint.refreshes == 1
+
+
+class FakeFormsApi:
+    """Local stand-in for ``forms.responses.list`` serving ``responses`` in pages of ``page_size``."""
+
+    def __init__(self, responses: list[dict], page_size: int):
+        self.requests: list[dict] = []
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+                api.requests.append(query)
+                start = int(query.get("pageToken", 0))
+                body = {"responses": responses[start : start + page_size]}
+                if start + page_size < len(responses):
+                    body["nextPageToken"] = str(start + page_size)
+                payload = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.uri = f"http://127.0.0.1:{self._server.server_port}/"
+        Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def service(self):
+        from googleapiclient.discovery import build_from_document
+        from googleapiclient.discovery_cache import get_static_doc
+
+        return build_from_document(
+            get_static_doc("forms", "v1"), http=httplib2.Http(), client_options={"api_endpoint": self.uri}
+        )
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def test_response_stream_fetches_pages_lazily() -> None:
+    from datetime import datetime
+    from app.routers.submissions import FormResponseStream
+
+    responses = [
+        {"responseId": f"r{i}", "lastSubmittedTime": f"2026-10-19T08:00:0{i}Z", "answers": {}} for i in range(5)
+    ]
+    api = FakeFormsApi(responses, page_size=2)
+    try:
+        stream = FormResponseStream(1, "form-1", api.service(), since=datetime(2026, 10, 19, 7, 0))
+
+        pages = stream.pages()
+        assert [r["responseId"] for r in next(pages)] == ["r0", "r1"]
+        assert len(api.requests) == 1
+        assert api.requests[0]["filter"] == "timestamp >= 2026-10-19T07:00:00.000000Z"
+
+        assert [r["responseId"] for page in pages for r in page] == ["r2", "r3", "r4"]
+        assert [request.get("pageToken") for request in api.requests] == [None, "2", "4"]
+        assert (stream.total, stream.pages_fetched) == (5, 3)
+        assert stream.synced_until == datetime(2026, 10, 19, 8, 0, 4)
+        assert [r["responseId"] for r in stream.sample] == ["r0", "r1", "r2"]
+    finally:
+        api.close()
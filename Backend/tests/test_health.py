@@ -25,3 +25,35 @@ def test_database_connection(engine):
     with engine.connect() as conn:
         result = conn.execute(text("SELECT 1"))
         assert result.scalar() == 1
+
+
+def test_http_client_metrics(client: TestClient):
+    """Test that outbound HTTP client metrics are exposed per upstream."""
+    response = client.get("/health/http")
+    assert response.status_code == 200
+    assert set(response.json()["upstreams"]) == {"certificate_api", "file_storage", "member_app"}
+
+
+def test_instrumented_transport_records_latency_and_errors():
+    """Test that the instrumented transport counts responses by status class and transport failures as errors."""
+    import httpx
+    import pytest
+    from app.http_clients import InstrumentedTransport, UpstreamMetrics
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/down":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200 if request.url.path == "/ok" else 502)
+
+    metrics = UpstreamMetrics()
+    with httpx.Client(transport=InstrumentedTransport(httpx.MockTransport(handler), metrics)) as http:
+        http.get("http://upstream/ok")
+        http.get("http://upstream/bad")
+        with pytest.raises(httpx.ConnectError):
+            http.get("http://upstream/down")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["requests"] == 3
+    assert snapshot["transport_errors"] == 1
+    assert snapshot["status_classes"] == {"2xx": 1, "5xx": 1}
+    assert snapshot["latency_histogram_ms"]["le_inf"] == 3
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from app.template_engine import CompiledTemplate, StoredTemplateCache, compile_email
+
+
+def test_compiled_template_renders_known_placeholders_only() -> None:
+    template = CompiledTemplate("Hi [Name], [Event Name]: [Points] pts, rank [Rank] ([Unknown])")
+
+    assert template.variables == {"Name", "Event Name", "Points", "Rank"}
+    rendered = template.render({"Name": "Sara", "Event Name": "DevFest", "Points": "40", "Rank": "3"})
+    assert rendered == "Hi Sara, DevFest: 40 pts, rank 3 ([Unknown])"
+    assert CompiledTemplate("no placeholders").render({}) == "no placeholders"
+
+
+def test_compiled_email_reports_member_stats_usage() -> None:
+    assert not compile_email("[Event Name]", "<p>[Name]</p>").needs_member_stats
+    assert compile_email("[Event Name]", "<p>[Attendance Days]</p>").needs_member_stats
+
+
+def test_stored_template_cache_recompiles_on_update() -> None:
+    cache = StoredTemplateCache()
+    loads = []
+
+    def load(subject: str):
+        def _load():
+            loads.append(subject)
+            return subject, "<p>[Name]</p>"
+
+        return _load
+
+    first = datetime(2026, 1, 1)
+    assert cache.get_or_compile(1, first, load("v1")).subject.text == "v1"
+    assert cache.get_or_compile(1, first, load("ignored")).subject.text == "v1"
+    assert cache.get_or_compile(1, datetime(2026, 1, 2), load("v2")).subject.text == "v2"
+    assert loads == ["v1", "v2"]
@@ -424,8 +424,10 @@ export function SendCustomEmailDialog({
           <DialogTitle>Send Custom Email</DialogTitle>
           <DialogDescription>
             Compose a personalized email for hand-picked recipients. Use{" "}
-            <code className="text-xs">[Name]</code> and <code className="text-xs">[Event Name]</code>{" "}
-            in the subject or body to personalize each recipient&apos;s email.
+            <code className="text-xs">[Name]</code>, <code className="text-xs">[Event Name]</code>,{" "}
+            <code className="text-xs">[Points]</code>, <code className="text-xs">[Rank]</code> and{" "}
+            <code className="text-xs">[Attendance Days]</code> in the subject or body to personalize each
+            recipient&apos;s email.
           </DialogDescription>
         </DialogHeader>
 
@@ -88,7 +88,7 @@ import { useEventContext } from "@/contexts/event-context";
 export default function EventResponsesPage() {
   const { event, refetch } = useEventContext();
   const { getToken } = useAuth();
-  const { data: submissions, isLoading: submissionsLoading, error, refetch: refetchSubmissions } = useSubmissions(event?.id ?? 0, getToken);
+  const { data: submissions, isLoading: submissionsLoading, error, refetch: refetchSubmissions } = useSubmissions(event?.id ?? 0, getToken, { includeAnswers: true });
   const { data: formData, isLoading: formDataLoading } = useFormData(event?.id ?? 0);
   const { data: formSchema, isLoading: formSchemaLoading } = useFormSchema(formData?.googleFormId || null);
   const acceptSubmissionsMutation = useAcceptSubmissions(getToken);
@@ -369,12 +369,14 @@ export default function EventResponsesPage() {
 
   const handleSendAcceptance = async (subject: string, htmlContent: string) => {
     try {
-      await sendAcceptanceMutation.mutateAsync({
+      const result = await sendAcceptanceMutation.mutateAsync({
         eventId: event.id,
         subject,
         htmlContent,
       });
-      toast.success(`Acceptance emails sent to ${acceptedNotInvited} recipient${acceptedNotInvited !== 1 ? "s" : ""}`);
+      toast.success(
+        `Acceptance emails queued for ${result.queued_count} recipient${result.queued_count !== 1 ? "s" : ""}`
+      );
       setSendAcceptanceDialogOpen(false);
     } catch (error) {
       console.error("Failed to send acceptance emails:", error);
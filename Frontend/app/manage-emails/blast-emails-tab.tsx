@@ -299,7 +299,8 @@ export function BlastEmailsTab({ onGoToLogs }: { onGoToLogs: () => void }) {
   const isBusy = sendMutation.isPending || testMutation.isPending;
 
   const sliderMax = Math.max(eligibleCount, 1);
-  const recipientCap = Math.min(eligibleCount, remainingCapacity);
+  // counts past today's capacity are accepted; the backend schedules the overflow across the following days
+  const recipientCap = eligibleCount;
   const showCapMarker = eligibleCount > remainingCapacity;
   const capMarkerPercent = (Math.min(remainingCapacity, sliderMax) / sliderMax) * 100;
   const clampCount = (value: number) => Math.max(0, Math.min(recipientCap, value));
@@ -693,7 +694,7 @@ export function BlastEmailsTab({ onGoToLogs }: { onGoToLogs: () => void }) {
                   <div
                     className="pointer-events-none absolute top-0 h-full w-0.5 bg-destructive/70"
                     style={{ left: `${capMarkerPercent}%` }}
-                    title={`Capped at ${remainingCapacity} — today's remaining email send capacity`}
+                    title={`${remainingCapacity} can go out today — the rest is scheduled as send capacity frees up`}
                   />
                 )}
               </div>
@@ -921,6 +922,19 @@ export function BlastEmailsTab({ onGoToLogs }: { onGoToLogs: () => void }) {
               {sentResult.algorithmic_count} selected by ordering + {sentResult.guaranteed_count} guaranteed. Sending
               in the background — a log entry will appear in Email Logs once it completes (one per email address
               used, if it had to split across both).
+              {sentResult.projected_completion_at && (
+                <>
+                  {" "}
+                  Projected completion:{" "}
+                  {new Date(sentResult.projected_completion_at).toLocaleString("en-US", {
+                    month: "short",
+                    day: "numeric",
+                    hour: "numeric",
+                    minute: "2-digit",
+                  })}
+                  .
+                </>
+              )}
             </p>
             <Button type="button" variant="outline" size="sm" className="h-7 text-xs gap-1.5" onClick={onGoToLogs}>
               <Mail className="h-3.5 w-3.5" />
@@ -24,9 +24,52 @@ import type { AcceptanceData, BlastData, CertificateData } from "./types";
 interface EmailLogRowProps {
   log: EnrichedEmailLog;
   onViewHtml: (html: string, subject: string) => void;
+  onLoadDetails?: (log: EnrichedEmailLog) => Promise<void>;
   isNew?: boolean;
 }
 
+// Newer logs store the HTML body by hash and recipients as member ids; the full payload is fetched on demand.
+function hasCompactData(log: EnrichedEmailLog): boolean {
+  if (!log.data) return false;
+  const compactHtml = "html_hash" in log.data && !("html_content" in log.data);
+  const compactRecipients =
+    "recipient_member_ids" in log.data && !("recipients" in log.data) && !("member" in log.data);
+  return compactHtml || compactRecipients;
+}
+
+function LoadDetailsButton({
+  log,
+  onLoadDetails,
+}: {
+  log: EnrichedEmailLog;
+  onLoadDetails: EmailLogRowProps["onLoadDetails"];
+}) {
+  const [loading, setLoading] = React.useState(false);
+  if (!onLoadDetails) return null;
+
+  return (
+    <div className="px-3 pb-2 pl-10">
+      <Button
+        variant="ghost"
+        size="sm"
+        className="h-5 px-1.5 text-[10px]"
+        disabled={loading}
+        onClick={async () => {
+          setLoading(true);
+          try {
+            await onLoadDetails(log);
+          } finally {
+            setLoading(false);
+          }
+        }}
+      >
+        <Eye className="h-3 w-3 mr-0.5" />
+        {loading ? "Loading..." : "Load details"}
+      </Button>
+    </div>
+  );
+}
+
 function getSnapshotData(log: EnrichedEmailLog): CertificateData | null {
   if (!log.data) return null;
   if (log.email_type === "event-certificate" || log.email_type === "manual-certificate") {
@@ -553,7 +596,7 @@ function DefaultRow({ log }: EmailLogRowProps) {
   );
 }
 
-export function EmailLogRow({ log, onViewHtml, isNew }: EmailLogRowProps) {
+export function EmailLogRow({ log, onViewHtml, onLoadDetails, isNew }: EmailLogRowProps) {
   const inner = (() => {
     switch (log.email_type) {
       case "event-certificate":
@@ -576,6 +619,7 @@ export function EmailLogRow({ log, onViewHtml, isNew }: EmailLogRowProps) {
       }`}
     >
       {inner}
+      {hasCompactData(log) && <LoadDetailsButton log={log} onLoadDetails={onLoadDetails} />}
     </div>
   );
 }
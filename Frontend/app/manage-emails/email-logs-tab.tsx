@@ -7,7 +7,7 @@ import { useAuth } from "@clerk/nextjs";
 import { Badge } from "@/components/ui/badge";
 import { Button } from "@/components/ui/button";
 import { ScrollArea } from "@/components/ui/scroll-area";
-import { buildEnrichedStreamUrl, getEmailLogsEnriched } from "@/lib/api";
+import { buildEnrichedStreamUrl, getEmailLogDetails, getEmailLogsEnriched } from "@/lib/api";
 import { parseSSEStream } from "@/lib/sse";
 import type { EnrichedEmailLog } from "@/lib/api-types";
 
@@ -148,6 +148,13 @@ export function EmailLogsTab({ onLogsLoaded }: EmailLogsTabProps) {
     setHtmlPreview({ open: true, html, subject });
   };
 
+  const handleLoadDetails = async (log: EnrichedEmailLog) => {
+    const result = await getEmailLogDetails(log.id, getToken);
+    if (result.success) {
+      setLogs((prev) => prev.map((l) => (l.id === log.id ? result.data : l)));
+    }
+  };
+
   const hasActiveFilters = !!(filters.email_type || filters.event_id || filters.member_id);
 
   const clearAllFilters = () => {
@@ -214,7 +221,13 @@ export function EmailLogsTab({ onLogsLoaded }: EmailLogsTabProps) {
           ) : (
             <div className="divide-y">
               {logs.map((log) => (
-                <EmailLogRow key={log.id} log={log} onViewHtml={handleViewHtml} isNew={newIds.has(log.id)} />
+                <EmailLogRow
+                  key={log.id}
+                  log={log}
+                  onViewHtml={handleViewHtml}
+                  onLoadDetails={handleLoadDetails}
+                  isNew={newIds.has(log.id)}
+                />
               ))}
             </div>
           )}
@@ -5,18 +5,21 @@ import type { Submission, AcceptSubmissionPayload } from "@/lib/api-types";
 // Query keys
 export const submissionKeys = {
   all: ["submissions"] as const,
-  byEvent: (eventId: number) => [...submissionKeys.all, "event", eventId] as const,
+  byEvent: (eventId: number, includeAnswers = false) =>
+    [...submissionKeys.all, "event", eventId, { includeAnswers }] as const,
 };
 
 // Hooks
 export function useSubmissions(
   eventId: number,
-  getToken?: () => Promise<string | null>
+  getToken?: () => Promise<string | null>,
+  options: { includeAnswers?: boolean } = {}
 ) {
+  const includeAnswers = options.includeAnswers ?? false;
   return useQuery({
-    queryKey: submissionKeys.byEvent(eventId),
+    queryKey: submissionKeys.byEvent(eventId, includeAnswers),
     queryFn: async (): Promise<Submission[]> => {
-      const result = await getSubmissions(eventId, getToken);
+      const result = await getSubmissions(eventId, getToken, { includeAnswers });
       if (!result.success) {
         throw new Error(result.error.message);
       }
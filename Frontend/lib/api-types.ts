@@ -172,7 +172,8 @@ export interface Submission {
   submission_type: SubmissionType;
   is_accepted: boolean;
   is_invited: boolean;
-  google_submission_value: string;
+  // null unless the listing was asked to include answers
+  google_submission_value: string | null;
   event_id: number;
   form_id: number;
   google_form_id: string;
@@ -183,6 +184,12 @@ export interface AcceptSubmissionPayload {
   is_accepted: boolean;
 }
 
+export interface AcceptSubmissionsResponse {
+  status: string;
+  updated: number;
+  missing_ids: number[];
+}
+
 // =============================================================================
 // Actions and Departments
 // =============================================================================
@@ -480,8 +487,8 @@ export interface BackfillResponse {
 // =============================================================================
 
 export interface AcceptanceBlastResponse {
-  sent_count: number;
-  emails: string[];
+  message: string;
+  queued_count: number;
 }
 
 export interface TestAcceptanceBlastResponse {
@@ -553,6 +560,7 @@ export interface BlastSendResponse {
   recipient_count: number;
   guaranteed_count: number;
   algorithmic_count: number;
+  projected_completion_at: string | null;
 }
 
 export interface BlastTestRequest {
@@ -13,6 +13,7 @@ import type {
   UpdateFormPayload,
   Submission,
   AcceptSubmissionPayload,
+  AcceptSubmissionsResponse,
   ActionsResponse,
   Action,
   ActionWithUsage,
@@ -87,7 +88,8 @@ type GetTokenFn = () => Promise<string | null>;
 async function apiFetch<T>(
   endpoint: string,
   options: RequestInit = {},
-  getToken?: GetTokenFn
+  getToken?: GetTokenFn,
+  onResponse?: (response: Response) => void
 ): Promise<ApiResponse<T>> {
   try {
     const url = `${API_BASE_URL}${endpoint}`;
@@ -148,6 +150,7 @@ async function apiFetch<T>(
       };
     }
 
+    onResponse?.(response);
     const data = await response.json();
     return { success: true, data };
   } catch (error) {
@@ -593,18 +596,43 @@ export async function updateForm(
 // Submissions API
 // =============================================================================
 
+const SUBMISSIONS_PAGE_SIZE = 500;
+
+// Every submission of the event, read page by page by following the X-Next-Cursor header. Google answers are only
+// sent when `includeAnswers` is set.
 export async function getSubmissions(
   eventId: number,
-  getToken?: GetTokenFn
+  getToken?: GetTokenFn,
+  options: { includeAnswers?: boolean } = {}
 ): Promise<ApiResponse<Submission[]>> {
-  return apiFetch<Submission[]>(`/events/submissions/${eventId}`, {}, getToken);
+  const submissions: Submission[] = [];
+  let cursor: string | null = null;
+  do {
+    const params = new URLSearchParams({ limit: String(SUBMISSIONS_PAGE_SIZE) });
+    if (options.includeAnswers) params.append("include_answers", "true");
+    if (cursor) params.append("cursor", cursor);
+
+    const next: { cursor: string | null } = { cursor: null };
+    const page: ApiResponse<Submission[]> = await apiFetch<Submission[]>(
+      `/submissions/event/${eventId}?${params.toString()}`,
+      {},
+      getToken,
+      (response) => {
+        next.cursor = response.headers.get("X-Next-Cursor");
+      }
+    );
+    if (!page.success) return page;
+    submissions.push(...page.data);
+    cursor = next.cursor;
+  } while (cursor);
+  return { success: true, data: submissions };
 }
 
 export async function acceptSubmissions(
   payload: AcceptSubmissionPayload[],
   getToken?: GetTokenFn
-): Promise<ApiResponse<void>> {
-  return apiFetch<void>("/submissions/accept", {
+): Promise<ApiResponse<AcceptSubmissionsResponse>> {
+  return apiFetch<AcceptSubmissionsResponse>("/submissions/accept", {
     method: "PUT",
     body: JSON.stringify(payload),
   }, getToken);
@@ -1061,6 +1089,13 @@ export async function getEmailLogsEnriched(
   return apiFetch<EnrichedEmailLog[]>(`/emails/logs/enriched${query}`, {}, getToken);
 }
 
+export async function getEmailLogDetails(
+  logId: number,
+  getToken?: GetTokenFn
+): Promise<ApiResponse<EnrichedEmailLog>> {
+  return apiFetch<EnrichedEmailLog>(`/emails/logs/${logId}/details`, {}, getToken);
+}
+
 export function buildEnrichedStreamUrl(filters: EmailLogFilters): string {
   const params = new URLSearchParams();
   if (filters.email_type) params.append("email_type", filters.email_type);